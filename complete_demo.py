@@ -61,7 +61,7 @@ def demo_game_setup():
     for i, player in enumerate(game_state.players):
         for j in range(5):
             if j < len(gua_deck):
-                player.hand.append(gua_deck[j + i*5])
+                player.hand += (gua_deck[j + i*5],)
         player.qi = 10
         player.cheng_yi = 5
         player.dao_xing = 3
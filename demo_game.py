@@ -62,25 +62,25 @@ def demo_two_player_game():
             valid_actions = actions.get_valid_actions(game_state, player, ap, mods, **flags)
             
             print("可用动作:")
-            for action_id, action_data in valid_actions.items():
+            for action_id, action_data in enumerate(valid_actions, 1):
                 print(f"  {action_id}: {action_data['description']} (消耗: {action_data['cost']} AP)")
             
             # 自动选择一个动作进行演示
             if len(valid_actions) > 1:  # 如果有除了pass之外的动作
                 # 优先选择打牌动作
-                play_actions = [aid for aid, data in valid_actions.items() 
+                play_actions = [aid for aid, data in enumerate(valid_actions, 1) 
                               if "Play" in data.get('description', '')]
                 if play_actions:
                     chosen_action = play_actions[0]
                 else:
                     # 选择冥想或学习
-                    other_actions = [aid for aid, data in valid_actions.items() 
+                    other_actions = [aid for aid, data in enumerate(valid_actions, 1) 
                                    if aid != 1]  # 排除pass
                     chosen_action = other_actions[0] if other_actions else 1
             else:
                 chosen_action = 1  # pass
             
-            action_data = valid_actions[chosen_action]
+            action_data = valid_actions[chosen_action - 1]
             print(f"\n选择动作: {action_data['description']}")
             
             # 执行动作
@@ -1,7 +1,6 @@
 import random
-import copy
-from typing import Dict, Any, Optional
-from game_state import GameState, Zone, Player, AvatarName, BonusType, Modifiers
+from typing import Dict, Any, List, Optional
+from game_state import GameState, Zone, Player, AvatarName, BonusType, Modifiers, find_zone_leader
 from card_base import GuaCard, YaoCiTask
 from game_data import GAME_DECK, GENERIC_YAO_CI_POOL
 from yijing_actions import (
@@ -19,33 +18,38 @@ def check_zone_control(gs: GameState, zone_name: str): # This function mutates s
     markers = zone_data["markers"]
     
     if not markers:
-        zone_data["controller"] = None
+        gs.board.set_zone_controller(zone_name, None)
         return
     
-    # Find player with most influence
-    max_influence = max(markers.values())
-    players_with_max = [player for player, influence in markers.items() if influence == max_influence]
-    
+    # Rescan the markers in case they were edited directly, then apply control.
+    # Zone records may be shared with clones, so install a new record.
+    leader, leader_count = find_zone_leader(markers)
+    zone_data = {**zone_data, "leader": leader, "leader_count": leader_count}
+    gs.board.gua_zones[zone_name] = zone_data
+    _apply_zone_leader(gs, zone_name, zone_data)
+
+def _apply_zone_leader(gs: GameState, zone_name: str, zone_data: dict):
+    """Set the controller from the zone's tracked leader."""
     # Check if control threshold is met (simplified: need more than half of base limit)
-    control_threshold = gs.board.base_limit // 2 + 1
-    
-    if len(players_with_max) == 1 and max_influence >= control_threshold:
-        zone_data["controller"] = players_with_max[0]
+    if zone_data["leader"] is not None and zone_data["leader_count"] >= gs.board.control_threshold:
+        controller = zone_data["leader"]
     else:
-        zone_data["controller"] = None
+        controller = None
+    if controller != zone_data["controller"]:
+        gs.board.set_zone_controller(zone_name, controller)
 
 def play_card(game_state: GameState, card_index: int, zone_choice: str, mods: Modifiers) -> Optional[GameState]:
-    new_state = copy.deepcopy(game_state)
+    new_state = game_state.clone()
     player = new_state.get_current_player()
     if not (0 <= card_index < len(player.hand)): return None
-    card_to_play = player.hand.pop(card_index)
+    card_to_play = player.hand[card_index]
+    player.hand = player.hand[:card_index] + player.hand[card_index + 1:]
     if zone_choice not in card_to_play.associated_guas: return None
     player.current_task_card = card_to_play
     influence_to_place = 1 + mods.extra_influence
-    zone_markers = new_state.board.gua_zones[zone_choice]["markers"]
-    zone_markers[player.name] = zone_markers.get(player.name, 0) + influence_to_place
+    zone_data = new_state.board.update_zone_markers(zone_choice, player.name, influence_to_place)
     player.placed_influence_this_turn = True
-    check_zone_control(new_state, zone_choice)
+    _apply_zone_leader(new_state, zone_choice, zone_data)
     
     # Update achievement tracking
     card_rarity = getattr(card_to_play, 'rarity', 'common')  # Default to common if no rarity
@@ -54,7 +58,7 @@ def play_card(game_state: GameState, card_index: int, zone_choice: str, mods: Mo
     return new_state
 
 def move(game_state: GameState, target_zone_str: str, mods: Modifiers) -> Optional[GameState]:
-    new_state = copy.deepcopy(game_state)
+    new_state = game_state.clone()
     player = new_state.get_current_player()
     
     # Convert string to Zone enum
@@ -71,13 +75,13 @@ def move(game_state: GameState, target_zone_str: str, mods: Modifiers) -> Option
     # Move player
     player.position = target_zone
     player.qi -= qi_cost
-    new_state.board.player_positions[player.name] = target_zone
+    new_state.board.set_player_position(player.name, target_zone)
     
     return new_state
 
 def study(game_state: GameState, mods: Modifiers) -> GameState:
     """Study to draw cards and gain knowledge."""
-    new_state = copy.deepcopy(game_state)
+    new_state = game_state.clone_with_player_mutations(game_state.current_player_index)
     current_player = new_state.get_current_player()
     
     # Draw more cards based on modifiers and position
@@ -85,13 +89,9 @@ def study(game_state: GameState, mods: Modifiers) -> GameState:
     if current_player.position == Zone.REN:  # Human realm bonus for learning
         cards_to_draw += 1
     
-    available_cards = [card for card in GAME_DECK if card not in current_player.hand]
-    
     # Allow drawing duplicate cards to increase deck variety
-    for _ in range(cards_to_draw):
-        if GAME_DECK:  # Draw from full deck, allowing duplicates
-            card = random.choice(GAME_DECK)
-            current_player.hand.append(card)
+    if GAME_DECK:  # Draw from full deck, allowing duplicates
+        current_player.hand += tuple(random.choices(GAME_DECK, k=cards_to_draw))
     
     # Bonus: gain some dao_xing from studying
     if len(current_player.hand) >= 5:  # Reward for accumulating knowledge
@@ -110,7 +110,7 @@ def study(game_state: GameState, mods: Modifiers) -> GameState:
 
 def meditate(game_state: GameState, mods: Modifiers) -> Optional[GameState]:
     """Meditate to gain Qi and potentially other benefits."""
-    new_state = copy.deepcopy(game_state)
+    new_state = game_state.clone_with_player_mutations(game_state.current_player_index)
     player = new_state.get_current_player()
     
     # Gain more Qi based on position and modifiers
@@ -140,153 +140,150 @@ def meditate(game_state: GameState, mods: Modifiers) -> Optional[GameState]:
     
     return new_state
 
-def get_valid_actions(game_state: GameState, player: Player, ap: int, mods: Modifiers, **flags) -> Dict[int, Dict[str, Any]]:
-    """Return a dictionary of valid actions for the current player."""
-    actions = {}
-    action_id = 1
+# Zero-cost informational entries, identical on every call.
+_INFO_ACTIONS = (
+    {
+        "action": "wisdom_progress",
+        "cost": 0,
+        "description": "View Wisdom Progress (查看智慧收集进度) [卷]",
+        "args": []
+    },
+    {
+        "action": "tutorial_menu",
+        "cost": 0,
+        "description": "Tutorial Menu (教学菜单) 🎓",
+        "args": []
+    },
+    {
+        "action": "learning_progress",
+        "cost": 0,
+        "description": "Learning Progress (学习进度) [统计]",
+        "args": []
+    },
+    {
+        "action": "achievement_progress",
+        "cost": 0,
+        "description": "Achievement Progress (成就进度) 🏆",
+        "args": []
+    },
+    {
+        "action": "achievement_list",
+        "cost": 0,
+        "description": "Achievement List (成就列表) [目标]",
+        "args": []
+    },
+    {
+        "action": "view_enhanced_cards",
+        "cost": 0,
+        "description": "View Enhanced Cards (查看增强卡牌) [卡牌]",
+        "args": []
+    },
+)
+
+def get_valid_actions(game_state: GameState, player: Player, ap: int, mods: Modifiers, **flags) -> List[Dict[str, Any]]:
+    """Return the list of valid actions for the current player.
+
+    Menus number the entries from 1, so menu choice n is actions[n - 1].
+
+    The menu only depends on the hand, the position and a few resource
+    thresholds, so it is cached on the player and rebuilt when those change.
+    """
+    has_ap = ap >= 1
+    cache_key = (
+        tuple(player.hand), player.position, has_ap,
+        player.qi >= 1, player.qi >= 3, player.cheng_yi >= 3, player.dao_xing >= 2
+    )
+    cached = player.valid_actions_cache
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    actions = []
     
     # Always allow pass action
-    actions[action_id] = {
+    actions.append({
         "action": "pass",
         "cost": 0,
         "description": "Pass turn",
         "args": []
-    }
-    action_id += 1
+    })
     
     # Enhanced play card actions (with Yijing effects)
-    for i, card in enumerate(player.hand):
-        if ap >= 1:  # Playing a card costs 1 AP
-            for gua in card.associated_guas:
-                actions[action_id] = {
+    if has_ap:  # Playing a card costs 1 AP
+        for i, card in enumerate(player.hand):
+            for gua in card._gua_list:
+                actions.append({
                     "action": enhanced_play_card,
                     "cost": 1,
                     "description": f"Play {card.name} to {gua} [阴阳]",
                     "args": [i, gua]
-                }
-                action_id += 1
+                })
     
     # Move action
-    if ap >= 1 and player.qi >= 1:  # Moving costs 1 AP and 1 Qi
+    if has_ap and player.qi >= 1:  # Moving costs 1 AP and 1 Qi
         for zone in Zone:
             if zone != player.position:
-                actions[action_id] = {
+                actions.append({
                     "action": move,
                     "cost": 1,
                     "description": f"Move to {zone.value}",
                     "args": [zone.value]
-                }
-                action_id += 1
+                })
     
     # Enhanced study action (with Yijing wisdom)
-    if ap >= 1:
-        actions[action_id] = {
+    if has_ap:
+        actions.append({
             "action": enhanced_study,
             "cost": 1,
             "description": "Study (draw cards, gain wisdom) [书]",
             "args": []
-        }
-        action_id += 1
+        })
     
     # Enhanced meditate action (with Yijing cultivation)
-    if ap >= 1:
-        actions[action_id] = {
+    if has_ap:
+        actions.append({
             "action": enhanced_meditate,
             "cost": 1,
             "description": "Meditate (cultivate Qi, balance Yin-Yang) 🧘",
             "args": []
-        }
-        action_id += 1
+        })
     
     # Biangua transformation (change hexagram)
-    if ap >= 1 and player.cheng_yi >= 3:
-        actions[action_id] = {
+    if has_ap and player.cheng_yi >= 3:
+        actions.append({
             "action": "biangua_prompt",
             "cost": 1,
             "description": "Biangua (transform hexagram) 🔄",
             "args": []
-        }
-        action_id += 1
+        })
     
     # Divine fortune (占卜运势)
-    if ap >= 1 and player.qi >= 3:
-        actions[action_id] = {
+    if has_ap and player.qi >= 3:
+        actions.append({
             "action": divine_fortune,
             "cost": 1,
             "description": "Divine Fortune (占卜运势) 🔮",
             "args": []
-        }
-        action_id += 1
-    
-    # View wisdom progress (no cost)
-    actions[action_id] = {
-        "action": "wisdom_progress",
-        "cost": 0,
-        "description": "View Wisdom Progress (查看智慧收集进度) [卷]",
-        "args": []
-    }
-    action_id += 1
-    
-    # Tutorial system actions (no cost)
-    actions[action_id] = {
-        "action": "tutorial_menu",
-        "cost": 0,
-        "description": "Tutorial Menu (教学菜单) 🎓",
-        "args": []
-    }
-    action_id += 1
+        })
     
-    actions[action_id] = {
-        "action": "learning_progress",
-        "cost": 0,
-        "description": "Learning Progress (学习进度) [统计]",
-        "args": []
-    }
-    action_id += 1
-    
-    # Achievement system actions (no cost)
-    actions[action_id] = {
-        "action": "achievement_progress",
-        "cost": 0,
-        "description": "Achievement Progress (成就进度) 🏆",
-        "args": []
-    }
-    action_id += 1
-    
-    actions[action_id] = {
-        "action": "achievement_list",
-        "cost": 0,
-        "description": "Achievement List (成就列表) [目标]",
-        "args": []
-    }
-    action_id += 1
-    
-    # Enhanced card system actions
-    actions[action_id] = {
-        "action": "view_enhanced_cards",
-        "cost": 0,
-        "description": "View Enhanced Cards (查看增强卡牌) [卡牌]",
-        "args": []
-    }
-    action_id += 1
+    # Wisdom, tutorial, achievement and card views (no cost)
+    actions.extend(_INFO_ACTIONS)
     
-    if ap >= 1:
-        actions[action_id] = {
+    if has_ap:
+        actions.append({
             "action": "use_enhanced_card",
             "cost": 1,
             "description": "Use Enhanced Card (使用增强卡牌) [闪]",
             "args": []
-        }
-        action_id += 1
+        })
     
     # Consult Yijing for guidance
-    if ap >= 1 and player.dao_xing >= 2:
-        actions[action_id] = {
+    if has_ap and player.dao_xing >= 2:
+        actions.append({
             "action": "consult_yijing_prompt",
             "cost": 1,
             "description": "Consult Yijing (咨询易经) [卷]",
             "args": []
-        }
-        action_id += 1
+        })
     
+    player.valid_actions_cache = (cache_key, actions)
     return actions
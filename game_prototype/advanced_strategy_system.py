@@ -53,6 +53,8 @@ class AdvancedStrategySystem:
     
     def __init__(self):
         self.strategy_actions = self._initialize_strategy_actions()
+        # 策略名称 -> 行动ID，用于按名称直接查找
+        self.action_ids_by_name = {action.name: action_id for action_id, action in self.strategy_actions.items()}
         self.player_strategies: Dict[str, PlayerStrategy] = {}
         
     def _initialize_strategy_actions(self) -> Dict[str, StrategyAction]:
@@ -175,23 +177,37 @@ class AdvancedStrategySystem:
         self.initialize_player_strategy(player.name)
         player_strategy = self.player_strategies[player.name]
         
-        available = []
+        return [
+            action for action_id, action in self.strategy_actions.items()
+            if self._is_action_available(player_strategy, player, game_state, action_id, action)
+        ]
+    
+    def get_available_strategy(self, player: Player, game_state: GameState,
+                               strategy_name: str) -> Optional[StrategyAction]:
+        """按名称获取玩家当前可用的策略行动，不可用或不存在时返回None"""
+        action_id = self.action_ids_by_name.get(strategy_name)
+        if action_id is None:
+            return None
         
-        for action_id, action in self.strategy_actions.items():
-            # 检查冷却时间
-            if action_id in player_strategy.strategy_cooldowns:
-                if player_strategy.strategy_cooldowns[action_id] > 0:
-                    continue
-            
-            # 检查资源条件
-            if not self._check_resource_conditions(player, action.cost):
-                continue
-            
-            # 检查特殊条件
-            if self._check_special_conditions(player, game_state, action.conditions):
-                available.append(action)
+        self.initialize_player_strategy(player.name)
+        action = self.strategy_actions[action_id]
+        if self._is_action_available(self.player_strategies[player.name], player, game_state, action_id, action):
+            return action
+        return None
+    
+    def _is_action_available(self, player_strategy: PlayerStrategy, player: Player,
+                             game_state: GameState, action_id: str, action: StrategyAction) -> bool:
+        """检查单个策略行动的冷却、资源和特殊条件"""
+        # 检查冷却时间
+        if player_strategy.strategy_cooldowns.get(action_id, 0) > 0:
+            return False
         
-        return available
+        # 检查资源条件
+        if not self._check_resource_conditions(player, action.cost):
+            return False
+        
+        # 检查特殊条件
+        return self._check_special_conditions(player, game_state, action.conditions)
     
     def _check_resource_conditions(self, player: Player, cost: Dict[str, int]) -> bool:
         """检查资源条件"""
@@ -279,10 +295,7 @@ class AdvancedStrategySystem:
     
     def _get_action_id(self, action: StrategyAction) -> Optional[str]:
         """获取行动ID"""
-        for action_id, stored_action in self.strategy_actions.items():
-            if stored_action.name == action.name:
-                return action_id
-        return None
+        return self.action_ids_by_name.get(action.name)
     
     def _apply_strategy_effects(self, player: Player, game_state: GameState, 
                               action: StrategyAction):
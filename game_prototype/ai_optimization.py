@@ -7,8 +7,9 @@
 import random
 import sys
 import os
-from typing import Dict, List, Tuple, Optional
-from enum import Enum
+import multiprocessing
+from typing import Dict, List, Tuple, Optional, Sequence
+from enum import Enum, IntEnum
 
 # 添加当前目录到Python路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -20,9 +21,57 @@ class AIStrategy(Enum):
     DEFENSIVE = "defensive"       # 防守型：稳健发展
     ADAPTIVE = "adaptive"         # 自适应：根据情况调整
 
+class Action(IntEnum):
+    """模拟对局中的行动，用整数枚举代替中文字符串比较"""
+    STUDY = 0       # 学习
+    MEDITATE = 1    # 冥想
+    BIANGUA = 2     # 变卦
+
+# 模拟对局中始终可选的行动，作为常量复用而不是每回合重建列表
+_ALL_ACTIONS = tuple(Action)
+_GROWTH_ACTIONS = (Action.STUDY, Action.MEDITATE)
+
+# 胜利阈值的倒数（道行25、诚意12、气25），评估时以乘法代替除法
+_INV_DAO_XING = 1 / 25.0
+_INV_CHENG_YI = 1 / 12.0
+_INV_QI = 1 / 25.0
+
+# 各行动随机收益的全部等概率组合(道行, 诚意, 气)，按Action取值顺序排列
+_ACTION_OUTCOMES = (
+    # 学习：道行+2~4，气+2~3
+    tuple((dao, 0, qi) for dao in range(2, 5) for qi in range(2, 4)),
+    # 冥想：诚意+2~3，气+2~4，道行+1~2
+    tuple((dao, cheng, qi) for cheng in range(2, 4) for qi in range(2, 5) for dao in range(1, 3)),
+    # 变卦：消耗2诚意，道行+1~3，气+2~4
+    tuple((dao, -2, qi) for dao in range(1, 4) for qi in range(2, 5)),
+)
+
+# evaluate_game_state的结果缓存：局面数值 -> 评估字典
+_EVALUATION_CACHE: Dict[tuple, Dict[str, float]] = {}
+_EVALUATION_CACHE_SIZE = 8192
+
+def _victory_proximity(dao_xing: int, cheng_yi: int, qi: int) -> float:
+    """胜利接近度：三项胜利条件中进度最高的一项，最大为1"""
+    return min(max(dao_xing * _INV_DAO_XING, cheng_yi * _INV_CHENG_YI, qi * _INV_QI), 1.0)
+
+def _action_values(player, eval_data: Dict) -> Tuple[float, float, float]:
+    """按Action取值顺序返回学习、冥想、变卦的价值，各项需求只计算一次"""
+    dao_need = max(0, 25 - player.dao_xing) / 25.0
+    cheng_need = max(0, 12 - player.cheng_yi) / 12.0
+    qi_need = max(0, 25 - player.qi) / 25.0
+    balance_need = 1.0 - eval_data['balance_stability']
+    
+    # 学习看道行与气，冥想看诚意、气与阴阳平衡，变卦需要至少2点诚意
+    study = dao_need * 0.6 + qi_need * 0.4
+    meditate = cheng_need * 0.5 + qi_need * 0.3 + balance_need * 0.2
+    biangua = (dao_need + qi_need) * 0.4 if player.cheng_yi >= 2 else 0.0
+    return study, meditate, biangua
+
 class AIDecisionMaker:
     """AI决策制定器"""
     
+    __slots__ = ('strategy', 'decision_history', 'performance_metrics', '_strategy_fn')
+    
     def __init__(self, strategy: AIStrategy = AIStrategy.BALANCED):
         self.strategy = strategy
         self.decision_history = []
@@ -32,27 +81,56 @@ class AIDecisionMaker:
             'avg_turns': 0,
             'strategy_effectiveness': {}
         }
+        # 策略分派表：构造时绑定，避免每次决策都做if/elif判断
+        self._strategy_fn = {
+            AIStrategy.AGGRESSIVE: self._aggressive_strategy,
+            AIStrategy.DEFENSIVE: self._defensive_strategy,
+            AIStrategy.ADAPTIVE: self._adaptive_strategy,
+            AIStrategy.BALANCED: self._balanced_strategy,
+        }[strategy]
         
     def evaluate_game_state(self, player, opponent) -> Dict[str, float]:
         """评估当前游戏状态"""
+        # 一次读取双方属性，单遍计算全部特征
+        p_dao, p_cheng, p_qi = player.dao_xing, player.cheng_yi, player.qi
+        o_dao, o_cheng, o_qi = opponent.dao_xing, opponent.cheng_yi, opponent.qi
+        
+        # 自我对弈中相同的局面反复出现，按双方数值缓存评估结果（结果视为只读）
+        balance = getattr(player, 'yin_yang_balance', None)
+        balance_key = (balance.yin_points, balance.yang_points) if balance is not None else None
+        cache_key = (p_dao, p_cheng, p_qi, balance_key, o_dao, o_cheng, o_qi)
+        cached = _EVALUATION_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        dao_xing_advantage = (p_dao - o_dao) * _INV_DAO_XING
+        cheng_yi_advantage = (p_cheng - o_cheng) * _INV_CHENG_YI
+        qi_advantage = (p_qi - o_qi) * _INV_QI
+        balance_stability = self._evaluate_balance_stability(player)
+        victory_proximity = _victory_proximity(p_dao, p_cheng, p_qi)
+        opponent_threat = _victory_proximity(o_dao, o_cheng, o_qi)  # 对手威胁度即对手的胜利接近度
+        
         evaluation = {
-            'dao_xing_advantage': (player.dao_xing - opponent.dao_xing) / 25.0,
-            'cheng_yi_advantage': (player.cheng_yi - opponent.cheng_yi) / 12.0,
-            'qi_advantage': (player.qi - opponent.qi) / 25.0,
-            'balance_stability': self._evaluate_balance_stability(player),
-            'victory_proximity': self._calculate_victory_proximity(player),
-            'opponent_threat': self._calculate_opponent_threat(opponent)
+            'dao_xing_advantage': dao_xing_advantage,
+            'cheng_yi_advantage': cheng_yi_advantage,
+            'qi_advantage': qi_advantage,
+            'balance_stability': balance_stability,
+            'victory_proximity': victory_proximity,
+            'opponent_threat': opponent_threat,
+            # 计算总体优势
+            'overall_advantage': (
+                dao_xing_advantage * 0.3 +
+                cheng_yi_advantage * 0.25 +
+                qi_advantage * 0.25 +
+                balance_stability * 0.1 +
+                victory_proximity * 0.1
+            )
         }
         
-        # 计算总体优势
-        evaluation['overall_advantage'] = (
-            evaluation['dao_xing_advantage'] * 0.3 +
-            evaluation['cheng_yi_advantage'] * 0.25 +
-            evaluation['qi_advantage'] * 0.25 +
-            evaluation['balance_stability'] * 0.1 +
-            evaluation['victory_proximity'] * 0.1
-        )
-        
+        # 超出容量时按插入顺序淘汰最早的条目
+        if len(_EVALUATION_CACHE) >= _EVALUATION_CACHE_SIZE:
+            del _EVALUATION_CACHE[next(iter(_EVALUATION_CACHE))]
+        _EVALUATION_CACHE[cache_key] = evaluation
         return evaluation
         
     def _evaluate_balance_stability(self, player) -> float:
@@ -64,31 +142,12 @@ class AIDecisionMaker:
             return max(0.0, stability)
         return 0.5
         
-    def _calculate_victory_proximity(self, player) -> float:
-        """计算胜利接近度"""
-        dao_xing_progress = min(player.dao_xing / 25.0, 1.0)
-        cheng_yi_progress = min(player.cheng_yi / 12.0, 1.0)
-        qi_progress = min(player.qi / 25.0, 1.0)
-        
-        return max(dao_xing_progress, cheng_yi_progress, qi_progress)
-        
-    def _calculate_opponent_threat(self, opponent) -> float:
-        """计算对手威胁度"""
-        return self._calculate_victory_proximity(opponent)
-        
-    def choose_action(self, player, opponent, available_actions: List[str]) -> str:
+    def choose_action(self, player, opponent, available_actions: Sequence[Action]) -> Action:
         """选择最佳行动"""
         evaluation = self.evaluate_game_state(player, opponent)
         
         # 根据策略选择行动
-        if self.strategy == AIStrategy.AGGRESSIVE:
-            action = self._aggressive_strategy(player, opponent, available_actions, evaluation)
-        elif self.strategy == AIStrategy.DEFENSIVE:
-            action = self._defensive_strategy(player, opponent, available_actions, evaluation)
-        elif self.strategy == AIStrategy.ADAPTIVE:
-            action = self._adaptive_strategy(player, opponent, available_actions, evaluation)
-        else:  # BALANCED
-            action = self._balanced_strategy(player, opponent, available_actions, evaluation)
+        action = self._strategy_fn(player, opponent, available_actions, evaluation)
             
         # 记录决策
         self.decision_history.append({
@@ -99,37 +158,37 @@ class AIDecisionMaker:
         
         return action
         
-    def _aggressive_strategy(self, player, opponent, actions: List[str], eval_data: Dict) -> str:
+    def _aggressive_strategy(self, player, opponent, actions: Sequence[Action], eval_data: Dict) -> Action:
         """激进策略：优先快速获胜"""
         # 如果接近胜利，专注于最接近的胜利条件
         if eval_data['victory_proximity'] > 0.7:
             if player.dao_xing >= 20:
-                return "学习"  # 冲刺道行胜利
+                return Action.STUDY  # 冲刺道行胜利
             elif player.cheng_yi >= 10:
-                return "冥想"  # 冲刺诚意胜利
+                return Action.MEDITATE  # 冲刺诚意胜利
             elif player.qi >= 20:
-                return "变卦"  # 冲刺气胜利
+                return Action.BIANGUA  # 冲刺气胜利
                 
         # 对手威胁高时，加快发展
         if eval_data['opponent_threat'] > 0.6:
-            return random.choice(["学习", "冥想", "变卦"])
+            return random.choice(_ALL_ACTIONS)
             
         # 默认快速发展
-        return random.choice(["学习", "冥想"])
+        return random.choice(_GROWTH_ACTIONS)
         
-    def _defensive_strategy(self, player, opponent, actions: List[str], eval_data: Dict) -> str:
+    def _defensive_strategy(self, player, opponent, actions: Sequence[Action], eval_data: Dict) -> Action:
         """防守策略：稳健发展"""
         # 平衡发展，避免过度专精
         if player.dao_xing < 15 and player.cheng_yi < 8:
-            return "学习"  # 基础发展
+            return Action.STUDY  # 基础发展
         elif player.cheng_yi < 8:
-            return "冥想"  # 补充诚意
+            return Action.MEDITATE  # 补充诚意
         elif eval_data['balance_stability'] < 0.3:
-            return "冥想"  # 调整平衡
+            return Action.MEDITATE  # 调整平衡
         else:
-            return "变卦"  # 稳步提升
+            return Action.BIANGUA  # 稳步提升
             
-    def _adaptive_strategy(self, player, opponent, actions: List[str], eval_data: Dict) -> str:
+    def _adaptive_strategy(self, player, opponent, actions: Sequence[Action], eval_data: Dict) -> Action:
         """自适应策略：根据情况调整"""
         # 根据优势情况调整策略
         if eval_data['overall_advantage'] > 0.3:
@@ -142,53 +201,16 @@ class AIDecisionMaker:
             # 均势时采用平衡策略
             return self._balanced_strategy(player, opponent, actions, eval_data)
             
-    def _balanced_strategy(self, player, opponent, actions: List[str], eval_data: Dict) -> str:
+    def _balanced_strategy(self, player, opponent, actions: Sequence[Action], eval_data: Dict) -> Action:
         """平衡策略：均衡发展"""
-        # 根据当前状态选择最需要的发展方向
-        scores = {
-            "学习": self._calculate_action_value(player, "学习", eval_data),
-            "冥想": self._calculate_action_value(player, "冥想", eval_data),
-            "变卦": self._calculate_action_value(player, "变卦", eval_data)
-        }
+        study_score, meditate_score, biangua_score = _action_values(player, eval_data)
         
-        # 选择价值最高的行动
-        best_action = max(scores.items(), key=lambda x: x[1])[0]
-        return best_action
-        
-    def _calculate_action_value(self, player, action: str, eval_data: Dict) -> float:
-        """计算行动价值"""
-        value = 0.0
-        
-        if action == "学习":
-            # 道行价值
-            dao_need = max(0, 25 - player.dao_xing) / 25.0
-            value += dao_need * 0.6
-            # 气价值
-            qi_need = max(0, 25 - player.qi) / 25.0
-            value += qi_need * 0.4
-            
-        elif action == "冥想":
-            # 诚意价值
-            cheng_need = max(0, 12 - player.cheng_yi) / 12.0
-            value += cheng_need * 0.5
-            # 气价值
-            qi_need = max(0, 25 - player.qi) / 25.0
-            value += qi_need * 0.3
-            # 平衡调整价值
-            balance_need = 1.0 - eval_data['balance_stability']
-            value += balance_need * 0.2
-            
-        elif action == "变卦":
-            # 需要足够诚意
-            if player.cheng_yi >= 2:
-                # 道行和气的综合价值
-                dao_need = max(0, 25 - player.dao_xing) / 25.0
-                qi_need = max(0, 25 - player.qi) / 25.0
-                value += (dao_need + qi_need) * 0.4
-            else:
-                value = 0.0  # 诚意不足，无法变卦
-                
-        return value
+        # 选择价值最高的行动（同分时按学习、冥想、变卦的顺序）
+        if study_score >= meditate_score and study_score >= biangua_score:
+            return Action.STUDY
+        if meditate_score >= biangua_score:
+            return Action.MEDITATE
+        return Action.BIANGUA
         
     def update_performance(self, won: bool, turns: int):
         """更新性能指标"""
@@ -218,6 +240,29 @@ class AIDecisionMaker:
             (strategy_stats['avg_turns'] * (strategy_stats['games'] - 1) + turns) / strategy_stats['games']
         )
 
+class MockBalance:
+    """模拟对局使用的简化阴阳平衡"""
+    
+    __slots__ = ('yin_points', 'yang_points', 'balance_ratio')
+    
+    def __init__(self):
+        self.yin_points = 50
+        self.yang_points = 50
+        # 模拟中阴阳点数从不变化，比例在构造时算好即可
+        self.balance_ratio = 0.5
+
+class MockPlayer:
+    """模拟对局使用的简化玩家"""
+    
+    __slots__ = ('name', 'dao_xing', 'cheng_yi', 'qi', 'yin_yang_balance')
+    
+    def __init__(self, name):
+        self.name = name
+        self.dao_xing = 0
+        self.cheng_yi = 0
+        self.qi = 0
+        self.yin_yang_balance = MockBalance()
+
 class AIOptimizationTester:
     """AI优化测试器"""
     
@@ -232,13 +277,19 @@ class AIOptimizationTester:
         wins = 0
         total_turns = 0
         
-        for game in range(games):
-            result = self._simulate_ai_game(ai_player)
-            if result['winner'] == 'ai':
+        # 各局相互独立，分发到多个进程并行模拟；子进程重新播种避免随机序列相同
+        with multiprocessing.Pool(initializer=random.seed) as pool:
+            results = pool.map(_simulate_one, [strategy.value] * games,
+                               chunksize=max(1, games // (4 * (os.cpu_count() or 1))))
+        
+        # 按对局顺序合并各局的决策记录，与串行模拟时累积的 decision_history 一致
+        for won, turns, history in results:
+            if won:
                 wins += 1
-            total_turns += result['turns']
+            total_turns += turns
             
-            ai_player.update_performance(result['winner'] == 'ai', result['turns'])
+            ai_player.decision_history.extend(history)
+            ai_player.update_performance(won, turns)
             
         win_rate = wins / games
         avg_turns = total_turns / games
@@ -258,41 +309,29 @@ class AIOptimizationTester:
     def _simulate_ai_game(self, ai_player: AIDecisionMaker) -> Dict:
         """模拟AI游戏"""
         # 简化的游戏模拟
-        class MockPlayer:
-            def __init__(self, name):
-                self.name = name
-                self.dao_xing = 0
-                self.cheng_yi = 0
-                self.qi = 0
-                self.yin_yang_balance = MockBalance()
-                
-        class MockBalance:
-            def __init__(self):
-                self.yin_points = 50
-                self.yang_points = 50
-                
-            @property
-            def balance_ratio(self):
-                total = self.yin_points + self.yang_points
-                return self.yin_points / total if total > 0 else 0.5
-        
         ai = MockPlayer("AI")
         opponent = MockPlayer("对手")
         
+        # 热循环中的方法查找提前绑定为局部变量
+        choose_action = ai_player.choose_action
+        apply_action = self._apply_action
+        check_victory = self._check_victory
+        random_choice = random.choice
+        
         max_turns = 50
         for turn in range(max_turns):
             # AI回合
-            action = ai_player.choose_action(ai, opponent, ["学习", "冥想", "变卦"])
-            self._apply_action(ai, action)
+            action = choose_action(ai, opponent, _ALL_ACTIONS)
+            apply_action(ai, action)
             
-            if self._check_victory(ai):
+            if check_victory(ai):
                 return {'winner': 'ai', 'turns': turn + 1}
                 
             # 对手回合（随机策略）
-            opponent_action = random.choice(["学习", "冥想", "变卦"])
-            self._apply_action(opponent, opponent_action)
+            opponent_action = random_choice(_ALL_ACTIONS)
+            apply_action(opponent, opponent_action)
             
-            if self._check_victory(opponent):
+            if check_victory(opponent):
                 return {'winner': 'opponent', 'turns': turn + 1}
                 
         # 平局，按分数判断
@@ -302,20 +341,15 @@ class AIOptimizationTester:
         winner = 'ai' if ai_score > opp_score else 'opponent'
         return {'winner': winner, 'turns': max_turns}
         
-    def _apply_action(self, player, action: str):
+    def _apply_action(self, player, action: Action):
         """应用行动效果"""
-        if action == "学习":
-            player.dao_xing += random.randint(2, 4)
-            player.qi += random.randint(2, 3)
-        elif action == "冥想":
-            player.cheng_yi += random.randint(2, 3)
-            player.qi += random.randint(2, 4)
-            player.dao_xing += random.randint(1, 2)
-        elif action == "变卦":
-            if player.cheng_yi >= 2:
-                player.cheng_yi -= 2
-                player.dao_xing += random.randint(1, 3)
-                player.qi += random.randint(2, 4)
+        if action == Action.BIANGUA and player.cheng_yi < 2:
+            return  # 诚意不足，变卦无效
+        # 一次抽取整组收益，代替逐项调用random.randint
+        dao, cheng, qi = random.choice(_ACTION_OUTCOMES[action])
+        player.dao_xing += dao
+        player.cheng_yi += cheng
+        player.qi += qi
                 
     def _check_victory(self, player) -> bool:
         """检查胜利条件"""
@@ -359,6 +393,12 @@ class AIOptimizationTester:
         
         return best_strategy
 
+def _simulate_one(strategy_value: str) -> Tuple[bool, int, List[Dict]]:
+    """在工作进程中模拟一局游戏，返回(AI是否获胜, 回合数, 本局的决策记录)"""
+    ai_player = AIDecisionMaker(AIStrategy(strategy_value))
+    result = AIOptimizationTester()._simulate_ai_game(ai_player)
+    return result['winner'] == 'ai', result['turns'], ai_player.decision_history
+
 def main():
     """主函数"""
     print("🧠 开始AI决策逻辑优化测试")
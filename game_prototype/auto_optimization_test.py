@@ -3,59 +3,245 @@
 自动化游戏测试脚本 - 运行100次游戏并收集优化数据
 """
 
+import argparse
+import contextlib
+import cProfile
+import pstats
 import random
 import time
 import json
-import statistics
+import multiprocessing
 from typing import Dict, List, Any, Tuple
 from collections import defaultdict, Counter
 import sys
 import os
 
+# orjson为可选依赖：有则用其C实现的编码器写报告，否则退回标准库json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 添加当前目录到路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from game_state import GameState, Player, Zone
+from game_data import GAME_DECK
 from main import setup_game
 from bot_player import get_bot_choice
 from yijing_actions import check_victory_conditions_enhanced
 from enhanced_victory import check_enhanced_victory_conditions
 
+INITIAL_HAND_SIZE = 4
+
+# 区域枚举在导入时缓存一次，热路径中不再重复构建 list(Zone)
+_ZONES = tuple(Zone)
+_NUM_ZONES = len(_ZONES)
+
+# 模拟行动的随机取值范围，每回合按批抽取
+_ZONE_INDICES = range(_NUM_ZONES)
+_INFLUENCE_GAINS = (1, 2, 3)
+_QI_GAINS = (2, 3, 4)
+_DAO_XING_GAINS = (0, 1)
+
+MAX_ACTIONS_PER_TURN = 3  # 每回合最多3个行动
+
+
+def _build_decision_table() -> Dict[Tuple[bool, int, bool], Tuple[float, str]]:
+    """预先展开简化AI的决策规则
+    
+    键为 (有手牌, 行动点档位0/1/2, 气是否不足)，值为 (随机移动概率, 未移动时的行动)。
+    """
+    table = {}
+    for has_hand in (False, True):
+        for ap_bucket in (0, 1, 2):
+            for low_qi in (False, True):
+                if ap_bucket == 0:
+                    entry = (0.0, 'pass')
+                elif has_hand and ap_bucket >= 2:
+                    entry = (0.0, 'play_card')
+                elif low_qi:
+                    entry = (0.0, 'meditate')
+                else:
+                    entry = (0.3, 'play_card' if has_hand else 'meditate')
+                table[(has_hand, ap_bucket, low_qi)] = entry
+    return table
+
+
+_DECISION_TABLE = _build_decision_table()
+
+
+def reset_game_state(game_state: GameState):
+    """将已用过的游戏状态原地重置为开局状态（与setup_game的初始值一致）"""
+    game_state.turn = 1
+    game_state.current_player_index = 0
+    
+    deck = list(GAME_DECK)
+    random.shuffle(deck)
+    for i, player in enumerate(game_state.players):
+        player.hand = tuple(deck[i * INITIAL_HAND_SIZE:(i + 1) * INITIAL_HAND_SIZE])
+        player.qi = 8
+        player.dao_xing = 1
+        player.cheng_yi = 2
+        player.position = Zone.DI
+
+
+class _SimPlayer:
+    """模拟对局中的玩家记录：引用游戏模型中的Player，另存只在模拟中使用的状态"""
+    
+    __slots__ = ('player', 'ap', 'influence', 'current_zone', 'is_active', 'yin_qi', 'yang_qi')
+    
+    def __init__(self, player: Player):
+        self.player = player
+        self.ap = 3
+        self.influence = [0] * _NUM_ZONES  # 按Zone顺序索引的各区域影响力
+        self.current_zone = player.position
+        self.is_active = True
+        self.yin_qi = 0
+        self.yang_qi = 0
+
+
+class GameStatePool:
+    """游戏状态对象池 - 按玩家人数复用GameState，避免每局重新构建玩家和棋盘"""
+    
+    def __init__(self):
+        self._states: Dict[int, GameState] = {}
+    
+    def acquire(self, num_players: int) -> GameState:
+        """获取一个处于开局状态的游戏状态"""
+        game_state = self._states.get(num_players)
+        if game_state is None:
+            game_state = self._states[num_players] = setup_game(num_players)
+        else:
+            reset_game_state(game_state)
+        return game_state
+
+
+RESULTS_PATH = 'game_analysis_report.jsonl'
+
+
+def _json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """将对象编码为UTF-8 JSON字节串"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+class WelfordAccumulator:
+    """在线统计量 - 逐个样本更新均值、方差和极值（Welford算法），内存占用O(1)"""
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.min = None
+        self.max = None
+        self._m2 = 0.0
+    
+    def add(self, value: float):
+        """加入一个样本"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+    
+    @property
+    def variance(self) -> float:
+        """样本方差"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+_worker_analyzer = None
+
+
+def _play_seeded_game(args: Tuple[int, int]) -> Tuple[Dict[str, Any], str]:
+    """在工作进程中运行一局游戏，返回 (结果, 错误信息)
+    
+    每局按自己的种子重新播种，因此结果与进程数和调度顺序无关。
+    """
+    global _worker_analyzer
+    game_num, seed = args
+    if _worker_analyzer is None:
+        _worker_analyzer = GameAnalyzer()
+    random.seed(seed)
+    try:
+        return _worker_analyzer._run_single_game(game_num), None
+    except Exception as e:
+        return None, str(e)
+
+
 class GameAnalyzer:
     """游戏分析器 - 收集和分析游戏数据"""
     
     def __init__(self):
-        self.game_results = []
+        # 逐局结果写入 RESULTS_PATH，内存中只保留汇总统计
+        self.games_completed = 0
+        self.turn_stats = WelfordAccumulator()
+        self.duration_stats = WelfordAccumulator()
+        self.victory_counter = Counter()
+        self.total_victories = 0
         self.performance_data = []
         self.balance_issues = []
         self.ai_decisions = []
+        self.state_pool = GameStatePool()
+        
+        # 当前对局各项胜利指标的最大值，由模拟行动增量维护
+        self._max_dao_xing = 0
+        self._max_zones_controlled = 0
+        self._max_culture = 0
         
-    def run_automated_tests(self, num_games: int = 100):
-        """运行自动化测试"""
+    def run_automated_tests(self, num_games: int = 100, seed: int = 42, processes: int = None):
+        """运行自动化测试
+        
+        各局互不共享状态，分发到多个进程并行模拟；第n局使用种子 seed + n，便于复现。
+        processes为1时在当前进程内顺序运行（便于性能剖析），None表示使用全部CPU。
+        """
         print(f"🎮 开始运行 {num_games} 次自动化游戏测试...")
         print("=" * 60)
         
-        for game_num in range(1, num_games + 1):
-            print(f"\r进度: {game_num}/{num_games} ({game_num/num_games*100:.1f}%)", end="", flush=True)
-            
-            try:
-                result = self._run_single_game(game_num)
-                self.game_results.append(result)
+        tasks = [(game_num, seed + game_num) for game_num in range(1, num_games + 1)]
+        pool_context = multiprocessing.Pool(processes) if processes != 1 else contextlib.nullcontext()
+        with pool_context as pool, \
+                open(RESULTS_PATH, 'wb') as results_file:
+            if pool is None:
+                outcomes = map(_play_seeded_game, tasks)
+            else:
+                outcomes = pool.imap(_play_seeded_game, tasks, chunksize=4)
+            for game_num, (result, error) in enumerate(outcomes, 1):
+                # 每5局刷新一次进度行，避免每局都触发一次flush
+                if game_num % 5 == 0 or game_num == num_games:
+                    print(f"\r进度: {game_num}/{num_games} ({game_num/num_games*100:.1f}%)", end="", flush=True)
                 
-                # 每10局输出一次中间统计
-                if game_num % 10 == 0:
-                    self._print_intermediate_stats(game_num)
+                if error is None:
+                    results_file.write(_json_bytes(result) + b'\n')
+                    self._record_result(result)
                     
-            except Exception as e:
-                print(f"\n❌ 游戏 {game_num} 出现错误: {e}")
-                self.balance_issues.append({
-                    'game_num': game_num,
-                    'error': str(e),
-                    'type': 'runtime_error'
-                })
-        
-        print(f"\n\n✅ 完成 {len(self.game_results)} 次游戏测试")
+                    # 每10局输出一次中间统计
+                    if game_num % 10 == 0:
+                        self._print_intermediate_stats(game_num)
+                else:
+                    print(f"\n❌ 游戏 {game_num} 出现错误: {error}")
+                    self.balance_issues.append({
+                        'game_num': game_num,
+                        'error': error,
+                        'type': 'runtime_error'
+                    })
+        
+        print(f"\n\n✅ 完成 {self.games_completed} 次游戏测试")
         self._analyze_results()
+    
+    def _record_result(self, result: Dict[str, Any]):
+        """将一局结果计入汇总统计"""
+        self.games_completed += 1
+        self.turn_stats.add(result['turns'])
+        self.duration_stats.add(result['game_duration'])
+        if result['victory_type']:
+            self.victory_counter[result['victory_type']] += 1
+            self.total_victories += 1
         
     def _run_single_game(self, game_num: int) -> Dict[str, Any]:
         """运行单次游戏并收集数据"""
@@ -63,7 +249,12 @@ class GameAnalyzer:
         
         # 随机选择玩家数量 (2-4人)
         num_players = random.choice([2, 3, 4])
-        game_state = setup_game(num_players)
+        game_state = self.state_pool.acquire(num_players)
+        players = [_SimPlayer(player) for player in game_state.players]
+        self._max_dao_xing = max(sim.player.dao_xing for sim in players)
+        self._max_zones_controlled = 0
+        self._max_culture = max(sim.yin_qi + sim.yang_qi + sum(sim.player.wuxing_affinities.values())
+                                for sim in players)
         
         # 游戏数据收集
         game_data = {
@@ -83,229 +274,241 @@ class GameAnalyzer:
         max_turns = 100  # 防止无限循环
         turn_count = 0
         
+        # 玩家人数在一局内固定：每回合的随机数批量大小只算一次，循环用到的方法绑定为局部变量
+        draws_per_turn = MAX_ACTIONS_PER_TURN * num_players
+        check_victory = self._check_all_victory_conditions
+        simulate_turn = self._simulate_turn
+        is_stalemate = self._is_stalemate
+        
         while turn_count < max_turns:
             turn_count += 1
             
             # 检查胜利条件
-            victory_result = self._check_all_victory_conditions(game_state)
+            victory_result = check_victory(players)
             if victory_result['winner']:
                 game_data['winner'] = victory_result['winner'].name
                 game_data['victory_type'] = victory_result['type']
                 break
             
             # 执行回合
-            self._simulate_turn(game_state, game_data)
+            simulate_turn(players, game_data, draws_per_turn)
             
             # 检查游戏是否陷入僵局
-            if self._is_stalemate(game_state, turn_count):
+            if is_stalemate(players, turn_count):
                 game_data['victory_type'] = 'stalemate'
                 break
         
         # 记录最终数据
         game_data['turns'] = turn_count
         game_data['game_duration'] = time.time() - start_time
-        game_data['final_scores'] = self._calculate_final_scores(game_state)
-        game_data['resource_distribution'] = self._analyze_resource_distribution(game_state)
+        resources = self._analyze_resource_distribution(players)
+        game_data['final_scores'] = self._calculate_final_scores(
+            players, resources['influence_distribution'])
+        game_data['resource_distribution'] = resources
         
         return game_data
     
-    def _simulate_turn(self, game_state: GameState, game_data: Dict):
-        """模拟一个回合"""
-        for player in game_state.players:
-            if not player.is_active:
+    def _simulate_turn(self, players: List[_SimPlayer], game_data: Dict, draws: int):
+        """模拟一个回合（draws为本回合最多可能执行的行动数，即每人行动上限×人数）"""
+        # 内层循环每回合执行上万次，方法查找提前绑定为局部变量
+        make_ai_decision = self._make_ai_decision
+        simulate_play_card = self._simulate_play_card
+        simulate_meditate = self._simulate_meditate
+        simulate_move = self._simulate_move
+        max_actions = MAX_ACTIONS_PER_TURN
+        
+        # 一次性抽取本回合所有行动可能用到的随机数，代替逐次调用random.randint/choice
+        zone_rolls = iter(random.choices(_ZONE_INDICES, k=draws))
+        influence_rolls = iter(random.choices(_INFLUENCE_GAINS, k=draws))
+        qi_rolls = iter(random.choices(_QI_GAINS, k=draws))
+        dao_xing_rolls = iter(random.choices(_DAO_XING_GAINS, k=draws))
+        move_rolls = iter([random.random() for _ in range(draws)])
+        
+        for sim in players:
+            if not sim.is_active:
                 continue
                 
             # 模拟AI决策
-            actions_taken = 0
-            max_actions = 3  # 每回合最多3个行动
-            
-            while actions_taken < max_actions and player.ap > 0:
+            for _ in range(max_actions):
+                if sim.ap <= 0:
+                    break
+                
                 # 简化的AI决策逻辑
-                action_choice = self._make_ai_decision(player, game_state)
+                action_choice = make_ai_decision(sim, next(move_rolls))
                 
-                if action_choice == 'play_card' and player.hand:
-                    self._simulate_play_card(player, game_state)
+                if action_choice == 'play_card' and sim.player.hand:
+                    simulate_play_card(sim, next(zone_rolls), next(influence_rolls))
                 elif action_choice == 'meditate':
-                    self._simulate_meditate(player)
+                    simulate_meditate(sim, next(qi_rolls), next(dao_xing_rolls))
                 elif action_choice == 'move':
-                    self._simulate_move(player)
+                    simulate_move(sim, next(zone_rolls))
                 else:
                     break  # 无法执行更多行动
-                
-                actions_taken += 1
         
         # 回合结束处理
-        self._end_turn_processing(game_state)
-    
-    def _make_ai_decision(self, player: Player, game_state: GameState) -> str:
-        """简化的AI决策逻辑"""
-        if player.ap <= 0:
-            return 'pass'
-        
-        # 基于当前状态做决策
-        if player.hand and player.ap >= 2:
-            return 'play_card'
-        elif player.qi < 5:
-            return 'meditate'
-        elif random.random() < 0.3:
-            return 'move'
-        else:
-            return 'play_card' if player.hand else 'meditate'
+        self._end_turn_processing(players)
+    
+    def _make_ai_decision(self, sim: _SimPlayer, move_roll: float) -> str:
+        """简化的AI决策逻辑：查预先展开的决策表，move_roll为预先抽取的[0, 1)随机数"""
+        ap = sim.ap
+        ap_bucket = 0 if ap <= 0 else (ap if ap < 2 else 2)
+        player = sim.player
+        move_chance, action = _DECISION_TABLE[(bool(player.hand), ap_bucket, player.qi < 5)]
+        return 'move' if move_roll < move_chance else action
     
-    def _simulate_play_card(self, player: Player, game_state: GameState):
+    def _simulate_play_card(self, sim: _SimPlayer, zone_index: int, influence_gain: int):
         """模拟打牌行动"""
-        if not player.hand or player.ap < 2:
+        player = sim.player
+        if not player.hand or sim.ap < 2:
             return
         
-        card = random.choice(player.hand)
-        player.hand.remove(card)
-        player.ap -= 2
+        # 手牌由洗乱的牌堆发出，顺序本身就是随机的，直接打出最后一张即等价于随机选牌
+        card = player.hand[-1]
+        player.hand = player.hand[:-1]
+        sim.ap -= 2
         
         # 简化的卡牌效果
         if hasattr(card, 'qi_cost'):
             player.qi = max(0, player.qi - getattr(card, 'qi_cost', 1))
         
-        # 增加影响力
-        zone = random.choice(list(Zone))
-        if not hasattr(player, 'influence'):
-            player.influence = {}
-        if zone not in player.influence:
-            player.influence[zone] = 0
-        player.influence[zone] += random.randint(1, 3)
+        # 增加影响力（influence为按Zone顺序索引的定长列表）
+        influence = sim.influence
+        before = influence[zone_index]
+        influence[zone_index] = before + influence_gain
+        if before < 5 <= before + influence_gain:
+            controlled_zones = sum(1 for count in influence if count >= 5)
+            if controlled_zones > self._max_zones_controlled:
+                self._max_zones_controlled = controlled_zones
     
-    def _simulate_meditate(self, player: Player):
+    def _simulate_meditate(self, sim: _SimPlayer, qi_gain: int, dao_xing_gain: int):
         """模拟冥想行动"""
-        if player.ap < 1:
+        if sim.ap < 1:
             return
         
-        player.ap -= 1
-        player.qi += random.randint(2, 4)
-        player.dao_xing += random.randint(0, 1)
+        sim.ap -= 1
+        player = sim.player
+        player.qi += qi_gain
+        player.dao_xing += dao_xing_gain
+        if player.dao_xing > self._max_dao_xing:
+            self._max_dao_xing = player.dao_xing
     
-    def _simulate_move(self, player: Player):
+    def _simulate_move(self, sim: _SimPlayer, zone_index: int):
         """模拟移动行动"""
-        if player.ap < 1:
+        if sim.ap < 1:
             return
         
-        player.ap -= 1
+        sim.ap -= 1
         # 简化的移动逻辑
-        new_zone = random.choice(list(Zone))
-        player.current_zone = new_zone
+        sim.current_zone = _ZONES[zone_index]
     
-    def _end_turn_processing(self, game_state: GameState):
+    def _end_turn_processing(self, players: List[_SimPlayer]):
         """回合结束处理"""
-        for player in game_state.players:
-            # 恢复行动点
-            player.ap = min(3, player.ap + 2)
+        for sim in players:
+            # 恢复行动点（上限3，用比较代替min()调用）
+            ap = sim.ap + 2
+            sim.ap = ap if ap < 3 else 3
             
             # 资源自然恢复
+            player = sim.player
             if player.qi < 10:
                 player.qi += 1
     
-    def _check_all_victory_conditions(self, game_state: GameState) -> Dict[str, Any]:
-        """检查所有胜利条件"""
-        # 检查道行胜利
-        for player in game_state.players:
+    def _check_all_victory_conditions(self, players: List[_SimPlayer]) -> Dict[str, Any]:
+        """检查所有胜利条件
+        
+        一次遍历所有玩家；优先级仍为 道行 > 区域控制 > 文化，
+        同类条件下先达成的玩家（座位靠前）获胜。
+        各项最大值都未达到阈值时直接返回，无需逐个玩家检查。
+        """
+        if (self._max_dao_xing < 20 and self._max_zones_controlled < 5
+                and self._max_culture < 50):
+            return {'winner': None, 'type': None}
+        
+        zone_winner = None
+        culture_winner = None
+        for sim in players:
+            player = sim.player
+            # 检查道行胜利
             if player.dao_xing >= 20:
                 return {'winner': player, 'type': 'dao_xing'}
-        
-        # 检查区域控制胜利
-        for player in game_state.players:
-            controlled_zones = 0
-            if hasattr(player, 'influence') and isinstance(player.influence, dict):
-                controlled_zones = sum(1 for zone in Zone if 
-                                     zone in player.influence and 
-                                     player.influence[zone] >= 5)
-            if controlled_zones >= 5:
-                return {'winner': player, 'type': 'zone_control'}
-        
-        # 检查文化胜利
-        for player in game_state.players:
-            yin_qi = getattr(player, 'yin_qi', 0)
-            yang_qi = getattr(player, 'yang_qi', 0)
-            wuxing_total = 0
-            if hasattr(player, 'wuxing_affinities') and isinstance(player.wuxing_affinities, dict):
-                wuxing_total = sum(player.wuxing_affinities.values())
             
-            total_culture = yin_qi + yang_qi + wuxing_total
-            if total_culture >= 50:
-                return {'winner': player, 'type': 'culture'}
-        
+            # 检查区域控制胜利
+            if zone_winner is None:
+                if sum(1 for count in sim.influence if count >= 5) >= 5:
+                    zone_winner = player
+            
+            # 检查文化胜利
+            if culture_winner is None:
+                total_culture = sim.yin_qi + sim.yang_qi + sum(player.wuxing_affinities.values())
+                if total_culture >= 50:
+                    culture_winner = player
+        
+        if zone_winner is not None:
+            return {'winner': zone_winner, 'type': 'zone_control'}
+        if culture_winner is not None:
+            return {'winner': culture_winner, 'type': 'culture'}
         return {'winner': None, 'type': None}
     
-    def _is_stalemate(self, game_state: GameState, turn_count: int) -> bool:
+    def _is_stalemate(self, players: List[_SimPlayer], turn_count: int) -> bool:
         """检查是否陷入僵局"""
         if turn_count > 80:  # 超过80回合认为是僵局
             return True
         
         # 检查是否所有玩家都无法行动
-        active_players = sum(1 for p in game_state.players if p.is_active and p.ap > 0)
+        active_players = sum(1 for sim in players if sim.is_active and sim.ap > 0)
         return active_players == 0
     
-    def _calculate_final_scores(self, game_state: GameState) -> Dict[str, int]:
-        """计算最终分数"""
+    def _calculate_final_scores(self, players: List[_SimPlayer],
+                                influence_totals: List[int]) -> Dict[str, int]:
+        """计算最终分数（influence_totals为各玩家影响力总和，与资源分布共用）"""
         scores = {}
-        for player in game_state.players:
-            # 安全地获取影响力总和
-            influence_total = 0
-            if hasattr(player, 'influence') and isinstance(player.influence, dict):
-                influence_total = sum(player.influence.values())
-            elif hasattr(player, 'influence_markers'):
-                influence_total = player.influence_markers
-            
-            # 安全地获取阴阳气
-            yin_qi = getattr(player, 'yin_qi', 0)
-            yang_qi = getattr(player, 'yang_qi', 0)
-            
+        for sim, influence_total in zip(players, influence_totals):
+            player = sim.player
             score = (player.dao_xing * 5 + 
                     player.qi + 
                     influence_total +
-                    (yin_qi + yang_qi) * 2)
+                    (sim.yin_qi + sim.yang_qi) * 2)
             scores[player.name] = score
         return scores
     
-    def _analyze_resource_distribution(self, game_state: GameState) -> Dict[str, Any]:
-        """分析资源分布"""
-        influence_totals = []
-        for p in game_state.players:
-            if hasattr(p, 'influence') and isinstance(p.influence, dict):
-                influence_totals.append(sum(p.influence.values()))
-            elif hasattr(p, 'influence_markers'):
-                influence_totals.append(p.influence_markers)
-            else:
-                influence_totals.append(0)
+    def _analyze_resource_distribution(self, players: List[_SimPlayer]) -> Dict[str, Any]:
+        """分析资源分布（一次遍历玩家，填充预先分配的列表）"""
+        num_players = len(players)
+        qi_distribution = [0] * num_players
+        dao_xing_distribution = [0] * num_players
+        influence_distribution = [0] * num_players
+        for i, sim in enumerate(players):
+            qi_distribution[i] = sim.player.qi
+            dao_xing_distribution[i] = sim.player.dao_xing
+            influence_distribution[i] = sum(sim.influence)
         
         resources = {
-            'qi_distribution': [p.qi for p in game_state.players],
-            'dao_xing_distribution': [p.dao_xing for p in game_state.players],
-            'influence_distribution': influence_totals
+            'qi_distribution': qi_distribution,
+            'dao_xing_distribution': dao_xing_distribution,
+            'influence_distribution': influence_distribution
         }
         return resources
     
     def _print_intermediate_stats(self, completed_games: int):
         """打印中间统计信息"""
-        if not self.game_results:
+        if not self.games_completed:
             return
         
         print(f"\n\n📊 中间统计 ({completed_games} 局):")
         
         # 胜利类型分布
-        victory_types = [r['victory_type'] for r in self.game_results if r['victory_type']]
-        if victory_types:
-            victory_counter = Counter(victory_types)
+        victory_counter = self.victory_counter
+        total_victories = self.total_victories
+        if total_victories:
             print("胜利类型分布:")
             for vtype, count in victory_counter.most_common():
-                print(f"  {vtype}: {count} 次 ({count/len(victory_types)*100:.1f}%)")
+                print(f"  {vtype}: {count} 次 ({count/total_victories*100:.1f}%)")
         
         # 平均游戏时长
-        durations = [r['game_duration'] for r in self.game_results]
-        avg_duration = statistics.mean(durations)
-        print(f"平均游戏时长: {avg_duration:.2f} 秒")
+        print(f"平均游戏时长: {self.duration_stats.mean:.2f} 秒")
         
         # 平均回合数
-        turns = [r['turns'] for r in self.game_results]
-        avg_turns = statistics.mean(turns)
-        print(f"平均回合数: {avg_turns:.1f}")
+        print(f"平均回合数: {self.turn_stats.mean:.1f}")
     
     def _analyze_results(self):
         """分析测试结果并生成优化建议"""
@@ -313,6 +516,11 @@ class GameAnalyzer:
         print("🔍 游戏分析报告")
         print("="*60)
         
+        # 汇总统计在没有样本时没有意义（均值为0、极值为None），直接提示而不是输出错误数据
+        if not self.games_completed:
+            print("\n⚠️ 没有成功完成的游戏，无法生成分析报告")
+            return
+        
         self._analyze_game_balance()
         self._analyze_performance()
         self._analyze_ai_behavior()
@@ -326,11 +534,10 @@ class GameAnalyzer:
         print("\n📊 游戏平衡性分析:")
         
         # 胜利条件分析
-        victory_types = [r['victory_type'] for r in self.game_results if r['victory_type']]
-        victory_counter = Counter(victory_types)
+        victory_counter = self.victory_counter
         
         print("胜利条件分布:")
-        total_victories = len(victory_types)
+        total_victories = self.total_victories
         for vtype, count in victory_counter.most_common():
             percentage = count / total_victories * 100
             print(f"  {vtype}: {count} 次 ({percentage:.1f}%)")
@@ -350,10 +557,9 @@ class GameAnalyzer:
                 })
         
         # 游戏时长分析
-        turns = [r['turns'] for r in self.game_results]
-        avg_turns = statistics.mean(turns)
-        max_turns = max(turns)
-        min_turns = min(turns)
+        avg_turns = self.turn_stats.mean
+        max_turns = self.turn_stats.max
+        min_turns = self.turn_stats.min
         
         print(f"\n回合数统计:")
         print(f"  平均: {avg_turns:.1f} 回合")
@@ -377,9 +583,8 @@ class GameAnalyzer:
         """分析性能问题"""
         print("\n⚡ 性能分析:")
         
-        durations = [r['game_duration'] for r in self.game_results]
-        avg_duration = statistics.mean(durations)
-        max_duration = max(durations)
+        avg_duration = self.duration_stats.mean
+        max_duration = self.duration_stats.max
         
         print(f"平均游戏时长: {avg_duration:.2f} 秒")
         print(f"最长游戏时长: {max_duration:.2f} 秒")
@@ -396,10 +601,10 @@ class GameAnalyzer:
         print("\n🤖 AI行为分析:")
         
         # 统计僵局情况
-        stalemates = sum(1 for r in self.game_results if r['victory_type'] == 'stalemate')
-        stalemate_rate = stalemates / len(self.game_results) * 100
+        stalemates = self.victory_counter['stalemate']
+        stalemate_rate = stalemates / self.games_completed * 100
         
-        print(f"僵局率: {stalemate_rate:.1f}% ({stalemates}/{len(self.game_results)})")
+        print(f"僵局率: {stalemate_rate:.1f}% ({stalemates}/{self.games_completed})")
         
         if stalemate_rate > 20:
             self.balance_issues.append({
@@ -440,41 +645,64 @@ class GameAnalyzer:
         """保存分析报告到文件"""
         report = {
             'summary': {
-                'total_games': len(self.game_results),
-                'avg_turns': statistics.mean([r['turns'] for r in self.game_results]),
-                'avg_duration': statistics.mean([r['game_duration'] for r in self.game_results]),
-                'victory_distribution': dict(Counter([r['victory_type'] for r in self.game_results if r['victory_type']]))
+                'total_games': self.games_completed,
+                'avg_turns': self.turn_stats.mean,
+                'turns_variance': self.turn_stats.variance,
+                'avg_duration': self.duration_stats.mean,
+                'duration_variance': self.duration_stats.variance,
+                'victory_distribution': dict(self.victory_counter)
             },
             'balance_issues': self.balance_issues,
-            'detailed_results': self.game_results
+            'detailed_results_file': RESULTS_PATH
         }
         
-        with open('game_analysis_report.json', 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        with open('game_analysis_report.json', 'wb') as f:
+            f.write(_json_bytes(report, indent=True))
         
-        print(f"\n📄 详细报告已保存到: game_analysis_report.json")
+        print(f"\n📄 分析报告已保存到: game_analysis_report.json")
+        print(f"📄 逐局结果已保存到: {RESULTS_PATH}")
+
+PROFILE_PATH = 'profile.prof'
+
 
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description="天机变游戏自动化优化测试")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"使用cProfile剖析测试过程（单进程运行），结果保存到 {PROFILE_PATH}"
+    )
+    args = parser.parse_args()
+    
     print("🎯 天机变游戏自动化优化测试")
     print("="*60)
     
-    # 设置随机种子以便复现
-    random.seed(42)
-    
     analyzer = GameAnalyzer()
+    profiler = cProfile.Profile() if args.profile else None
     
     try:
-        analyzer.run_automated_tests(100)
+        # 固定基准种子以便复现
+        if profiler is None:
+            analyzer.run_automated_tests(100, seed=42)
+        else:
+            # 子进程中的调用无法被剖析，因此在当前进程内顺序运行
+            with profiler:
+                analyzer.run_automated_tests(100, seed=42, processes=1)
     except KeyboardInterrupt:
         print("\n\n⏹️ 测试被用户中断")
-        if analyzer.game_results:
+        if analyzer.games_completed:
             print("正在分析已完成的游戏...")
             analyzer._analyze_results()
     except Exception as e:
         print(f"\n❌ 测试过程中出现错误: {e}")
         import traceback
         traceback.print_exc()
+    
+    if profiler is not None:
+        profiler.dump_stats(PROFILE_PATH)
+        print(f"\n⏱️ 性能剖析结果已保存到: {PROFILE_PATH}（按累计耗时前30项如下）")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(30)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,22 +1,21 @@
-from typing import Dict, Any
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 # No game state imports are needed here, as the logic only needs the
 # final generated action menu. This keeps the bot logic decoupled.
 
-def get_bot_choice(valid_actions: Dict[int, Dict[str, Any]]) -> int:
+def get_bot_choice(valid_actions: List[Dict[str, Any]]) -> int:
     """
     A very simple bot logic.
     It will choose the first available action that is not 'pass'.
     If 'pass' is the only option, it will choose that.
     """
     # Find the first non-pass action
-    for key, action_data in valid_actions.items():
+    for key, action_data in enumerate(valid_actions, 1):
         if action_data["action"] != "pass":
             return key
 
     # If only "pass" is available, find its key and return it
-    for key, action_data in valid_actions.items():
+    for key, action_data in enumerate(valid_actions, 1):
         if action_data["action"] == "pass":
             return key
 
@@ -19,4 +19,5 @@ class GuaCard:
             raise ValueError("A GuaCard must have exactly 6 tasks.")
         self.name = name
         self.associated_guas = associated_guas
+        self._gua_list = tuple(associated_guas)
         self.tasks = tasks
@@ -8,10 +8,13 @@
 import sys
 import time
 import random
-from typing import Dict, List, Optional, Tuple
+from functools import partial
+from itertools import islice
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 # 导入所有必要模块
 from game_state import GameState, Player, GameBoard
+from game_data import EMPEROR_AVATAR, HERMIT_AVATAR
 from ui_enhancement import enhanced_print, enhanced_input, ui_enhancement
 from advanced_strategy_system import (
     advanced_strategy_system, display_hexagram_strategy_guide
@@ -25,17 +28,150 @@ from achievement_system import achievement_system
 from generate_64_guas import generate_all_64_guas, GUA_64_INFO
 from yijing_mechanics import YinYang, WuXing
 
+# AI前瞻搜索深度（按难度）
+_SEARCH_DEPTH = {"easy": 1, "normal": 2, "hard": 3, "master": 4}
+# 搜索模型中资源行动的期望收益 (气, 道行, 诚意)，与对应行动随机收益的均值一致
+_SEARCH_GAINS = {"meditate": (3, 0, 0), "study": (0, 2, 0), "cultivate": (0, 0, 2)}
+_SEARCH_WIN_SCORE = 10000
+
+# 置换表条目类型：精确值 / 下界（发生beta剪枝）/ 上界（所有分支都不超过alpha）
+_TT_EXACT, _TT_LOWER, _TT_UPPER = 0, 1, 2
+_TRANSPOSITION_TABLE_SIZE = 100000
+
+# 菜单选项在导入时构建一次；*_TEXT 为可一次写出的完整菜单文本
+_MAIN_MENU = (
+    "1. [书] 教学模式 - 学习易经智慧",
+    "2. [游戏] 单人游戏 - 挑战AI对手",
+    "3. [战斗] AI对战 - 观看AI智慧对决",
+    "4. [书] 卦象指南 - 深入了解64卦",
+    "5. 🧠 策略指南 - 掌握高级策略",
+    "6. 🏆 成就系统 - 查看游戏成就",
+    "7. ⚙️ 游戏设置 - 自定义体验",
+    "8. 🚪 退出游戏",
+)
+_TUTORIAL_MENU = (
+    "1. 基础入门 - 易经基本概念",
+    "2. 卦象系统 - 64卦详解",
+    "3. 策略进阶 - 高级游戏技巧",
+    "4. 实战演练 - 模拟对战",
+    "5. 返回主菜单",
+)
+_ACTION_MENU = (
+    "1. 🧘 冥想 - 恢复气力",
+    "2. [书] 研习 - 增进道行",
+    "3. 🙏 修心 - 提升诚意",
+    "4. [地图] 探索 - 寻找新区域",
+    "5. [战斗] 高级策略 - 使用易经智慧",
+    "6. [统计] 卦象分析 - 查看卦象关系",
+    "7. 📈 查看状态 - 详细信息",
+    "8. [提示] 获取提示 - AI建议",
+)
+_SETTINGS_MENU = (
+    "1. 🎨 UI主题设置",
+    "2. 🔊 音效设置",
+    "3. [电] 游戏速度",
+    "4. 🤖 AI难度",
+    "5. [统计] 统计信息",
+    "6. 🔄 重置数据",
+    "7. 返回主菜单",
+)
+_DIFFICULTY_MENU = (
+    "1. 简单 - AI较为保守",
+    "2. 普通 - 平衡的AI策略",
+    "3. 困难 - AI更加激进",
+    "4. 大师 - AI使用高级策略",
+)
+
+
+def _compose_menu(options: Tuple[str, ...]) -> str:
+    """将菜单选项拼成缩进的多行文本"""
+    return "  " + "\n  ".join(options) + "\n"
+
+
+_MAIN_MENU_TEXT = _compose_menu(_MAIN_MENU) + "\n"
+_TUTORIAL_MENU_TEXT = _compose_menu(_TUTORIAL_MENU) + "\n"
+_ACTION_MENU_TEXT = _compose_menu(_ACTION_MENU) + "\n"
+_SETTINGS_MENU_TEXT = _compose_menu(_SETTINGS_MENU) + "\n"
+_DIFFICULTY_MENU_TEXT = "\n选择难度等级:\n" + _compose_menu(_DIFFICULTY_MENU)
+
+
+class _SearchState(NamedTuple):
+    """AI搜索用的轻量局面快照，只记录数值，不引用也不修改真实棋盘
+    
+    基于元组实现：创建和哈希（置换表查找）都在C层完成，比冻结dataclass快得多。
+    """
+    resources: Tuple[Tuple[int, int, int], ...]  # 各玩家 (气, 道行, 诚意)
+    zone_counts: Tuple[int, ...]  # 各玩家控制的区域数
+    neutral_zones: int
+    to_move: int
+
+
 class CompleteEnhancedGame:
     """完整增强版游戏主类"""
     
-    def __init__(self):
+    def __init__(self, interactive: bool = True, seed: Optional[int] = None):
         self.game_state = None
+        # 独立的随机数生成器；指定seed时整局游戏可复现
+        self._rng = random.Random(seed)
         self.tutorial_system = TutorialSystem()
         self.ai_players = create_ai_players()
+        self._ai_names: Tuple[str, ...] = tuple(self.ai_players)
         self.current_ai_opponent = None
         self.game_mode = None
         self.difficulty_level = "normal"
         
+        # 节奏控制：只有真人参与时才停顿；interactive为False时AI对战不再等待回车
+        self.interactive = interactive
+        self.pacing_delay = 0.0
+        
+        # 菜单分发表：选项 -> 处理函数
+        self._main_menu = {
+            "1": self._start_tutorial,
+            "2": self._start_single_player,
+            "3": self._start_ai_battle,
+            "4": self._show_hexagram_guide,
+            "5": self._show_strategy_guide,
+            "6": self._show_achievements,
+            "7": self._show_game_settings,
+        }
+        # 教学系统的入口在调用时才解析
+        self._tutorial_menu = {
+            "1": lambda: self.tutorial_system.start_basic_tutorial(),
+            "2": lambda: self.tutorial_system.start_hexagram_tutorial(),
+            "3": lambda: self.tutorial_system.start_strategy_tutorial(),
+            "4": self._start_tutorial_battle,
+        }
+        self._settings_menu = {
+            "1": self._ui_theme_settings,
+            "2": partial(enhanced_print, "音效设置功能开发中...", "info"),
+            "3": partial(enhanced_print, "游戏速度设置功能开发中...", "info"),
+            "4": partial(enhanced_print, "AI难度设置功能开发中...", "info"),
+            "5": partial(enhanced_print, "统计信息功能开发中...", "info"),
+            "6": self._confirm_reset_data,
+        }
+        # 行动选项 -> (处理函数, 是否结束回合)；高级策略在未选定策略时（返回False）不结束回合
+        self._action_menu = {
+            "1": (self._handle_meditate, True),
+            "2": (self._handle_study, True),
+            "3": (self._handle_cultivate, True),
+            "4": (self._handle_explore, True),
+            "5": (self._handle_strategy_action, True),
+            "6": (self._show_hexagram_analysis, False),
+            "7": (self._show_detailed_status, False),
+            "8": (self._show_ai_hint, False),
+        }
+        
+        # 画面是否需要重绘：游戏状态改变或其他界面覆盖了状态画面时置为True
+        self._screen_dirty = True
+        
+        # 区域缓存：棋盘顺序与中性区域集合（控制者索引由棋盘的 owner_index 维护）
+        self._zone_order: Dict[str, int] = {}
+        self._total_zones = 0
+        self._neutral_zones: Set[str] = set()
+        
+        # 搜索置换表：(局面, 视角玩家) -> (深度, 价值, 类型, 最佳行动)
+        self._transposition_table: Dict[Tuple[_SearchState, int], Tuple[int, float, int, str]] = {}
+        
     def start_game(self):
         """启动游戏"""
         ui_enhancement.clear_screen()
@@ -44,23 +180,13 @@ class CompleteEnhancedGame:
         while True:
             choice = self._show_main_menu()
             
-            if choice == "1":
-                self._start_tutorial()
-            elif choice == "2":
-                self._start_single_player()
-            elif choice == "3":
-                self._start_ai_battle()
-            elif choice == "4":
-                self._show_hexagram_guide()
-            elif choice == "5":
-                self._show_strategy_guide()
-            elif choice == "6":
-                self._show_achievements()
-            elif choice == "7":
-                self._show_game_settings()
-            elif choice == "8":
+            if choice == "8":
                 enhanced_print("感谢游玩天机变！愿易经智慧伴您前行。", "success")
                 break
+            
+            handler = self._main_menu.get(choice)
+            if handler:
+                handler()
             else:
                 enhanced_print("无效选择，请重试", "warning")
     
@@ -90,20 +216,7 @@ class CompleteEnhancedGame:
         ui_enhancement.clear_screen()
         print(ui_enhancement.create_title("主菜单", "选择您的游戏模式"))
         
-        menu_options = [
-            "1. [书] 教学模式 - 学习易经智慧",
-            "2. [游戏] 单人游戏 - 挑战AI对手", 
-            "3. [战斗] AI对战 - 观看AI智慧对决",
-            "4. [书] 卦象指南 - 深入了解64卦",
-            "5. 🧠 策略指南 - 掌握高级策略",
-            "6. 🏆 成就系统 - 查看游戏成就",
-            "7. ⚙️ 游戏设置 - 自定义体验",
-            "8. 🚪 退出游戏"
-        ]
-        
-        for option in menu_options:
-            print(f"  {option}")
-        print()
+        sys.stdout.write(_MAIN_MENU_TEXT)
         
         return enhanced_input("请选择 (1-8): ")
     
@@ -112,30 +225,15 @@ class CompleteEnhancedGame:
         ui_enhancement.clear_screen()
         print(ui_enhancement.create_title("教学模式", "易经智慧学习之旅"))
         
-        tutorial_options = [
-            "1. 基础入门 - 易经基本概念",
-            "2. 卦象系统 - 64卦详解",
-            "3. 策略进阶 - 高级游戏技巧",
-            "4. 实战演练 - 模拟对战",
-            "5. 返回主菜单"
-        ]
-        
-        for option in tutorial_options:
-            print(f"  {option}")
-        print()
+        sys.stdout.write(_TUTORIAL_MENU_TEXT)
         
         choice = enhanced_input("请选择教学内容 (1-5): ")
-        
-        if choice == "1":
-            self.tutorial_system.start_basic_tutorial()
-        elif choice == "2":
-            self.tutorial_system.start_hexagram_tutorial()
-        elif choice == "3":
-            self.tutorial_system.start_strategy_tutorial()
-        elif choice == "4":
-            self._start_tutorial_battle()
-        elif choice == "5":
+        if choice == "5":
             return
+        
+        handler = self._tutorial_menu.get(choice)
+        if handler:
+            handler()
         else:
             enhanced_print("无效选择", "warning")
         
@@ -147,11 +245,11 @@ class CompleteEnhancedGame:
         print(ui_enhancement.create_title("单人游戏", "选择您的对手"))
         
         # 选择AI对手
-        ai_list = list(self.ai_players.keys())
+        ai_list = self._ai_names
         
         print("可选择的AI对手:")
-        for i, (name, ai_player) in enumerate(self.ai_players.items(), 1):
-            print(f"  {i}. {name} ({ai_player.personality.value})")
+        for i, name in enumerate(ai_list, 1):
+            print(f"  {i}. {name} ({self.ai_players[name].personality.value})")
         print(f"  {len(ai_list) + 1}. 随机选择")
         print()
         
@@ -162,7 +260,7 @@ class CompleteEnhancedGame:
                 ai_name = ai_list[choice - 1]
                 self.current_ai_opponent = self.ai_players[ai_name]
             elif choice == len(ai_list) + 1:
-                ai_name = random.choice(ai_list)
+                ai_name = self._rng.choice(ai_list)
                 self.current_ai_opponent = self.ai_players[ai_name]
             else:
                 enhanced_print("无效选择", "warning")
@@ -185,10 +283,8 @@ class CompleteEnhancedGame:
         ui_enhancement.clear_screen()
         print(ui_enhancement.create_title("AI对战", "观看智能AI的策略对决"))
         
-        # 随机选择两个AI
-        ai_list = list(self.ai_players.keys())
-        ai1_name = random.choice(ai_list)
-        ai2_name = random.choice([name for name in ai_list if name != ai1_name])
+        # 随机选择两个不同的AI
+        ai1_name, ai2_name = self._rng.sample(self._ai_names, 2)
         
         ai1 = self.ai_players[ai1_name]
         ai2 = self.ai_players[ai2_name]
@@ -199,15 +295,11 @@ class CompleteEnhancedGame:
         
         confirm = enhanced_input("开始AI对战? (y/n): ").lower()
         if confirm == 'y':
-            self._run_ai_vs_ai_battle(ai1, ai2)
+            self._run_ai_vs_ai_battle_interactive(ai1, ai2)
     
     def _select_difficulty(self):
         """选择难度等级"""
-        print("\n选择难度等级:")
-        print("  1. 简单 - AI较为保守")
-        print("  2. 普通 - 平衡的AI策略")
-        print("  3. 困难 - AI更加激进")
-        print("  4. 大师 - AI使用高级策略")
+        sys.stdout.write(_DIFFICULTY_MENU_TEXT)
         
         try:
             choice = int(enhanced_input("请选择难度 (1-4): "))
@@ -241,6 +333,7 @@ class CompleteEnhancedGame:
     def _initialize_game(self, mode: str):
         """初始化游戏"""
         self.game_mode = mode
+        self.pacing_delay = 1.0 if mode == "single_player" and self.interactive else 0.0
         
         # 创建玩家
         if mode == "single_player":
@@ -254,6 +347,7 @@ class CompleteEnhancedGame:
         
         # 创建游戏状态
         self.game_state = GameState(players)
+        self._init_zone_cache()
         
         # 初始化增强系统
         for player in players:
@@ -261,21 +355,60 @@ class CompleteEnhancedGame:
             achievement_system.initialize_player(player.name)
         
         enhanced_print("游戏初始化完成！", "success")
-        time.sleep(1)
+        self._pause()
+    
+    def _pause(self):
+        """按当前节奏设置停顿，便于真人观察；无人观看时不停顿"""
+        if self.pacing_delay:
+            time.sleep(self.pacing_delay)
+    
+    def _init_zone_cache(self):
+        """遍历一次棋盘，建立区域缓存"""
+        gua_zones = self.game_state.board.gua_zones
+        self._zone_order = {zone_name: i for i, zone_name in enumerate(gua_zones)}
+        self._total_zones = len(gua_zones)
+        self._transposition_table = {}  # 条目依赖棋盘规模，换局时清空
+        self._neutral_zones = {
+            zone_name for zone_name, zone_data in gua_zones.items() if not zone_data.get("controller")
+        }
+    
+    def _set_controller(self, zone_name: str, player_name: str):
+        """设置区域控制者，并同步更新中性区域缓存"""
+        board = self.game_state.board
+        previous = board.gua_zones[zone_name].get("controller")
+        if previous == player_name:
+            return
+        
+        # 棋盘替换区域记录并维护控制者索引
+        board.set_zone_controller(zone_name, player_name)
+        if not previous:
+            self._neutral_zones.discard(zone_name)
+    
+    def _ordered_zones(self, zones: Iterable[str]) -> List[str]:
+        """按棋盘顺序排列区域（用于显示和编号选择）"""
+        return sorted(zones, key=self._zone_order.__getitem__)
     
     def _run_game_loop(self):
         """运行游戏主循环"""
-        ui_enhancement.clear_screen()
-        print(ui_enhancement.create_title("游戏开始", f"第 {self.game_state.turn} 回合"))
-        
-        while not self._check_victory_conditions():
-            current_player = self.game_state.get_current_player()
+        # 循环内反复使用的对象先绑定为局部变量
+        game_state = self.game_state
+        ui = ui_enhancement
+        ss = advanced_strategy_system
+        ai_name = self.current_ai_opponent.name
+        
+        ui.clear_screen()
+        print(ui.create_title("游戏开始", f"第 {game_state.turn} 回合"))
+        
+        last_actor = None
+        self._screen_dirty = True
+        while not self._check_victory_conditions(last_actor):
+            current_player = game_state.get_current_player()
             
             # 显示游戏状态
-            self._display_game_status()
+            self._redraw_if_dirty(self._display_game_status)
             
             # 玩家回合
-            if current_player.name == self.current_ai_opponent.name:
+            if current_player.name == ai_name:
                 # AI回合
                 self._handle_ai_turn(current_player)
             else:
@@ -283,22 +416,31 @@ class CompleteEnhancedGame:
                 self._handle_human_turn(current_player)
             
             # 更新冷却时间
-            advanced_strategy_system.update_cooldowns(current_player.name)
+            ss.update_cooldowns(current_player.name)
             
             # 检查成就
-            achievement_system.check_achievements(current_player.name, self.game_state)
+            achievement_system.check_achievements(current_player.name, game_state)
             
             # 下一回合
-            self.game_state.next_turn()
+            self._advance_turn()
+            last_actor = current_player
+            self._screen_dirty = True
             
-            time.sleep(1)  # 短暂暂停
+            self._pause()  # 短暂暂停
         
         # 游戏结束
         self._handle_game_end()
     
-    def _display_game_status(self):
-        """显示游戏状态"""
+    def _redraw_if_dirty(self, render_fn):
+        """仅当画面过期时清屏并重绘，避免重复输出相同内容"""
+        if not self._screen_dirty:
+            return
         ui_enhancement.clear_screen()
+        render_fn()
+        self._screen_dirty = False
+    
+    def _display_game_status(self):
+        """显示游戏状态（由 _redraw_if_dirty 负责清屏）"""
         current_player = self.game_state.get_current_player()
         
         print(ui_enhancement.create_title(f"第 {self.game_state.turn} 回合", f"{current_player.name} 的回合"))
@@ -310,25 +452,27 @@ class CompleteEnhancedGame:
         self._display_board_status()
         
         # 显示最近的重要事件
-        if hasattr(self.game_state, 'recent_events'):
-            if self.game_state.recent_events:
-                print(ui_enhancement.create_section_header("最近事件"))
-                for event in self.game_state.recent_events[-3:]:
-                    print(f"• {event}")
-                print()
+        recent_events = self.game_state.recent_events
+        if recent_events:
+            print(ui_enhancement.create_section_header("最近事件"))
+            # deque不支持切片，只取最后3条
+            for event in islice(recent_events, max(len(recent_events) - 3, 0), None):
+                print(f"• {event}")
+            print()
     
     def _display_player_status(self, player: Player):
         """显示玩家状态"""
         print(ui_enhancement.create_section_header(f"{player.name} 的状态"))
         
         # 创建状态表格
-        headers = ["资源", "数值", "状态"]
-        rows = [
-            ["气", str(player.qi), "[火]" if player.qi >= 8 else "[电]" if player.qi >= 5 else "💧"],
-            ["道行", str(player.dao_xing), "[星]" if player.dao_xing >= 8 else "[闪]" if player.dao_xing >= 5 else "[星]"],
-            ["诚意", str(player.cheng_yi), "[钻]" if player.cheng_yi >= 8 else "💍" if player.cheng_yi >= 5 else "🔮"],
-            ["阴阳平衡", f"{player.yin_yang_balance:.2f}", "[阴阳]" if abs(player.yin_yang_balance - 0.5) < 0.1 else "[平衡]"]
-        ]
+        # 使用元组，表格渲染可直接命中缓存
+        headers = ("资源", "数值", "状态")
+        rows = (
+            ("气", str(player.qi), "[火]" if player.qi >= 8 else "[电]" if player.qi >= 5 else "💧"),
+            ("道行", str(player.dao_xing), "[星]" if player.dao_xing >= 8 else "[闪]" if player.dao_xing >= 5 else "[星]"),
+            ("诚意", str(player.cheng_yi), "[钻]" if player.cheng_yi >= 8 else "💍" if player.cheng_yi >= 5 else "🔮"),
+            ("阴阳平衡", f"{player.yin_yang_balance:.2f}", "[阴阳]" if abs(player.yin_yang_balance - 0.5) < 0.1 else "[平衡]"),
+        )
         
         table = ui_enhancement.create_table(headers, rows)
         print(table)
@@ -338,125 +482,234 @@ class CompleteEnhancedGame:
         """显示棋盘状态"""
         print(ui_enhancement.create_section_header("棋盘状态"))
         
-        controlled_zones = {}
-        neutral_zones = []
-        
-        for zone_name, zone_data in self.game_state.board.gua_zones.items():
-            controller = zone_data.get("controller")
-            if controller:
-                if controller not in controlled_zones:
-                    controlled_zones[controller] = []
-                controlled_zones[controller].append(zone_name)
-            else:
-                neutral_zones.append(zone_name)
+        controlled_zones = {
+            player_name: self._ordered_zones(zones)
+            for player_name, zones in self.game_state.board.owner_index.items()
+        }
+        neutral_zones = self._ordered_zones(self._neutral_zones)
         
-        # 显示控制情况
+        # 显示控制情况：每个区域列表拼成一段文本后一次写出
+        rows = []
         for player_name, zones in controlled_zones.items():
-            print(f"{player_name} 控制的区域 ({len(zones)}个):")
-            for i, zone in enumerate(zones):
-                if i % 4 == 0 and i > 0:
-                    print()
-                print(f"  {zone}", end="")
-            print("\n")
+            rows.append(f"{player_name} 控制的区域 ({len(zones)}个):\n")
+            rows.append(self._format_zone_rows(zones))
+            rows.append("\n\n")
         
         if neutral_zones:
-            print(f"中性区域 ({len(neutral_zones)}个):")
-            for i, zone in enumerate(neutral_zones[:8]):  # 只显示前8个
-                if i % 4 == 0 and i > 0:
-                    print()
-                print(f"  {zone}", end="")
+            rows.append(f"中性区域 ({len(neutral_zones)}个):\n")
+            rows.append(self._format_zone_rows(neutral_zones[:8]))  # 只显示前8个
             if len(neutral_zones) > 8:
-                print(f"  ... 还有{len(neutral_zones) - 8}个")
-            print("\n")
+                rows.append(f"  ... 还有{len(neutral_zones) - 8}个\n")
+            rows.append("\n\n")
+        
+        sys.stdout.write("".join(rows))
+    
+    @staticmethod
+    def _format_zone_rows(zones: List[str]) -> str:
+        """将区域按每行4个排版"""
+        return "\n".join(
+            "".join(f"  {zone}" for zone in zones[i:i + 4])
+            for i in range(0, len(zones), 4)
+        )
     
     def _handle_human_turn(self, player: Player):
         """处理人类玩家回合"""
         while True:
+            # 卦象分析等界面覆盖了状态画面时，先恢复状态画面
+            self._redraw_if_dirty(self._display_game_status)
             print(ui_enhancement.create_section_header("行动选择"))
             
-            actions = [
-                "1. 🧘 冥想 - 恢复气力",
-                "2. [书] 研习 - 增进道行", 
-                "3. 🙏 修心 - 提升诚意",
-                "4. [地图] 探索 - 寻找新区域",
-                "5. [战斗] 高级策略 - 使用易经智慧",
-                "6. [统计] 卦象分析 - 查看卦象关系",
-                "7. 📈 查看状态 - 详细信息",
-                "8. [提示] 获取提示 - AI建议"
-            ]
-            
-            for action in actions:
-                print(f"  {action}")
-            print()
+            sys.stdout.write(_ACTION_MENU_TEXT)
             
             choice = enhanced_input("请选择行动 (1-8): ")
             
-            if choice == "1":
-                self._handle_meditate(player)
-                break
-            elif choice == "2":
-                self._handle_study(player)
-                break
-            elif choice == "3":
-                self._handle_cultivate(player)
-                break
-            elif choice == "4":
-                self._handle_explore(player)
-                break
-            elif choice == "5":
-                if self._handle_strategy_action(player):
-                    break
-            elif choice == "6":
-                self._show_hexagram_analysis(player)
-            elif choice == "7":
-                self._show_detailed_status(player)
-            elif choice == "8":
-                self._show_ai_hint(player)
-            else:
+            entry = self._action_menu.get(choice)
+            if entry is None:
                 enhanced_print("无效选择，请重试", "warning")
+                continue
+            
+            handler, ends_turn = entry
+            if handler(player) is not False and ends_turn:
+                self._screen_dirty = True
+                break
     
     def _handle_ai_turn(self, player: Player):
         """处理AI回合"""
         enhanced_print(f"{player.name} 正在思考...", "info")
-        time.sleep(1)
+        self._pause()
         
-        # AI决策
+        # AI决策：策略行动沿用AI自身判断，其余行动经前瞻搜索确定
         action = self.current_ai_opponent.make_decision(player, self.game_state)
+        if not action.startswith("strategy:"):
+            action = self._search_ai_action(player, action)
         
         # 执行AI行动
         if action.startswith("strategy:"):
             strategy_name = action.split(":", 1)[1]
-            available_strategies = advanced_strategy_system.get_available_strategies(player, self.game_state)
-            
-            for strategy in available_strategies:
-                if strategy.name == strategy_name:
-                    advanced_strategy_system.execute_strategy_action(player, self.game_state, strategy)
-                    break
+            strategy = advanced_strategy_system.get_available_strategy(player, self.game_state, strategy_name)
+            if strategy:
+                advanced_strategy_system.execute_strategy_action(player, self.game_state, strategy)
         
         elif action.startswith("claim:"):
             zone_name = action.split(":", 1)[1]
-            if zone_name in self.game_state.board.gua_zones:
-                if not self.game_state.board.gua_zones[zone_name].get("controller"):
-                    self.game_state.board.gua_zones[zone_name]["controller"] = player.name
-                    enhanced_print(f"{player.name} 控制了 {zone_name}", "success")
+            zone_data = self.game_state.board.gua_zones.get(zone_name)
+            if zone_data and not zone_data.get("controller"):
+                self._set_controller(zone_name, player.name)
+                enhanced_print(f"{player.name} 控制了 {zone_name}", "success")
         
         elif action == "meditate":
             self._handle_meditate(player)
         elif action == "study":
             self._handle_study(player)
+        elif action == "cultivate":
+            self._handle_cultivate(player)
         elif action == "explore":
             self._handle_explore(player)
         
         # 显示AI状态报告
-        if random.random() < 0.3:  # 30%概率显示详细报告
+        if self._rng.random() < 0.3:  # 30%概率显示详细报告
             report = self.current_ai_opponent.get_ai_status_report(player, self.game_state)
             enhanced_print(report, "info")
         
         enhanced_input("按回车键继续...")
     
+    def _search_ai_action(self, player: Player, preferred: str) -> str:
+        """用alpha-beta剪枝的极小极大搜索为AI选择行动
+        
+        搜索深度由难度决定；区域彼此等价，因此所有占领行动合并为一个分支，
+        选中后优先占领AI自己倾向的区域（preferred），否则按棋盘顺序取第一个中性区域。
+        """
+        players = self.game_state.players
+        board = self.game_state.board
+        me = players.index(player)
+        state = _SearchState(
+            resources=tuple((p.qi, p.dao_xing, p.cheng_yi) for p in players),
+            zone_counts=tuple(len(board.zones_owned_by(p.name)) for p in players),
+            neutral_zones=len(self._neutral_zones),
+            to_move=me,
+        )
+        depth = _SEARCH_DEPTH.get(self.difficulty_level, 2)
+        
+        best_action, best_value = None, float("-inf")
+        alpha, beta = float("-inf"), float("inf")
+        for action, child in self._search_children(state):
+            value = self._alphabeta(child, depth - 1, alpha, beta, me)
+            if value > best_value:
+                best_action, best_value = action, value
+            alpha = max(alpha, value)
+        
+        if best_action != "claim":
+            return best_action
+        if preferred.startswith("claim:") and preferred.split(":", 1)[1] in self._neutral_zones:
+            return preferred
+        return "claim:" + self._ordered_zones(self._neutral_zones)[0]
+    
+    def _search_children(self, state: _SearchState) -> List[Tuple[str, _SearchState]]:
+        """生成后继局面；占领排在资源行动之前，以便尽早剪枝"""
+        mover = state.to_move
+        next_to_move = (mover + 1) % len(state.resources)
+        children = []
+        
+        if state.neutral_zones:
+            zone_counts = list(state.zone_counts)
+            zone_counts[mover] += 1
+            children.append(("claim", _SearchState(
+                state.resources, tuple(zone_counts), state.neutral_zones - 1, next_to_move)))
+        
+        qi, dao_xing, cheng_yi = state.resources[mover]
+        for action, (qi_gain, dao_gain, cheng_gain) in _SEARCH_GAINS.items():
+            resources = list(state.resources)
+            resources[mover] = (qi + qi_gain, dao_xing + dao_gain, cheng_yi + cheng_gain)
+            children.append((action, _SearchState(
+                tuple(resources), state.zone_counts, state.neutral_zones, next_to_move)))
+        
+        return children
+    
+    def _search_winner(self, state: _SearchState) -> Optional[int]:
+        """按 _check_victory_conditions 的规则判断搜索局面中的胜者"""
+        for i, (qi, dao_xing, cheng_yi) in enumerate(state.resources):
+            if (state.zone_counts[i] > self._total_zones // 2 or
+                    (qi >= 20 and dao_xing >= 15 and cheng_yi >= 15)):
+                return i
+        return None
+    
+    def _search_evaluate(self, state: _SearchState, me: int) -> float:
+        """局面评分：区域数×10 + 气 + 道行 + 诚意，取己方减去最强对手"""
+        scores = [count * 10 + sum(resources)
+                  for count, resources in zip(state.zone_counts, state.resources)]
+        my_score = scores.pop(me)
+        return my_score - max(scores, default=0)
+    
+    def _alphabeta(self, state: _SearchState, depth: int,
+                   alpha: float, beta: float, me: int) -> float:
+        """alpha-beta剪枝的极小极大搜索，返回对玩家me的局面价值
+        
+        不同行动顺序常会到达同一局面，结果记录在置换表中复用；
+        表中记下的最佳行动在再次搜索该局面时优先尝试。
+        """
+        winner = self._search_winner(state)
+        if winner is not None:
+            # 越早获胜（剩余深度越大）越好，越晚失败越好
+            return _SEARCH_WIN_SCORE + depth if winner == me else -_SEARCH_WIN_SCORE - depth
+        if depth == 0:
+            return self._search_evaluate(state, me)
+        
+        # 条目类型要按调用方给的窗口判断，必须在置换表收窄窗口之前记下
+        alpha_orig, beta_orig = alpha, beta
+        table = self._transposition_table
+        key = (state, me)
+        entry = table.get(key)
+        best_known = None
+        if entry is not None:
+            entry_depth, entry_value, entry_type, best_known = entry
+            if entry_depth >= depth:
+                if entry_type == _TT_EXACT:
+                    return entry_value
+                if entry_type == _TT_LOWER:
+                    alpha = max(alpha, entry_value)
+                else:
+                    beta = min(beta, entry_value)
+                if alpha >= beta:
+                    return entry_value
+        
+        children = self._search_children(state)
+        if best_known is not None:
+            children.sort(key=lambda item: item[0] != best_known)
+        
+        best_action = None
+        if state.to_move == me:
+            value = float("-inf")
+            for action, child in children:
+                child_value = self._alphabeta(child, depth - 1, alpha, beta, me)
+                if child_value > value:
+                    value, best_action = child_value, action
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break
+        else:
+            value = float("inf")
+            for action, child in children:
+                child_value = self._alphabeta(child, depth - 1, alpha, beta, me)
+                if child_value < value:
+                    value, best_action = child_value, action
+                beta = min(beta, value)
+                if alpha >= beta:
+                    break
+        
+        if value <= alpha_orig:
+            entry_type = _TT_UPPER
+        elif value >= beta_orig:
+            entry_type = _TT_LOWER
+        else:
+            entry_type = _TT_EXACT
+        if len(table) >= _TRANSPOSITION_TABLE_SIZE:
+            table.clear()
+        table[key] = (depth, value, entry_type, best_action)
+        return value
+    
     def _handle_meditate(self, player: Player):
         """处理冥想行动"""
-        qi_gain = random.randint(2, 4)
+        qi_gain = self._rng.randint(2, 4)
         player.qi += qi_gain
         
         # 阴阳平衡调整
@@ -472,20 +725,20 @@ class CompleteEnhancedGame:
     
     def _handle_study(self, player: Player):
         """处理研习行动"""
-        dao_gain = random.randint(1, 3)
+        dao_gain = self._rng.randint(1, 3)
         player.dao_xing += dao_gain
         
         enhanced_print(f"{player.name} 研习获得 {dao_gain} 点道行", "success")
         
         # 有概率获得卦象洞察
-        if random.random() < 0.3:
+        if self._rng.random() < 0.3:
             self._grant_hexagram_insight(player)
         
         achievement_system.record_action(player.name, "study")
     
     def _handle_cultivate(self, player: Player):
         """处理修心行动"""
-        cheng_yi_gain = random.randint(1, 3)
+        cheng_yi_gain = self._rng.randint(1, 3)
         player.cheng_yi += cheng_yi_gain
         
         enhanced_print(f"{player.name} 修心获得 {cheng_yi_gain} 点诚意", "success")
@@ -495,8 +748,7 @@ class CompleteEnhancedGame:
     def _handle_explore(self, player: Player):
         """处理探索行动"""
         # 寻找可控制的区域
-        available_zones = [name for name, data in self.game_state.board.gua_zones.items() 
-                          if not data.get("controller")]
+        available_zones = self._ordered_zones(self._neutral_zones)
         
         if available_zones:
             if len(available_zones) == 1:
@@ -511,20 +763,20 @@ class CompleteEnhancedGame:
                     if 0 <= choice < len(available_zones):
                         target_zone = available_zones[choice]
                     else:
-                        target_zone = random.choice(available_zones)
+                        target_zone = self._rng.choice(available_zones)
                 except ValueError:
-                    target_zone = random.choice(available_zones)
+                    target_zone = self._rng.choice(available_zones)
             
             # 探索成功率基于玩家能力
             success_rate = min(0.7 + (player.dao_xing * 0.05), 0.95)
             
-            if random.random() < success_rate:
-                self.game_state.board.gua_zones[target_zone]["controller"] = player.name
+            if self._rng.random() < success_rate:
+                self._set_controller(target_zone, player.name)
                 enhanced_print(f"{player.name} 成功控制了 {target_zone}!", "success")
                 
                 # 显示卦象信息
-                if target_zone in GUA_64_INFO:
-                    gua_info = GUA_64_INFO[target_zone]
+                gua_info = GUA_64_INFO.get(target_zone)
+                if gua_info:
                     enhanced_print(f"卦象属性: {gua_info.get('element', '未知')}", "info")
                 
                 achievement_system.record_action(player.name, "explore_success")
@@ -537,15 +789,14 @@ class CompleteEnhancedGame:
     
     def _grant_hexagram_insight(self, player: Player):
         """给予卦象洞察"""
-        controlled_zones = [name for name, data in self.game_state.board.gua_zones.items() 
-                           if data.get("controller") == player.name]
+        controlled_zones = self._ordered_zones(self.game_state.board.zones_owned_by(player.name))
         
         if controlled_zones:
-            zone = random.choice(controlled_zones)
+            zone = self._rng.choice(controlled_zones)
             relations = enhanced_hexagram_system.get_hexagram_relations(zone)
             
             if relations:
-                relation = random.choice(relations)
+                relation = self._rng.choice(relations)
                 enhanced_print(f"获得洞察: {zone} 与 {relation.related} 的关系 - {relation.description}", "achievement")
     
     def _handle_strategy_action(self, player: Player) -> bool:
@@ -560,14 +811,14 @@ class CompleteEnhancedGame:
     
     def _show_hexagram_analysis(self, player: Player):
         """显示卦象分析"""
-        controlled_zones = [name for name, data in self.game_state.board.gua_zones.items() 
-                           if data.get("controller") == player.name]
+        controlled_zones = self._ordered_zones(self.game_state.board.zones_owned_by(player.name))
         
         if not controlled_zones:
             enhanced_print("您还没有控制任何卦象区域", "info")
             return
         
         ui_enhancement.clear_screen()
+        self._screen_dirty = True
         print(ui_enhancement.create_title("卦象分析", f"{player.name} 的卦象网络"))
         
         for zone in controlled_zones:
@@ -577,11 +828,8 @@ class CompleteEnhancedGame:
         # 显示协同分析
         if len(controlled_zones) >= 2:
             print(ui_enhancement.create_section_header("协同效应分析"))
-            for i, zone1 in enumerate(controlled_zones):
-                for zone2 in controlled_zones[i+1:]:
-                    synergy = enhanced_hexagram_system.calculate_synergy(zone1, zone2)
-                    if synergy["compatibility"] > 0.3:
-                        display_synergy_analysis(zone1, zone2, synergy)
+            for zone1, zone2, _ in enhanced_hexagram_system.find_synergy_pairs(controlled_zones, 0.3):
+                display_synergy_analysis([zone1, zone2])
         
         enhanced_input("按回车键继续...")
     
@@ -594,14 +842,13 @@ class CompleteEnhancedGame:
         self._display_player_status(player)
         
         # 控制区域详情
-        controlled_zones = [name for name, data in self.game_state.board.gua_zones.items() 
-                           if data.get("controller") == player.name]
+        controlled_zones = self._ordered_zones(self.game_state.board.zones_owned_by(player.name))
         
         if controlled_zones:
             print(ui_enhancement.create_section_header("控制区域详情"))
             for zone in controlled_zones:
-                if zone in GUA_64_INFO:
-                    gua_info = GUA_64_INFO[zone]
+                gua_info = GUA_64_INFO.get(zone)
+                if gua_info:
                     print(f"{zone}: {gua_info.get('element', '未知')}属性")
         
         # 成就进度
@@ -632,16 +879,19 @@ class CompleteEnhancedGame:
         print()
         enhanced_input("按回车键继续...")
     
-    def _check_victory_conditions(self) -> bool:
-        """检查胜利条件"""
+    def _check_victory_conditions(self, last_actor: Optional[Player] = None) -> bool:
+        """检查胜利条件
+        
+        只有刚行动的玩家（last_actor）的控制区域会增加，因此只统计其区域数；
+        资源阈值对所有玩家都检查。未指定last_actor时（开局前）统计全部玩家。
+        """
+        board = self.game_state.board
+        zone_majority = self._total_zones // 2
+        
         for player in self.game_state.players:
-            controlled_count = sum(1 for data in self.game_state.board.gua_zones.values() 
-                                 if data.get("controller") == player.name)
-            
             # 胜利条件：控制超过一半的区域，或达到特定资源阈值
-            total_zones = len(self.game_state.board.gua_zones)
-            
-            if (controlled_count > total_zones // 2 or 
+            if (((last_actor is None or player is last_actor) and
+                 len(board.zones_owned_by(player.name)) > zone_majority) or
                 (player.qi >= 20 and player.dao_xing >= 15 and player.cheng_yi >= 15)):
                 self.game_state.winner = player
                 return True
@@ -650,8 +900,7 @@ class CompleteEnhancedGame:
         if self.game_state.turn > 50:
             # 根据控制区域数量决定胜者
             best_player = max(self.game_state.players, 
-                            key=lambda p: sum(1 for data in self.game_state.board.gua_zones.values() 
-                                             if data.get("controller") == p.name))
+                            key=lambda p: len(board.zones_owned_by(p.name)))
             self.game_state.winner = best_player
             return True
         
@@ -666,8 +915,7 @@ class CompleteEnhancedGame:
             
             # 显示胜利统计
             winner = self.game_state.winner
-            controlled_count = sum(1 for data in self.game_state.board.gua_zones.values() 
-                                 if data.get("controller") == winner.name)
+            controlled_count = len(self.game_state.board.zones_owned_by(winner.name))
             
             print(f"🏆 胜利者: {winner.name}")
             print(f"[统计] 控制区域: {controlled_count}")
@@ -688,56 +936,105 @@ class CompleteEnhancedGame:
                     print(f"  🏆 {achievement}")
                 print()
         
-        enhanced_input("按回车键返回主菜单...")
+        if self.interactive:
+            enhanced_input("按回车键返回主菜单...")
     
-    def _run_ai_vs_ai_battle(self, ai1: EnhancedAIPlayer, ai2: EnhancedAIPlayer):
-        """运行AI对AI战斗"""
-        # 初始化AI对战
-        player1 = Player(ai1.name)
-        player2 = Player(ai2.name)
-        
-        self.game_state = GameState([player1, player2])
-        
-        # 初始化系统
-        for player in [player1, player2]:
+    def _advance_turn(self):
+        """轮到下一位玩家；回到首位玩家时回合数加一"""
+        game_state = self.game_state
+        game_state.current_player_index = (game_state.current_player_index + 1) % len(game_state.players)
+        if game_state.current_player_index == 0:
+            game_state.turn += 1
+    
+    def _setup_ai_battle(self, ai1: EnhancedAIPlayer, ai2: EnhancedAIPlayer) -> GameState:
+        """创建AI对战的游戏状态并初始化策略系统"""
+        players = [Player(ai1.name, EMPEROR_AVATAR), Player(ai2.name, HERMIT_AVATAR)]
+        self.game_state = GameState(players)
+        self._init_zone_cache()
+        for player in players:
             advanced_strategy_system.initialize_player_strategy(player.name)
+        return self.game_state
+    
+    def _choose_ai_action(self, ai: EnhancedAIPlayer, player: Player) -> str:
+        """AI决策：策略行动沿用AI自身判断，其余行动经前瞻搜索确定"""
+        action = ai.make_decision(player, self.game_state)
+        if not action.startswith("strategy:"):
+            action = self._search_ai_action(player, action)
+        return action
+    
+    def _apply_action(self, player: Player, action: str) -> bool:
+        """执行AI对战中的行动（简化版），返回是否占领了新区域"""
+        rng = self._rng
+        if action == "meditate":
+            player.qi += rng.randint(2, 4)
+        elif action == "study":
+            player.dao_xing += rng.randint(1, 3)
+        elif action == "cultivate":
+            player.cheng_yi += rng.randint(1, 3)
+        elif action.startswith("claim:"):
+            zone_name = action.split(":", 1)[1]
+            zone_data = self.game_state.board.gua_zones.get(zone_name)
+            if zone_data and not zone_data.get("controller"):
+                self._set_controller(zone_name, player.name)
+                return True
+        return False
+    
+    def _run_ai_vs_ai_battle_interactive(self, ai1: EnhancedAIPlayer, ai2: EnhancedAIPlayer):
+        """运行AI对AI战斗（逐回合显示）"""
+        game_state = self._setup_ai_battle(ai1, ai2)
+        ss = advanced_strategy_system
         
         enhanced_print("AI对战开始！", "success")
         
-        while not self._check_victory_conditions() and self.game_state.turn <= 30:
-            current_player = self.game_state.get_current_player()
+        last_actor = None
+        while not self._check_victory_conditions(last_actor) and game_state.turn <= 30:
+            current_player = game_state.get_current_player()
             current_ai = ai1 if current_player.name == ai1.name else ai2
             
             # 显示回合信息
-            enhanced_print(f"\n=== 第 {self.game_state.turn} 回合 - {current_player.name} ===", "info")
+            enhanced_print(f"\n=== 第 {game_state.turn} 回合 - {current_player.name} ===", "info")
             
             # AI决策和行动
-            action = current_ai.make_decision(current_player, self.game_state)
+            action = self._choose_ai_action(current_ai, current_player)
             enhanced_print(f"{current_player.name} 选择: {action}", "info")
             
-            # 执行行动（简化版）
-            if action == "meditate":
-                current_player.qi += random.randint(2, 4)
-            elif action == "study":
-                current_player.dao_xing += random.randint(1, 3)
-            elif action.startswith("claim:"):
-                zone_name = action.split(":", 1)[1]
-                if (zone_name in self.game_state.board.gua_zones and 
-                    not self.game_state.board.gua_zones[zone_name].get("controller")):
-                    self.game_state.board.gua_zones[zone_name]["controller"] = current_player.name
-                    enhanced_print(f"{current_player.name} 控制了 {zone_name}", "success")
+            if self._apply_action(current_player, action):
+                enhanced_print(f"{current_player.name} 控制了 {action.split(':', 1)[1]}", "success")
             
             # 更新冷却
-            advanced_strategy_system.update_cooldowns(current_player.name)
+            ss.update_cooldowns(current_player.name)
             
             # 下一回合
-            self.game_state.next_turn()
+            self._advance_turn()
+            last_actor = current_player
             
-            time.sleep(0.5)  # 观战节奏
+            if self.interactive:
+                time.sleep(0.5)  # 观战节奏
         
         # 显示对战结果
         self._handle_game_end()
     
+    def _simulate_ai_vs_ai(self, ai1: EnhancedAIPlayer, ai2: EnhancedAIPlayer) -> Tuple[Optional[str], int]:
+        """无界面AI对战：规则与交互版相同，但不输出、不停顿、不等待输入
+        
+        返回 (胜者名称, 结束时的回合数)；达到回合上限仍无胜者时胜者为None。
+        供批量自我对弈和参数调优使用。
+        """
+        game_state = self._setup_ai_battle(ai1, ai2)
+        update_cooldowns = advanced_strategy_system.update_cooldowns
+        
+        last_actor = None
+        while not self._check_victory_conditions(last_actor) and game_state.turn <= 30:
+            current_player = game_state.get_current_player()
+            current_ai = ai1 if current_player.name == ai1.name else ai2
+            self._apply_action(current_player, self._choose_ai_action(current_ai, current_player))
+            update_cooldowns(current_player.name)
+            self._advance_turn()
+            last_actor = current_player
+        
+        winner = getattr(game_state, "winner", None)
+        return (winner.name if winner else None), game_state.turn
+    
     def _show_hexagram_guide(self):
         """显示卦象指南"""
         display_hexagram_analysis("乾")  # 示例
@@ -761,43 +1058,26 @@ class CompleteEnhancedGame:
         ui_enhancement.clear_screen()
         print(ui_enhancement.create_title("游戏设置", "自定义您的游戏体验"))
         
-        settings_options = [
-            "1. 🎨 UI主题设置",
-            "2. 🔊 音效设置",
-            "3. [电] 游戏速度",
-            "4. 🤖 AI难度",
-            "5. [统计] 统计信息",
-            "6. 🔄 重置数据",
-            "7. 返回主菜单"
-        ]
-        
-        for option in settings_options:
-            print(f"  {option}")
-        print()
+        sys.stdout.write(_SETTINGS_MENU_TEXT)
         
         choice = enhanced_input("请选择设置项 (1-7): ")
-        
-        if choice == "1":
-            self._ui_theme_settings()
-        elif choice == "2":
-            enhanced_print("音效设置功能开发中...", "info")
-        elif choice == "3":
-            enhanced_print("游戏速度设置功能开发中...", "info")
-        elif choice == "4":
-            enhanced_print("AI难度设置功能开发中...", "info")
-        elif choice == "5":
-            enhanced_print("统计信息功能开发中...", "info")
-        elif choice == "6":
-            confirm = enhanced_input("确认重置所有数据? (输入 'RESET' 确认): ")
-            if confirm == "RESET":
-                enhanced_print("数据重置完成", "success")
-            else:
-                enhanced_print("取消重置", "info")
-        elif choice == "7":
+        if choice == "7":
             return
         
+        handler = self._settings_menu.get(choice)
+        if handler:
+            handler()
+        
         enhanced_input("按回车键继续...")
     
+    def _confirm_reset_data(self):
+        """确认并重置数据"""
+        confirm = enhanced_input("确认重置所有数据? (输入 'RESET' 确认): ")
+        if confirm == "RESET":
+            enhanced_print("数据重置完成", "success")
+        else:
+            enhanced_print("取消重置", "info")
+    
     def _ui_theme_settings(self):
         """UI主题设置"""
         print("UI主题选择:")
@@ -250,17 +250,15 @@ class CoreGameEngine:
     def _execute_play_card(self, card_index: int, zone: str, **kwargs) -> ActionResult:
         """执行打牌动作"""
         player = self.get_current_player()
-        card = player.hand.pop(card_index)
+        card = player.hand[card_index]
+        player.hand = player.hand[:card_index] + player.hand[card_index + 1:]
         
         # 放置卡牌到区域
-        zone_data = self.game_state.board.gua_zones[zone]
-        if player.name not in zone_data["markers"]:
-            zone_data["markers"][player.name] = 0
-        zone_data["markers"][player.name] += 1
+        zone_data = self.game_state.board.update_zone_markers(zone, player.name, 1)
         
         # 检查区域控制
         if zone_data["markers"][player.name] > self.game_state.board.base_limit // 2:
-            zone_data["controller"] = player.name
+            self.game_state.board.set_zone_controller(zone, player.name)
         
         # 设置当前任务卡
         player.current_task_card = card
@@ -277,7 +275,7 @@ class CoreGameEngine:
         player.position = Zone(target_zone)
         
         # 更新棋盘位置
-        self.game_state.board.player_positions[player.name] = player.position
+        self.game_state.board.set_player_position(player.name, player.position)
         
         # 位置效果
         self._apply_position_effects(player, old_position, player.position)
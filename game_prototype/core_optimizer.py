@@ -7,15 +7,21 @@
 
 import ast
 import os
+import re
 import sys
 import time
 import json
 import logging
-from typing import Dict, List, Any, Optional, Tuple, Set
-from dataclasses import dataclass, field
+from collections import Counter
+from itertools import chain
+from operator import attrgetter
+from typing import Callable, Dict, List, Any, NamedTuple, Optional, Tuple, Set
+from dataclasses import dataclass, field, fields, is_dataclass
 from enum import Enum
 from pathlib import Path
+from weakref import WeakKeyDictionary
 import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 
 class OptimizationType(Enum):
     """优化类型"""
@@ -66,36 +72,276 @@ class RefactorReport:
     quality_score: float = 0.0
     quality_grade: CodeQuality = CodeQuality.FAIR
 
+# 固定的建议描述，各条建议共用同一个字符串对象
+_DESC_NESTED_LOOPS = sys.intern("发现多重嵌套循环，可能影响性能")
+_DESC_UNMANAGED_FILE = sys.intern("建议使用 with 语句管理文件资源")
+
+@dataclass
+class _FileCache:
+    """单个源文件的读取与解析结果"""
+    path: str
+    source: str
+    lines: List[str]
+    mtime: float
+    tree: Optional[ast.AST] = None  # 首次需要时由 get_tree 解析
+    metrics: Optional["_MetricsVisitor"] = None  # 首次需要时由 get_metrics 填充
+    
+    def get_tree(self) -> ast.AST:
+        """解析源码得到语法树，只解析一次"""
+        if self.tree is None:
+            # 直接以 PyCF_ONLY_AST 编译，并带上文件名，语法错误时能指明出错文件
+            self.tree = compile(self.source, self.path, 'exec', ast.PyCF_ONLY_AST)
+        return self.tree
+    
+    def get_metrics(self) -> "_MetricsVisitor":
+        """对语法树做一次度量遍历，结果保存在条目上供各分析器复用"""
+        if self.metrics is None:
+            visitor = _MetricsVisitor()
+            visitor.visit(self.get_tree())
+            self.metrics = visitor
+        return self.metrics
+
+# 少于该行数、且不含任何会被度量或检查的语法结构的脚本不做语法树分析
+TRIVIAL_FILE_LINES = 40
+
+# 语法树分析会统计或报告的结构都以这些关键字（或 open 调用）开头：导入、函数与类定义、
+# 分支与循环、异常处理、布尔运算。源码中一个都没有时，完整分析的结果只取决于按行统计
+_ANALYZED_KEYWORDS_RE = re.compile(
+    r'\b(?:import|def|class|if|for|while|with|except|and|or|open)\b')
+
+def _is_trivial_source(source: str) -> bool:
+    """判断源码是否可以跳过语法树分析（只做文本检查，不解析）
+    
+    出现在字符串或注释里的关键字也会被当作结构，只会让文件多走一次完整分析，不会漏报。
+    """
+    return (source.count('\n') < TRIVIAL_FILE_LINES
+            and _ANALYZED_KEYWORDS_RE.search(source) is None)
+
+class _LineStats(NamedTuple):
+    """按行统计的结果"""
+    line_count: int
+    comment_lines: int
+
+def _count_lines(lines: List[str]) -> _LineStats:
+    """一次遍历统计总行数与注释行数，不生成中间列表"""
+    comment_lines = 0
+    for line in lines:
+        if line.lstrip().startswith('#'):
+            comment_lines += 1
+    return _LineStats(len(lines), comment_lines)
+
+class _MetricsVisitor(ast.NodeVisitor):
+    """单次遍历语法树，统计代码度量并记录过长、嵌套过深的函数及多重嵌套循环
+    
+    嵌套深度只沿 if/while/for/with 直接相连的链条计数，其他节点会打断链条。
+    """
+    
+    def __init__(self):
+        self.functions = 0
+        self.classes = 0
+        self.imports = 0
+        self.complexity = 1  # 基础复杂度
+        self.long_funcs: List[Tuple[ast.FunctionDef, int]] = []  # (函数节点, 行数)
+        self.deep_funcs: List[Tuple[ast.FunctionDef, int]] = []  # (函数节点, 嵌套深度)
+        self.loops = 0  # 已遍历的 for/while 循环数
+        self.nested_loops: List[ast.For] = []  # 内部含两个及以上循环的 for，按源码顺序
+        self._chain: Optional[int] = None  # 当前所在嵌套链的深度，None 表示不在链上
+        self._max_depth = 0
+    
+    # 节点类型 -> 访问方法，避免 NodeVisitor.visit 每个节点都拼接方法名再 getattr
+    _dispatch: Dict[type, Callable[["_MetricsVisitor", ast.AST], None]] = {}
+    
+    def visit(self, node: ast.AST):
+        node_type = type(node)
+        method = self._dispatch.get(node_type)
+        if method is None:
+            if not node_type._fields or node_type in (ast.Name, ast.Constant):
+                # 叶子节点（上下文、运算符、名字、常量）下面没有需要统计的内容，直接跳过
+                method = _MetricsVisitor._visit_leaf
+            else:
+                method = getattr(_MetricsVisitor, 'visit_' + node_type.__name__,
+                                 _MetricsVisitor.generic_visit)
+            self._dispatch[node_type] = method
+        method(self, node)
+    
+    def _visit_leaf(self, node: ast.AST):
+        pass
+    
+    def generic_visit(self, node: ast.AST):
+        chain = self._chain
+        self._chain = None
+        super().generic_visit(node)
+        self._chain = chain
+    
+    def _visit_nesting(self, node: ast.AST):
+        self.complexity += 1
+        chain = self._chain
+        if chain is None:
+            super().generic_visit(node)
+            return
+        
+        depth = chain + 1
+        if depth > self._max_depth:
+            self._max_depth = depth
+        self._chain = depth
+        super().generic_visit(node)
+        self._chain = chain
+    
+    visit_If = visit_With = _visit_nesting
+    
+    def visit_For(self, node: ast.For):
+        # 遍历前后循环计数之差即子树中的循环数，无需再遍历一次子树
+        loops_before, slot = self.loops, len(self.nested_loops)
+        self._visit_nesting(node)
+        if self.loops - loops_before >= 2:
+            self.nested_loops.insert(slot, node)
+        self.loops += 1
+    
+    def visit_While(self, node: ast.While):
+        self._visit_nesting(node)
+        self.loops += 1
+    
+    def _visit_branch(self, node: ast.AST):
+        self.complexity += 1
+        self.generic_visit(node)
+    
+    visit_AsyncFor = visit_ExceptHandler = _visit_branch
+    
+    def visit_BoolOp(self, node: ast.BoolOp):
+        self.complexity += len(node.values) - 1
+        self.generic_visit(node)
+    
+    def visit_Import(self, node: ast.AST):
+        self.imports += 1
+    
+    visit_ImportFrom = visit_Import
+    
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.classes += 1
+        self.generic_visit(node)
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self.functions += 1
+        func_lines = node.end_lineno - node.lineno + 1
+        if func_lines > 50:
+            self.long_funcs.append((node, func_lines))
+        
+        # 每个函数从深度0开始单独计算嵌套
+        chain, max_depth = self._chain, self._max_depth
+        self._chain, self._max_depth = 0, 0
+        super().generic_visit(node)
+        if self._max_depth > 4:
+            self.deep_funcs.append((node, self._max_depth))
+        self._chain, self._max_depth = chain, max_depth
+
+# 语法树 -> (按具体节点类型分桶的节点列表, 按查询类型元组缓存的结果)
+_NODES_CACHE: "WeakKeyDictionary[ast.AST, Tuple[Dict[type, List[ast.AST]], Dict[Tuple[type, ...], List[ast.AST]]]]" = WeakKeyDictionary()
+
+def nodes_of_type(tree: ast.AST, *types: type) -> List[ast.AST]:
+    """返回语法树中属于给定类型的全部节点
+    
+    首次查询时遍历一次整棵树，按节点的具体类型分桶；之后对同一棵树的查询只是字典查找。
+    结果按类型分组，组内保持 ast.walk 的顺序。返回的列表是共享的，调用方不要修改。
+    """
+    cached = _NODES_CACHE.get(tree)
+    if cached is None:
+        buckets: Dict[type, List[ast.AST]] = {}
+        for node in ast.walk(tree):
+            buckets.setdefault(type(node), []).append(node)
+        cached = _NODES_CACHE[tree] = (buckets, {})
+    
+    buckets, queries = cached
+    result = queries.get(types)
+    if result is None:
+        result = [node for node_type, nodes in buckets.items()
+                  if issubclass(node_type, types) for node in nodes]
+        queries[types] = result
+    return result
+
+def _list_python_files(project_path: str) -> List[str]:
+    """列出项目目录下需要分析的Python文件路径（跳过隐藏文件与 __init__ 等特殊模块）"""
+    with os.scandir(project_path) as entries:
+        return [entry.path for entry in entries
+                if entry.name.endswith('.py') and not entry.name.startswith(('.', '__'))
+                and entry.is_file()]
+
+class _ImportCollector(ast.NodeVisitor):
+    """收集模块导入的名字
+    
+    导入只能以语句形式出现，因此只沿各类语句体下降（包括函数、类内部的延迟导入），
+    不进入任何表达式。
+    """
+    
+    _BODY_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+    
+    def __init__(self):
+        self.imports: Set[str] = set()
+    
+    def generic_visit(self, node: ast.AST):
+        for field_name in self._BODY_FIELDS:
+            for child in getattr(node, field_name, ()):
+                self.visit(child)
+    
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            self.imports.add(alias.name)
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.module:
+            self.imports.add(node.module)
+
+class SourceCache:
+    """源文件缓存：同一文件只读取、解析一次，供各分析器共享
+    
+    以绝对路径为键，文件修改时间变化时重新读取；语法树在首次使用时才解析。
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, _FileCache] = {}
+    
+    def load(self, file_path: str) -> _FileCache:
+        """返回文件的缓存条目，必要时重新读取"""
+        key = os.path.abspath(file_path)
+        mtime = os.stat(key).st_mtime
+        entry = self._entries.get(key)
+        if entry is None or entry.mtime != mtime:
+            with open(key, 'r', encoding='utf-8') as f:
+                source = f.read()
+            entry = _FileCache(path=key, source=source, lines=source.splitlines(),
+                               mtime=mtime)
+            self._entries[key] = entry
+        return entry
+    
+    def clear(self):
+        """清空缓存"""
+        self._entries.clear()
+
 class CodeAnalyzer:
     """代码分析器"""
     
-    def __init__(self):
+    def __init__(self, source_cache: Optional[SourceCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.source_cache = source_cache or SourceCache()
     
     def analyze_file(self, file_path: str) -> CodeMetrics:
         """分析单个文件的代码度量"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            entry = self.source_cache.load(file_path)
+            visitor = entry.get_metrics()
             
-            tree = ast.parse(content)
+            line_stats = _count_lines(entry.lines)
             
             metrics = CodeMetrics()
-            metrics.lines_of_code = len(content.splitlines())
-            metrics.function_count = len([node for node in ast.walk(tree) 
-                                        if isinstance(node, ast.FunctionDef)])
-            metrics.class_count = len([node for node in ast.walk(tree) 
-                                     if isinstance(node, ast.ClassDef)])
-            metrics.import_count = len([node for node in ast.walk(tree) 
-                                      if isinstance(node, (ast.Import, ast.ImportFrom))])
+            metrics.lines_of_code = line_stats.line_count
+            metrics.function_count = visitor.functions
+            metrics.class_count = visitor.classes
+            metrics.import_count = visitor.imports
             
             # 计算注释比例
-            comment_lines = len([line for line in content.splitlines() 
-                               if line.strip().startswith('#')])
-            metrics.comment_ratio = comment_lines / max(metrics.lines_of_code, 1)
+            metrics.comment_ratio = line_stats.comment_lines / max(metrics.lines_of_code, 1)
             
-            # 计算圈复杂度
-            metrics.cyclomatic_complexity = self._calculate_complexity(tree)
+            # 圈复杂度
+            metrics.cyclomatic_complexity = visitor.complexity
             
             return metrics
             
@@ -103,121 +349,92 @@ class CodeAnalyzer:
             self.logger.error(f"分析文件 {file_path} 时出错: {e}")
             return CodeMetrics()
     
-    def _calculate_complexity(self, tree: ast.AST) -> int:
-        """计算圈复杂度"""
-        complexity = 1  # 基础复杂度
-        
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-            elif isinstance(node, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(node, ast.With):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
-        
-        return complexity
-    
     def detect_code_smells(self, file_path: str) -> List[OptimizationSuggestion]:
         """检测代码异味"""
         suggestions = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content)
+            entry = self.source_cache.load(file_path)
+            visitor = entry.get_metrics()
             
             # 检测长函数
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    func_lines = node.end_lineno - node.lineno + 1
-                    if func_lines > 50:
-                        suggestions.append(OptimizationSuggestion(
-                            type=OptimizationType.CODE_REFACTOR,
-                            priority="medium",
-                            description=f"函数 {node.name} 过长 ({func_lines} 行)，建议拆分",
-                            file_path=file_path,
-                            line_number=node.lineno
-                        ))
+            for node, func_lines in visitor.long_funcs:
+                suggestions.append(OptimizationSuggestion(
+                    type=OptimizationType.CODE_REFACTOR,
+                    priority="medium",
+                    description=f"函数 {node.name} 过长 ({func_lines} 行)，建议拆分",
+                    file_path=file_path,
+                    line_number=node.lineno
+                ))
             
             # 检测深层嵌套
-            self._check_nesting_depth(tree, file_path, suggestions)
+            self._check_nesting_depth(visitor, file_path, suggestions)
             
             # 检测重复代码
-            self._check_code_duplication(content, file_path, suggestions)
+            self._check_code_duplication(entry.lines, file_path, suggestions)
             
         except Exception as e:
             self.logger.error(f"检测代码异味时出错: {e}")
         
         return suggestions
     
-    def _check_nesting_depth(self, tree: ast.AST, file_path: str, 
+    def _check_nesting_depth(self, visitor: _MetricsVisitor, file_path: str, 
                            suggestions: List[OptimizationSuggestion]):
-        """检查嵌套深度"""
-        def get_depth(node, current_depth=0):
-            max_depth = current_depth
-            for child in ast.iter_child_nodes(node):
-                if isinstance(child, (ast.If, ast.While, ast.For, ast.With)):
-                    child_depth = get_depth(child, current_depth + 1)
-                    max_depth = max(max_depth, child_depth)
-            return max_depth
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                depth = get_depth(node)
-                if depth > 4:
-                    suggestions.append(OptimizationSuggestion(
-                        type=OptimizationType.CODE_REFACTOR,
-                        priority="high",
-                        description=f"函数 {node.name} 嵌套过深 (深度: {depth})，建议重构",
-                        file_path=file_path,
-                        line_number=node.lineno
-                    ))
+        """检查嵌套深度（深度已在度量遍历中算出）"""
+        for node, depth in visitor.deep_funcs:
+            suggestions.append(OptimizationSuggestion(
+                type=OptimizationType.CODE_REFACTOR,
+                priority="high",
+                description=f"函数 {node.name} 嵌套过深 (深度: {depth})，建议重构",
+                file_path=file_path,
+                line_number=node.lineno
+            ))
     
-    def _check_code_duplication(self, content: str, file_path: str, 
+    def _check_code_duplication(self, lines: List[str], file_path: str, 
                               suggestions: List[OptimizationSuggestion]):
-        """检查代码重复"""
-        lines = content.splitlines()
-        line_groups = {}
+        """检查代码重复（使用缓存中已切分好的行）"""
+        # 以去掉首尾空白的行内容为键，只记录首次出现的行号和出现次数，
+        # 每种行的开销固定，不随重复次数增长
+        first_lines: Dict[str, int] = {}
+        counts: Dict[str, int] = {}
         
-        for i, line in enumerate(lines):
+        for line_number, line in enumerate(lines, 1):
             stripped = line.strip()
             if len(stripped) > 10 and not stripped.startswith('#'):
-                if stripped in line_groups:
-                    line_groups[stripped].append(i + 1)
+                if stripped in counts:
+                    counts[stripped] += 1
                 else:
-                    line_groups[stripped] = [i + 1]
+                    counts[stripped] = 1
+                    first_lines[stripped] = line_number
         
-        for line, occurrences in line_groups.items():
-            if len(occurrences) > 2:
+        for line, count in counts.items():
+            if count > 2:
+                first_line = first_lines[line]
                 suggestions.append(OptimizationSuggestion(
                     type=OptimizationType.CODE_REFACTOR,
                     priority="medium",
-                    description=f"发现重复代码: '{line[:50]}...' (出现 {len(occurrences)} 次)",
+                    description=f"发现重复代码: '{line[:50]}...' (出现 {count} 次)",
                     file_path=file_path,
-                    line_number=occurrences[0]
+                    line_number=first_line
                 ))
 
 class PerformanceOptimizer:
     """性能优化器"""
     
-    def __init__(self):
+    def __init__(self, source_cache: Optional[SourceCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.source_cache = source_cache or SourceCache()
     
     def analyze_performance_bottlenecks(self, file_path: str) -> List[OptimizationSuggestion]:
         """分析性能瓶颈"""
         suggestions = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content)
+            entry = self.source_cache.load(file_path)
+            tree = entry.get_tree()
             
             # 检测低效的循环
-            self._check_inefficient_loops(tree, file_path, suggestions)
+            self._check_inefficient_loops(entry.get_metrics(), file_path, suggestions)
             
             # 检测不必要的计算
             self._check_redundant_computations(tree, file_path, suggestions)
@@ -230,22 +447,17 @@ class PerformanceOptimizer:
         
         return suggestions
     
-    def _check_inefficient_loops(self, tree: ast.AST, file_path: str, 
+    def _check_inefficient_loops(self, visitor: _MetricsVisitor, file_path: str, 
                                suggestions: List[OptimizationSuggestion]):
-        """检查低效循环"""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.For):
-                # 检查嵌套循环
-                nested_loops = [child for child in ast.walk(node) 
-                              if isinstance(child, (ast.For, ast.While)) and child != node]
-                if len(nested_loops) >= 2:
-                    suggestions.append(OptimizationSuggestion(
-                        type=OptimizationType.PERFORMANCE,
-                        priority="high",
-                        description="发现多重嵌套循环，可能影响性能",
-                        file_path=file_path,
-                        line_number=node.lineno
-                    ))
+        """检查低效循环（嵌套循环已在度量遍历中统计）"""
+        for node in visitor.nested_loops:
+            suggestions.append(OptimizationSuggestion(
+                type=OptimizationType.PERFORMANCE,
+                priority="high",
+                description=_DESC_NESTED_LOOPS,
+                file_path=file_path,
+                line_number=node.lineno
+            ))
     
     def _check_redundant_computations(self, tree: ast.AST, file_path: str, 
                                     suggestions: List[OptimizationSuggestion]):
@@ -257,28 +469,28 @@ class PerformanceOptimizer:
                           suggestions: List[OptimizationSuggestion]):
         """检查内存泄漏风险"""
         # 检查未关闭的文件句柄
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if (isinstance(node.func, ast.Name) and 
-                    node.func.id == 'open'):
-                    # 检查是否在with语句中
-                    parent = node
-                    in_with = False
-                    # 这里需要更复杂的AST遍历逻辑
-                    if not in_with:
-                        suggestions.append(OptimizationSuggestion(
-                            type=OptimizationType.MEMORY,
-                            priority="medium",
-                            description="建议使用 with 语句管理文件资源",
-                            file_path=file_path,
-                            line_number=node.lineno
-                        ))
+        for node in nodes_of_type(tree, ast.Call):
+            if (isinstance(node.func, ast.Name) and 
+                node.func.id == 'open'):
+                # 检查是否在with语句中
+                parent = node
+                in_with = False
+                # 这里需要更复杂的AST遍历逻辑
+                if not in_with:
+                    suggestions.append(OptimizationSuggestion(
+                        type=OptimizationType.MEMORY,
+                        priority="medium",
+                        description=_DESC_UNMANAGED_FILE,
+                        file_path=file_path,
+                        line_number=node.lineno
+                    ))
 
 class ArchitectureOptimizer:
     """架构优化器"""
     
-    def __init__(self):
+    def __init__(self, source_cache: Optional[SourceCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.source_cache = source_cache or SourceCache()
     
     def analyze_architecture(self, project_path: str) -> List[OptimizationSuggestion]:
         """分析项目架构"""
@@ -307,26 +519,11 @@ class ArchitectureOptimizer:
         """分析模块依赖关系"""
         dependencies = {}
         
-        for py_file in Path(project_path).glob("*.py"):
-            if py_file.name.startswith('__'):
-                continue
-                
+        for file_path in _list_python_files(project_path):
             try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                tree = ast.parse(content)
-                imports = set()
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            imports.add(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            imports.add(node.module)
-                
-                dependencies[py_file.stem] = imports
+                collector = _ImportCollector()
+                collector.visit(self.source_cache.load(file_path).get_tree())
+                dependencies[os.path.basename(file_path)[:-3]] = collector.imports
                 
             except Exception as e:
                 self.logger.error(f"分析依赖时出错: {e}")
@@ -335,15 +532,11 @@ class ArchitectureOptimizer:
     
     def _detect_circular_dependencies(self, dependencies: Dict[str, Set[str]]) -> List[str]:
         """检测循环依赖"""
-        # 简化的循环依赖检测
-        circular = []
-        
-        for module, deps in dependencies.items():
-            for dep in deps:
-                if dep in dependencies and module in dependencies[dep]:
-                    circular.append(f"{module} <-> {dep}")
-        
-        return circular
+        # 简化的循环依赖检测：只找两个模块互相导入的情况，每对只报告一次
+        edges = {(module, dep) for module, deps in dependencies.items()
+                 for dep in deps if dep in dependencies}
+        return sorted(f"{module} <-> {dep}" for module, dep in edges
+                      if module < dep and (dep, module) in edges)
     
     def _analyze_coupling(self, dependencies: Dict[str, Set[str]]) -> List[OptimizationSuggestion]:
         """分析模块耦合度"""
@@ -365,13 +558,20 @@ class CoreOptimizer:
     
     def __init__(self, project_path: str):
         self.project_path = project_path
-        self.code_analyzer = CodeAnalyzer()
-        self.performance_optimizer = PerformanceOptimizer()
-        self.architecture_optimizer = ArchitectureOptimizer()
+        # 各分析器共享同一个源文件缓存，每个文件只解析一次
+        self.source_cache = SourceCache()
+        self.code_analyzer = CodeAnalyzer(self.source_cache)
+        self.performance_optimizer = PerformanceOptimizer(self.source_cache)
+        self.architecture_optimizer = ArchitectureOptimizer(self.source_cache)
         self.logger = logging.getLogger(__name__)
     
-    def run_full_optimization_analysis(self) -> Dict[str, Any]:
-        """运行完整的优化分析"""
+    def run_full_optimization_analysis(self, processes: Optional[int] = None) -> Dict[str, Any]:
+        """运行完整的优化分析
+        
+        各文件的分析互不依赖，分发到进程池并行执行；processes为1时在当前进程内
+        顺序分析（便于调试与性能剖析），None表示使用全部CPU。架构分析需要全局视图，
+        始终在主进程中进行。
+        """
         print("🔍 开始核心代码优化分析...")
         
         results = {
@@ -387,15 +587,14 @@ class CoreOptimizer:
         }
         
         # 分析所有Python文件
-        for py_file in Path(self.project_path).glob("*.py"):
-            if py_file.name.startswith('__'):
-                continue
-            
-            print(f"📊 分析文件: {py_file.name}")
-            report = self._analyze_single_file(str(py_file))
-            results['reports'].append(report)
-            results['files_analyzed'] += 1
-            results['total_suggestions'] += len(report.suggestions)
+        file_paths = _list_python_files(self.project_path)
+        if processes == 1:
+            reports = map(self._analyze_single_file, file_paths)
+            self._collect_reports(file_paths, reports, results)
+        else:
+            with ProcessPoolExecutor(processes) as executor:
+                reports = executor.map(_analyze_worker, file_paths, chunksize=4)
+                self._collect_reports(file_paths, reports, results)
         
         # 架构分析
         print("🏗️ 分析项目架构...")
@@ -410,21 +609,51 @@ class CoreOptimizer:
         
         return results
     
+    @staticmethod
+    def _collect_reports(file_paths: List[str], reports, results: Dict[str, Any]):
+        """按文件顺序汇总单文件分析报告"""
+        for file_path, report in zip(file_paths, reports):
+            print(f"📊 分析文件: {os.path.basename(file_path)}")
+            # 子进程返回的报告经过pickle，相同的描述在各批次中各有一份副本，在此合并
+            for suggestion in report.suggestions:
+                suggestion.description = sys.intern(suggestion.description)
+            results['reports'].append(report)
+            results['files_analyzed'] += 1
+            results['total_suggestions'] += len(report.suggestions)
+    
     def _analyze_single_file(self, file_path: str) -> RefactorReport:
         """分析单个文件"""
-        report = RefactorReport(
-            file_path=file_path,
-            original_metrics=self.code_analyzer.analyze_file(file_path),
-            optimized_metrics=CodeMetrics()  # 优化后的度量
-        )
-        
-        # 代码异味检测
-        code_smells = self.code_analyzer.detect_code_smells(file_path)
-        report.suggestions.extend(code_smells)
-        
-        # 性能分析
-        perf_issues = self.performance_optimizer.analyze_performance_bottlenecks(file_path)
-        report.suggestions.extend(perf_issues)
+        try:
+            entry = self.source_cache.load(file_path)
+        except Exception:
+            entry = None  # 读取失败时交给各分析器按原方式记录错误
+        
+        if entry is not None and _is_trivial_source(entry.source):
+            # 简单脚本跳过语法树解析，度量与完整分析一致：没有导入和定义，只计基础复杂度；
+            # 重复代码检查只依赖按行内容，照常执行
+            line_stats = _count_lines(entry.lines)
+            metrics = CodeMetrics(
+                lines_of_code=line_stats.line_count,
+                cyclomatic_complexity=1,
+                comment_ratio=line_stats.comment_lines / max(line_stats.line_count, 1)
+            )
+            report = RefactorReport(file_path=file_path, original_metrics=metrics,
+                                    optimized_metrics=CodeMetrics())
+            self.code_analyzer._check_code_duplication(entry.lines, file_path, report.suggestions)
+        else:
+            report = RefactorReport(
+                file_path=file_path,
+                original_metrics=self.code_analyzer.analyze_file(file_path),
+                optimized_metrics=CodeMetrics()  # 优化后的度量
+            )
+            
+            # 代码异味检测
+            code_smells = self.code_analyzer.detect_code_smells(file_path)
+            report.suggestions.extend(code_smells)
+            
+            # 性能分析
+            perf_issues = self.performance_optimizer.analyze_performance_bottlenecks(file_path)
+            report.suggestions.extend(perf_issues)
         
         # 计算质量分数
         report.quality_score = self._calculate_quality_score(report.original_metrics, report.suggestions)
@@ -445,13 +674,10 @@ class CoreOptimizer:
             base_score -= 10
         
         # 根据建议扣分
-        for suggestion in suggestions:
-            if suggestion.priority == "high":
-                base_score -= 15
-            elif suggestion.priority == "medium":
-                base_score -= 10
-            else:
-                base_score -= 5
+        priority_counts = Counter(map(attrgetter('priority'), suggestions))
+        high = priority_counts["high"]
+        medium = priority_counts["medium"]
+        base_score -= high * 15 + medium * 10 + (len(suggestions) - high - medium) * 5
         
         return max(0, min(100, base_score))
     
@@ -470,23 +696,19 @@ class CoreOptimizer:
     
     def _generate_summary(self, results: Dict[str, Any]):
         """生成汇总信息"""
+        reports = results['reports']
         quality_counts = {}
-        perf_count = 0
-        refactor_count = 0
-        
-        for report in results['reports']:
+        for report in reports:
             grade = report.quality_grade.value
             quality_counts[grade] = quality_counts.get(grade, 0) + 1
-            
-            for suggestion in report.suggestions:
-                if suggestion.type == OptimizationType.PERFORMANCE:
-                    perf_count += 1
-                elif suggestion.type == OptimizationType.CODE_REFACTOR:
-                    refactor_count += 1
+        
+        # 按类型计数在 Counter 内部完成，不再逐条比较
+        type_counts = Counter(map(attrgetter('type'),
+                                  chain.from_iterable(report.suggestions for report in reports)))
         
         results['summary']['code_quality'] = quality_counts
-        results['summary']['performance_issues'] = perf_count
-        results['summary']['refactor_suggestions'] = refactor_count
+        results['summary']['performance_issues'] = type_counts[OptimizationType.PERFORMANCE]
+        results['summary']['refactor_suggestions'] = type_counts[OptimizationType.CODE_REFACTOR]
     
     def generate_optimization_report(self, results: Dict[str, Any]) -> str:
         """生成优化报告"""
@@ -531,29 +753,32 @@ class CoreOptimizer:
     def export_results(self, results: Dict[str, Any], output_file: str):
         """导出结果到文件"""
         try:
-            # 转换为可序列化的格式
-            serializable_results = self._make_serializable(results)
-            
+            # 字典、列表由json直接编码，只有数据类和枚举经过 _json_default 转换
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(serializable_results, f, ensure_ascii=False, indent=2)
+                json.dump(results, f, ensure_ascii=False, indent=2, default=self._json_default)
             
             print(f"📄 结果已导出到: {output_file}")
             
         except Exception as e:
             self.logger.error(f"导出结果时出错: {e}")
     
-    def _make_serializable(self, obj):
-        """将对象转换为可序列化的格式"""
-        if isinstance(obj, dict):
-            return {k: self._make_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._make_serializable(item) for item in obj]
-        elif hasattr(obj, '__dict__'):
-            return self._make_serializable(obj.__dict__)
-        elif isinstance(obj, Enum):
+    @staticmethod
+    def _json_default(obj):
+        """json无法直接编码的对象：枚举取值，数据类及其他对象浅转换为字典"""
+        if isinstance(obj, Enum):
             return obj.value
-        else:
-            return obj
+        elif is_dataclass(obj):
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
+        elif hasattr(obj, '__dict__'):
+            return obj.__dict__
+        raise TypeError(f"无法序列化 {type(obj).__name__} 类型的对象")
+
+def _analyze_worker(file_path: str) -> RefactorReport:
+    """进程池任务：在子进程中用独立的分析器分析单个文件
+    
+    定义在模块级以便被pickle；每个任务新建分析器，子进程之间不共享缓存。
+    """
+    return CoreOptimizer(os.path.dirname(file_path))._analyze_single_file(file_path)
 
 def main():
     """主函数"""
@@ -563,6 +788,7 @@ def main():
     parser.add_argument("--project", default=".", help="项目路径")
     parser.add_argument("--output", default="optimization_report.json", help="输出文件")
     parser.add_argument("--verbose", action="store_true", help="详细输出")
+    parser.add_argument("--processes", type=int, default=None, help="并行分析的进程数，1表示单进程")
     
     args = parser.parse_args()
     
@@ -570,7 +796,7 @@ def main():
         logging.basicConfig(level=logging.DEBUG)
     
     optimizer = CoreOptimizer(args.project)
-    results = optimizer.run_full_optimization_analysis()
+    results = optimizer.run_full_optimization_analysis(args.processes)
     
     # 生成报告
     report = optimizer.generate_optimization_report(results)
@@ -3,21 +3,84 @@
 整合平衡性分析、性能优化、自动化测试等开发工具
 """
 
+import copy
 import os
 import sys
 import json
 import time
 import argparse
-from typing import Dict, List, Any, Optional
+import bisect
+import multiprocessing
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from datetime import date
+from enum import Enum
 import logging
 
+# orjson为可选依赖：有则用其C实现的编码器保存分析结果，否则退回标准库json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 导入各个模块
 from balance_analyzer import BalanceAnalyzer, BalanceMetric
 from game_tester import GameTester, TestConfiguration, TestStrategy, TestDifficulty
 from performance_optimizer import PerformanceOptimizer, global_optimizer
 from config_manager import ConfigManager, get_config
 
+# 配置文件必须包含的配置节（按报告中的顺序）
+REQUIRED_CONFIG_SECTIONS = (
+    "game_balance",
+    "ui_settings",
+    "debug_settings",
+    "multiplayer",
+    "achievements",
+    "localization"
+)
+
+# 配置验证结果的最长复用时间（秒）；配置也可能在内存中被修改，不能只看文件修改时间
+CONFIG_VALIDATION_TTL = 60
+
+# 评分等级表：分数不低于第i个阈值时取第i+1个等级
+_BALANCE_THRESHOLDS = (40, 55, 70, 85)
+_BALANCE_LABELS = ("严重失衡", "较差", "可接受", "良好", "优秀")
+_PERFORMANCE_THRESHOLDS = (35, 55, 70, 85)
+_PERFORMANCE_LABELS = ("严重问题", "较差", "可接受", "良好", "优秀")
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+def _to_jsonable(obj: Any) -> Any:
+    """递归转换为JSON原生类型：枚举取值，日期转ISO字符串，集合/元组转列表，其余对象转字符串"""
+    if isinstance(obj, Enum):
+        return _to_jsonable(obj.value)
+    if isinstance(obj, _JSON_SCALARS):
+        return obj
+    if isinstance(obj, dict):
+        return {_to_jsonable_key(k): _to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [_to_jsonable(item) for item in obj]
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return str(obj)
+
+def _to_jsonable_key(key: Any) -> Any:
+    """字典键只保留JSON可接受的标量，枚举取值，其余转字符串"""
+    if isinstance(key, Enum):
+        key = key.value
+    return key if isinstance(key, _JSON_SCALARS) else str(key)
+
+def _json_bytes(obj: Any) -> bytes:
+    """将已由 _to_jsonable 转换过的结果编码为带缩进的UTF-8 JSON字节串"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _run_suite(config: TestConfiguration) -> Dict[str, Any]:
+    """进程池任务：在子进程中用新的测试器运行一组测试（定义在模块级以便被pickle）"""
+    return GameTester().run_test_suite(config)
+
 class DevToolsManager:
     """开发工具管理器"""
     
@@ -27,19 +90,26 @@ class DevToolsManager:
         self.game_tester = GameTester()
         self.performance_optimizer = PerformanceOptimizer()
         self.config_manager = ConfigManager()
+        # (配置文件修改时间, 验证时间, 验证结果)，文件未变化且未过期时复用
+        self._config_validation: Optional[Tuple[Optional[int], float, Dict[str, Any]]] = None
         
         self.logger.info("开发工具集已初始化")
     
     def _setup_logging(self) -> logging.Logger:
-        """设置日志"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler('dev_tools.log', encoding='utf-8')
-            ]
-        )
+        """设置日志
+        
+        根日志器已配置过时 basicConfig 不会生效，此时不再创建处理器，避免每次实例化都打开日志文件；
+        日志文件延迟到第一条日志写出时才打开。
+        """
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                handlers=[
+                    logging.StreamHandler(),
+                    logging.FileHandler('dev_tools.log', encoding='utf-8', delay=True)
+                ]
+            )
         return logging.getLogger(__name__)
     
     def run_full_analysis(self, output_dir: str = "analysis_results") -> Dict[str, Any]:
@@ -94,34 +164,30 @@ class DevToolsManager:
     
     def _run_balance_tests(self) -> Dict[str, Any]:
         """运行平衡性测试"""
-        # 配置测试参数
+        # 配置测试参数；三组测试互不依赖，在子进程中并行运行，子进程内不再开线程
         test_configs = [
             TestConfiguration(
                 num_games=50,
                 player_strategies=[TestStrategy.BALANCED, TestStrategy.BALANCED],
                 difficulty=TestDifficulty.NORMAL,
-                parallel_games=4
+                parallel_games=1
             ),
             TestConfiguration(
                 num_games=30,
                 player_strategies=[TestStrategy.AGGRESSIVE, TestStrategy.DEFENSIVE],
                 difficulty=TestDifficulty.NORMAL,
-                parallel_games=4
+                parallel_games=1
             ),
             TestConfiguration(
                 num_games=30,
                 player_strategies=[TestStrategy.DAO_XING_FOCUSED, TestStrategy.CHENG_YI_FOCUSED],
                 difficulty=TestDifficulty.NORMAL,
-                parallel_games=4
+                parallel_games=1
             )
         ]
         
-        all_results = []
-        
-        for i, config in enumerate(test_configs):
-            self.logger.info(f"执行平衡性测试 {i+1}/{len(test_configs)}")
-            result = self.game_tester.run_test_suite(config)
-            all_results.append(result)
+        self.logger.info(f"执行平衡性测试 {len(test_configs)} 组")
+        all_results = self._run_suites(test_configs)
         
         # 生成平衡性报告
         balance_reports = {}
@@ -182,21 +248,21 @@ class DevToolsManager:
             TestStrategy.INTERACTION_HEAVY
         ]
         
-        strategy_results = {}
-        
-        # 每种策略与平衡策略对战
-        for strategy in strategies_to_test:
-            self.logger.info(f"测试策略: {strategy.value}")
-            
-            config = TestConfiguration(
+        # 每种策略与平衡策略对战；各策略分别在子进程中运行，子进程内不再开线程
+        configs = [
+            TestConfiguration(
                 num_games=25,
                 player_strategies=[strategy, TestStrategy.BALANCED],
                 difficulty=TestDifficulty.NORMAL,
-                parallel_games=4
+                parallel_games=1
             )
-            
-            result = self.game_tester.run_test_suite(config)
-            strategy_results[strategy.value] = result
+            for strategy in strategies_to_test
+        ]
+        self.logger.info(f"测试策略: {', '.join(strategy.value for strategy in strategies_to_test)}")
+        
+        results = self._run_suites(configs)
+        strategy_results = {strategy.value: result
+                            for strategy, result in zip(strategies_to_test, results)}
         
         # 分析策略表现
         strategy_analysis = self._analyze_strategy_performance(strategy_results)
@@ -207,8 +273,44 @@ class DevToolsManager:
             "recommendations": self._generate_strategy_recommendations(strategy_analysis)
         }
     
+    def _run_suites(self, configs: List[TestConfiguration]) -> List[Dict[str, Any]]:
+        """在进程池中并行运行多组互不相关的测试，结果按配置顺序返回
+        
+        无法创建子进程时退回到在当前进程中顺序运行。
+        """
+        try:
+            pool = multiprocessing.Pool(min(len(configs), os.cpu_count() or 1))
+        except OSError as e:
+            self.logger.warning(f"无法创建进程池，改为顺序运行: {e}")
+            return [self.game_tester.run_test_suite(config) for config in configs]
+        
+        with pool:
+            return pool.map(_run_suite, configs)
+    
     def _validate_configuration(self) -> Dict[str, Any]:
-        """验证配置"""
+        """验证配置
+        
+        结果按配置文件的修改时间缓存，文件未变化且距上次验证不超过 CONFIG_VALIDATION_TTL 秒时，
+        直接返回上次验证结果的副本（完整分析与开发报告因此共用一次验证）。
+        """
+        try:
+            config_mtime = os.stat("game_config.json").st_mtime_ns
+        except OSError:
+            config_mtime = None
+        
+        now = time.time()
+        cached = self._config_validation
+        if cached is None or cached[0] != config_mtime or now - cached[1] >= CONFIG_VALIDATION_TTL:
+            cached = self._config_validation = (config_mtime, now, self._run_config_validation())
+        return copy.deepcopy(cached[2])
+    
+    def reload_config(self):
+        """重新加载配置文件，并使缓存的配置验证结果失效"""
+        self.config_manager.reload_config()
+        self._config_validation = None
+    
+    def _run_config_validation(self) -> Dict[str, Any]:
+        """执行配置验证"""
         validation_results = {
             "config_file_exists": os.path.exists("game_config.json"),
             "config_loaded": False,
@@ -223,21 +325,15 @@ class DevToolsManager:
             validation_results["config_loaded"] = True
             
             # 验证必要的配置项
-            required_sections = [
-                "game_balance",
-                "ui_settings", 
-                "debug_settings",
-                "multiplayer",
-                "achievements",
-                "localization"
-            ]
-            
-            for section in required_sections:
-                if section in config:
-                    validation_results["config_completeness"][section] = True
-                else:
-                    validation_results["config_completeness"][section] = False
-                    validation_results["validation_errors"].append(f"缺少配置节: {section}")
+            present = config.keys() & REQUIRED_CONFIG_SECTIONS
+            validation_results["config_completeness"] = {
+                section: section in present for section in REQUIRED_CONFIG_SECTIONS
+            }
+            if len(present) < len(REQUIRED_CONFIG_SECTIONS):
+                validation_results["validation_errors"].extend(
+                    f"缺少配置节: {section}" for section in REQUIRED_CONFIG_SECTIONS
+                    if section not in present
+                )
             
             # 验证数值范围
             self._validate_config_values(config, validation_results)
@@ -280,6 +376,8 @@ class DevToolsManager:
             "strategy_rankings": []
         }
         
+        # 在同一次遍历中提取指标并计算综合评分，不再为排名二次查表
+        strategy_scores = []
         for strategy_name, result in strategy_results.items():
             if "analysis" in result:
                 analysis_data = result["analysis"]
@@ -289,6 +387,7 @@ class DevToolsManager:
                 winner_dist = victory_analysis.get("winner_distribution", {})
                 total_games = sum(winner_dist.values())
                 
+                win_rate = None
                 if total_games > 0:
                     strategy_wins = winner_dist.get("Player_1", 0)  # 假设Player_1使用测试策略
                     win_rate = strategy_wins / total_games
@@ -300,31 +399,26 @@ class DevToolsManager:
                 
                 # 策略效率分析
                 strategy_performance = analysis_data.get("strategy_performance", {})
+                efficiency = {}
                 if strategy_name in strategy_performance:
                     perf = strategy_performance[strategy_name]
-                    analysis["resource_efficiency"][strategy_name] = {
+                    efficiency = analysis["resource_efficiency"][strategy_name] = {
                         "avg_dao_xing": perf.get("average_dao_xing", 0),
                         "avg_cheng_yi": perf.get("average_cheng_yi", 0),
                         "win_rate": perf.get("win_rate", 0)
                     }
+                
+                # 综合评分 (胜率 * 0.6 + 资源效率 * 0.4)，只对有胜率数据的策略排名
+                if win_rate is not None:
+                    resource_score = (efficiency.get("avg_dao_xing", 0) + efficiency.get("avg_cheng_yi", 0)) / 35  # 归一化
+                    strategy_scores.append({
+                        "strategy": strategy_name,
+                        "win_rate": win_rate,
+                        "resource_score": resource_score,
+                        "total_score": win_rate * 0.6 + resource_score * 0.4
+                    })
         
         # 策略排名
-        strategy_scores = []
-        for strategy_name in analysis["win_rates"]:
-            win_rate = analysis["win_rates"].get(strategy_name, 0)
-            efficiency = analysis["resource_efficiency"].get(strategy_name, {})
-            
-            # 综合评分 (胜率 * 0.6 + 资源效率 * 0.4)
-            resource_score = (efficiency.get("avg_dao_xing", 0) + efficiency.get("avg_cheng_yi", 0)) / 35  # 归一化
-            total_score = win_rate * 0.6 + resource_score * 0.4
-            
-            strategy_scores.append({
-                "strategy": strategy_name,
-                "win_rate": win_rate,
-                "resource_score": resource_score,
-                "total_score": total_score
-            })
-        
         analysis["strategy_rankings"] = sorted(strategy_scores, key=lambda x: x["total_score"], reverse=True)
         
         return analysis
@@ -415,7 +509,7 @@ class DevToolsManager:
         all_recommendations.extend(performance_results.get("performance_recommendations", []))
         all_recommendations.extend(strategy_results.get("recommendations", []))
         
-        report["recommendations"] = list(set(all_recommendations))  # 去重
+        report["recommendations"] = list(dict.fromkeys(all_recommendations))  # 去重，保持原有顺序
         
         # 下一步行动
         if avg_balance_score < 50:
@@ -429,40 +523,20 @@ class DevToolsManager:
     
     def _get_balance_level(self, score: float) -> str:
         """获取平衡性等级"""
-        if score >= 85:
-            return "优秀"
-        elif score >= 70:
-            return "良好"
-        elif score >= 55:
-            return "可接受"
-        elif score >= 40:
-            return "较差"
-        else:
-            return "严重失衡"
+        return _BALANCE_LABELS[bisect.bisect_right(_BALANCE_THRESHOLDS, score)]
     
     def _get_performance_level(self, score: float) -> str:
         """获取性能等级"""
-        if score >= 85:
-            return "优秀"
-        elif score >= 70:
-            return "良好"
-        elif score >= 55:
-            return "可接受"
-        elif score >= 35:
-            return "较差"
-        else:
-            return "严重问题"
+        return _PERFORMANCE_LABELS[bisect.bisect_right(_PERFORMANCE_THRESHOLDS, score)]
     
     def _save_analysis_results(self, results: Dict[str, Any], output_dir: str):
         """保存分析结果"""
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        
-        # 保存完整结果
-        full_results_file = os.path.join(output_dir, f"full_analysis_{timestamp}.json")
-        with open(full_results_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2, default=str)
+        # 一次性转换为JSON原生类型，编码时无需逐个对象回调 default
+        results = _to_jsonable(results)
+        # 文件名使用分析开始时记录的时间戳，与结果中的 timestamp 字段一致
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(results["timestamp"]))
         
-        # 保存简化报告
+        # 先保存体积小的简化报告，完整结果写入失败时它也已落盘
         summary_file = os.path.join(output_dir, f"analysis_summary_{timestamp}.json")
         summary = {
             "timestamp": results["timestamp"],
@@ -472,8 +546,13 @@ class DevToolsManager:
             "recommendations": results.get("comprehensive_report", {}).get("recommendations", [])
         }
         
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2, default=str)
+        with open(summary_file, 'wb') as f:
+            f.write(_json_bytes(summary))
+        
+        # 保存完整结果
+        full_results_file = os.path.join(output_dir, f"full_analysis_{timestamp}.json")
+        with open(full_results_file, 'wb') as f:
+            f.write(_json_bytes(results))
         
         self.logger.info(f"分析结果已保存到 {output_dir}")
     
@@ -141,7 +141,7 @@ class EnhancedAIPlayer:
             "qi_ratio": player.qi / max(total_resources, 1),
             "dao_xing_ratio": player.dao_xing / max(total_resources, 1),
             "cheng_yi_ratio": player.cheng_yi / max(total_resources, 1),
-            "balance_score": 1.0 - abs(player.yin_yang_balance - 0.5) * 2,
+            "balance_score": player.yin_yang_balance.balance_ratio,  # 越接近1越平衡
             "resource_efficiency": self._calculate_resource_efficiency(player)
         }
     
@@ -425,19 +425,12 @@ class EnhancedAIPlayer:
         if len(my_zones) < 2:
             return {"potential": 0.0, "active_synergies": [], "recommendations": []}
         
-        active_synergies = []
-        total_potential = 0.0
-        
-        for i, zone1 in enumerate(my_zones):
-            for zone2 in my_zones[i+1:]:
-                synergy = enhanced_hexagram_system.calculate_synergy(zone1, zone2)
-                if synergy["compatibility"] > 0.5:
-                    active_synergies.append({
-                        "zones": (zone1, zone2),
-                        "strength": synergy["compatibility"],
-                        "type": synergy["synergy_type"]
-                    })
-                    total_potential += synergy["compatibility"]
+        # 两两组合中总体协同度超过0.5的区域对
+        active_synergies = [
+            {"zones": (zone1, zone2), "strength": strength}
+            for zone1, zone2, strength in enhanced_hexagram_system.find_synergy_pairs(my_zones, 0.5)
+        ]
+        total_potential = sum(synergy["strength"] for synergy in active_synergies)
         
         average_potential = total_potential / max(len(my_zones) * (len(my_zones) - 1) / 2, 1)
         
@@ -697,7 +690,7 @@ class EnhancedAIPlayer:
         score += control_ratio * 0.4  # 最多40%来自领土控制
         
         # 阴阳平衡评估
-        balance_score = 1.0 - abs(player.yin_yang_balance - 0.5) * 2
+        balance_score = player.yin_yang_balance.balance_ratio  # 越接近1越平衡
         score += balance_score * 0.2  # 最多20%来自平衡
         
         # 协同效应评估
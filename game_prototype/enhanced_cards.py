@@ -323,9 +323,8 @@ class EnhancedCardSystem:
         
         # 影响力奖励
         if card.influence_bonus > 0:
-            zone_data = game_state.board.gua_zones.get(target_gua, {})
-            if "markers" in zone_data:
-                zone_data["markers"][player.name] = zone_data["markers"].get(player.name, 0) + card.influence_bonus
+            if target_gua in game_state.board.gua_zones:
+                game_state.board.update_zone_markers(target_gua, player.name, card.influence_bonus)
                 effects_applied.append(f"+{card.influence_bonus}影响力于{target_gua}")
         
         # 特殊效果
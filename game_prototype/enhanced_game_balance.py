@@ -68,8 +68,8 @@ class EnhancedGameBalance:
             player.cheng_yi = self.config.initial_cheng_yi
             
             # 调整手牌到合适数量
-            while len(player.hand) > self.config.initial_hand_size:
-                player.hand.pop()
+            if len(player.hand) > self.config.initial_hand_size:
+                player.hand = player.hand[:self.config.initial_hand_size]
             
             # 初始化动态难度
             self.dynamic_difficulty[player.name] = 1.0
@@ -132,7 +132,7 @@ class EnhancedGameBalance:
             hand_costs = [(i, self.estimate_card_cost(card)) for i, card in enumerate(player.hand)]
             hand_costs.sort(key=lambda x: x[1], reverse=True)  # 按成本降序
             discard_index = hand_costs[0][0]
-            player.hand.pop(discard_index)
+            player.hand = player.hand[:discard_index] + player.hand[discard_index + 1:]
         
         return player
     
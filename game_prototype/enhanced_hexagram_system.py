@@ -50,6 +50,7 @@ class EnhancedHexagramSystem:
         self.hexagram_lines = self._initialize_hexagram_lines()
         self.relations = self._calculate_all_relations()
         self.strategic_combinations = self._define_strategic_combinations()
+        self.relation_counts = self._count_pair_relations()
         
     def _initialize_hexagram_lines(self) -> Dict[str, List[bool]]:
         """初始化所有卦象的爻线组合"""
@@ -242,6 +243,15 @@ class EnhancedHexagramSystem:
             }
         }
     
+    def _count_pair_relations(self) -> Dict[Tuple[str, str], int]:
+        """统计每个(本卦, 相关卦)组合出现的关系数量"""
+        counts = {}
+        for gua_name, relations in self.relations.items():
+            for relation in relations:
+                key = (gua_name, relation.related)
+                counts[key] = counts.get(key, 0) + 1
+        return counts
+    
     def get_hexagram_relations(self, gua_name: str) -> List[HexagramRelation]:
         """获取指定卦象的所有关系"""
         return self.relations.get(gua_name, [])
@@ -324,6 +334,33 @@ class EnhancedHexagramSystem:
         
         return synergy_scores
     
+    def find_synergy_pairs(self, hexagrams: List[str],
+                           threshold: float) -> List[Tuple[str, str, float]]:
+        """找出两两组合中总体协同度超过阈值的卦象对
+        
+        结果与逐对调用 calculate_hexagram_synergy 相同：两卦组合的五行平衡度恒为0，
+        阴阳和谐度只取决于两卦阴阳是否相异，策略深度取自预先统计的关系数量。
+        """
+        relation_counts = self.relation_counts
+        is_yin = [
+            GUA_64_INFO[gua_name]["yin_yang"] == YinYang.YIN if gua_name in GUA_64_INFO else None
+            for gua_name in hexagrams
+        ]
+        
+        pairs = []
+        for i, gua1 in enumerate(hexagrams):
+            yin1 = is_yin[i]
+            for j in range(i + 1, len(hexagrams)):
+                gua2 = hexagrams[j]
+                yin2 = is_yin[j]
+                harmony = 1.0 if yin1 is not None and yin2 is not None and yin1 != yin2 else 0.0
+                relation_count = relation_counts.get((gua1, gua2), 0) + relation_counts.get((gua2, gua1), 0)
+                overall = harmony * 0.4 + min(relation_count / 10.0, 1.0) * 0.3
+                if overall > threshold:
+                    pairs.append((gua1, gua2, overall))
+        
+        return pairs
+    
     def suggest_next_hexagram(self, current_hexagrams: List[str], 
                             available_hexagrams: List[str]) -> List[Tuple[str, float]]:
         """建议下一个最佳卦象选择"""
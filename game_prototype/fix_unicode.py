@@ -4,6 +4,8 @@
 将emoji字符替换为兼容的文本符号
 """
 
+import hashlib
+import json
 import os
 import re
 import sys
@@ -52,21 +54,55 @@ EMOJI_REPLACEMENTS = {
     '📜': '[卷]',
 }
 
+# 所有emoji合并成一个正则，一次扫描完成全部替换；长的排在前面，保证带变体选择符的emoji整体匹配
+_EMOJI_RE = re.compile('|'.join(
+    re.escape(emoji) for emoji in sorted(EMOJI_REPLACEMENTS, key=len, reverse=True)
+))
+
+# 记录上次处理后各文件的 (修改时间, 大小)，未变化的文件再次运行时无需读取
+CACHE_FILE = '.fix_unicode_cache.json'
+
+# 替换表的指纹；表有增改时旧缓存作废，所有文件按新表重新处理
+_REPLACEMENTS_HASH = hashlib.sha256(
+    json.dumps(EMOJI_REPLACEMENTS, ensure_ascii=False, sort_keys=True).encode('utf-8')
+).hexdigest()
+
+def _load_cache(cache_path):
+    """读取文件状态缓存；缓存不存在、损坏或由其他版本的替换表生成时返回空字典"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('replacements') != _REPLACEMENTS_HASH:
+        return {}
+    files = cache.get('files')
+    return files if isinstance(files, dict) else {}
+
+def _file_signature(file_path):
+    """文件的 (修改时间, 大小)，用于判断文件自上次处理后是否变化"""
+    stat = os.stat(file_path)
+    return [stat.st_mtime_ns, stat.st_size]
+
 def fix_unicode_in_file(file_path):
-    """修复单个文件中的Unicode问题"""
+    """修复单个文件中的Unicode问题
+    
+    返回 True 表示已修复，False 表示无需修复，None 表示处理出错。
+    """
     try:
         # 读取文件内容
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        original_content = content
+        # 纯ASCII文件不可能包含emoji
+        if content.isascii():
+            return False
         
         # 替换emoji字符
-        for emoji, replacement in EMOJI_REPLACEMENTS.items():
-            content = content.replace(emoji, replacement)
+        content, replaced = _EMOJI_RE.subn(lambda match: EMOJI_REPLACEMENTS[match.group(0)], content)
         
         # 如果内容有变化，写回文件
-        if content != original_content:
+        if replaced:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             return True
@@ -75,7 +111,7 @@ def fix_unicode_in_file(file_path):
         
     except Exception as e:
         print(f"处理文件 {file_path} 时出错: {e}")
-        return False
+        return None
 
 def main():
     """主函数"""
@@ -103,19 +139,38 @@ def main():
     ]
     
     current_dir = os.path.dirname(os.path.abspath(__file__))
+    cache_path = os.path.join(current_dir, CACHE_FILE)
+    cache = _load_cache(cache_path)
     fixed_count = 0
     
     for filename in files_to_fix:
         file_path = os.path.join(current_dir, filename)
         if os.path.exists(file_path):
-            if fix_unicode_in_file(file_path):
+            if cache.get(filename) == _file_signature(file_path):
+                print(f"[跳过] {filename} 自上次处理后未变化")
+                continue
+            result = fix_unicode_in_file(file_path)
+            if result is None:
+                # 出错的文件不写入缓存，下次运行时重新处理
+                print(f"[失败] {filename} 处理出错，未修复")
+                cache.pop(filename, None)
+                continue
+            if result:
                 print(f"[完成] 修复了 {filename}")
                 fixed_count += 1
             else:
                 print(f"[跳过] {filename} 无需修复")
+            cache[filename] = _file_signature(file_path)
         else:
             print(f"[警告] 文件不存在: {filename}")
     
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'replacements': _REPLACEMENTS_HASH, 'files': cache},
+                      f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        print(f"[警告] 无法保存文件状态缓存: {e}")
+    
     print(f"\n修复完成！共处理了 {fixed_count} 个文件")
     print("现在游戏应该可以在Windows环境下正常运行了")
 
@@ -1,3 +1,4 @@
+from collections import deque
 from enum import Enum, auto
 from typing import Optional, List, Dict
 
@@ -49,15 +50,30 @@ class Avatar:
         self.description = description
         self.ability_description = ability_description
 
+# Sentinel for optional slots that have not been assigned yet.
+_UNSET = object()
+
+# Only the latest events are kept for display; older ones are dropped on append.
+RECENT_EVENTS_LIMIT = 16
+
 class Player:
     """Represents a player in the game."""
+    # Attached on demand by other game modes and action handlers.
+    _ON_DEMAND_SLOTS = ("biangua_history", "wuxing_affinity", "action_bonus", "defense_bonus")
+    __slots__ = (
+        "name", "avatar", "dao_xing", "cheng_yi", "qi", "hand", "position",
+        "influence_markers", "current_task_card", "placed_influence_this_turn",
+        "destiny_chart", "yin_yang_balance", "wuxing_affinities", "active_wisdom",
+        "transformation_history", "valid_actions_cache",
+    ) + _ON_DEMAND_SLOTS
+
     def __init__(self, name: str, avatar: Avatar):
         self.name = name
         self.avatar = avatar
         self.dao_xing: int = 0
         self.cheng_yi: int = 0
         self.qi: int = 0
-        self.hand: list[GuaCard] = []
+        self.hand: tuple[GuaCard, ...] = ()  # Immutable so clones can share it
         self.position: Zone = Zone.DI
         self.influence_markers: int = 15
         self.current_task_card: Optional[GuaCard] = None
@@ -72,6 +88,48 @@ class Player:
         }
         self.active_wisdom: List[str] = []  # 激活的智慧格言
         self.transformation_history: List[str] = []  # 变卦历史
+        self.valid_actions_cache = None  # (key, actions) from get_valid_actions
+
+    def clone(self) -> "Player":
+        """Return an independent copy of this player, much cheaper than deepcopy.
+
+        Cards, the hand tuple and the avatar are never mutated, so they are
+        shared by reference; only the mutable containers are copied.
+        """
+        new = Player.__new__(Player)
+        new.name = self.name
+        new.avatar = self.avatar
+        new.dao_xing = self.dao_xing
+        new.cheng_yi = self.cheng_yi
+        new.qi = self.qi
+        new.hand = tuple(self.hand)  # No copy when the hand is already a tuple
+        new.position = self.position
+        new.influence_markers = self.influence_markers
+        new.current_task_card = self.current_task_card
+        new.placed_influence_this_turn = self.placed_influence_this_turn
+        new.valid_actions_cache = self.valid_actions_cache
+        new.yin_yang_balance = balance = self.yin_yang_balance
+        new.destiny_chart = list(self.destiny_chart)
+        if isinstance(balance, YinYangBalance):
+            new.yin_yang_balance = YinYangBalance(balance.yin_points, balance.yang_points)
+        new.wuxing_affinities = dict(self.wuxing_affinities)
+        new.active_wisdom = list(self.active_wisdom)
+        new.transformation_history = list(self.transformation_history)
+        for attr in Player._ON_DEMAND_SLOTS:
+            value = getattr(self, attr, _UNSET)
+            if value is not _UNSET:
+                setattr(new, attr, value.copy() if isinstance(value, (list, dict)) else value)
+        return new
+
+def find_zone_leader(markers: Dict[str, int]) -> tuple:
+    """Return (leader, leader_count) for a markers dict; leader is None on a tie."""
+    leader, leader_count, tied = None, 0, False
+    for player_name, influence in markers.items():
+        if influence > leader_count:
+            leader, leader_count, tied = player_name, influence, False
+        elif influence == leader_count:
+            tied = True
+    return (None if tied else leader), leader_count
 
 class GameBoard:
     """Represents the state of the game board."""
@@ -80,25 +138,141 @@ class GameBoard:
         elif num_players == 3: limit = 6
         else: limit = 7
         self.base_limit = limit
+        self.control_threshold = limit // 2 + 1  # Influence needed to control a zone
+        # "leader"/"leader_count" track the unique top marker holder (None on a
+        # tie) and are maintained incrementally by update_zone_markers.
         self.gua_zones = {
-            "乾": {"markers": {}, "controller": None}, "坤": {"markers": {}, "controller": None},
-            "震": {"markers": {}, "controller": None}, "巽": {"markers": {}, "controller": None},
-            "坎": {"markers": {}, "controller": None}, "离": {"markers": {}, "controller": None},
-            "艮": {"markers": {}, "controller": None}, "兑": {"markers": {}, "controller": None},
+            name: {"markers": {}, "controller": None, "leader": None, "leader_count": 0}
+            for name in ("乾", "坤", "震", "巽", "坎", "离", "艮", "兑")
         }
+        # Inverted controller index (controller -> frozenset of zone names), kept
+        # in step by set_zone_controller and reindex_controller.
+        self.owner_index = {}
         self.player_positions = {}
 
+    def clone(self) -> "GameBoard":
+        """Return a copy-on-write copy of the board.
+
+        Zone records and the position map are shared with the original; actions
+        that change them must install a new record (see update_zone_markers and
+        set_player_position) instead of mutating in place.
+        """
+        new = GameBoard.__new__(GameBoard)
+        new.__dict__.update(self.__dict__)
+        new.gua_zones = dict(self.gua_zones)
+        new.owner_index = dict(self.owner_index)
+        return new
+
+    def update_zone_markers(self, zone_name: str, player_name: str, delta: int) -> dict:
+        """Replace a zone record with one whose markers include the delta for player_name.
+
+        The zone leader is updated in O(1) for the usual positive delta and
+        rescanned only when influence is removed.
+        """
+        old = self.gua_zones[zone_name]
+        markers = old["markers"]
+        count = markers.get(player_name, 0) + delta
+        new_markers = {**markers, player_name: count}
+        if delta < 0 or "leader_count" not in old:
+            leader, leader_count = find_zone_leader(new_markers)
+        else:
+            leader, leader_count = old["leader"], old["leader_count"]
+            if player_name == leader:
+                leader_count = count
+            elif count > leader_count:
+                leader, leader_count = player_name, count
+            elif count == leader_count:
+                leader = None
+        new_zone = {**old, "markers": new_markers, "leader": leader, "leader_count": leader_count}
+        self.gua_zones[zone_name] = new_zone
+        return new_zone
+
+    def zones_owned_by(self, controller) -> frozenset:
+        """Return the names of the zones currently controlled by controller."""
+        return self.owner_index.get(controller, frozenset())
+
+    def set_zone_controller(self, zone_name: str, controller) -> dict:
+        """Replace a zone record with one controlled by controller and update the owner index."""
+        old = self.gua_zones[zone_name]
+        new_zone = {**old, "controller": controller}
+        self.gua_zones[zone_name] = new_zone
+        self.reindex_controller(zone_name, old.get("controller"), controller)
+        return new_zone
+
+    def reindex_controller(self, zone_name: str, previous, controller):
+        """Move zone_name between owner index entries after its controller changed.
+
+        Index entries are replaced rather than mutated, so clones that share
+        them are unaffected.
+        """
+        if previous == controller:
+            return
+        index = self.owner_index
+        if previous is not None:
+            remaining = index.get(previous, frozenset()) - {zone_name}
+            if remaining:
+                index[previous] = remaining
+            else:
+                index.pop(previous, None)
+        if controller is not None:
+            index[controller] = index.get(controller, frozenset()) | {zone_name}
+
+    def set_player_position(self, player_name: str, zone: "Zone"):
+        """Replace the position map with one that records the player's new zone."""
+        self.player_positions = {**self.player_positions, player_name: zone}
+
 class GameState:
     """Represents the entire state of the game."""
+    __slots__ = ("board", "players", "current_player_index", "turn", "current_tian_shi",
+                 "winner", "recent_events")
+
     def __init__(self, players: list[Player]):
         self.board = GameBoard(num_players=len(players))
         self.players = players
         self.current_player_index = 0
         self.turn = 1
         self.current_tian_shi = None # The active Tian Shi card for the round
+        self.recent_events = deque(maxlen=RECENT_EVENTS_LIMIT)
         for player in self.players:
             self.board.player_positions[player.name] = player.position
 
+    def _shallow_copy(self) -> "GameState":
+        """Copy the slot values without cloning anything they refer to."""
+        new = GameState.__new__(GameState)
+        new.board = self.board
+        new.players = self.players
+        new.current_player_index = self.current_player_index
+        new.turn = self.turn
+        new.current_tian_shi = self.current_tian_shi
+        for attr in ("winner", "recent_events"):
+            value = getattr(self, attr, _UNSET)
+            if value is not _UNSET:
+                setattr(new, attr, value)
+        return new
+
+    def clone(self) -> "GameState":
+        """Return a structural copy of the game state for action resolution.
+
+        Replaces copy.deepcopy: the board and players are cloned field by field,
+        everything immutable is shared.
+        """
+        new = self._shallow_copy()
+        new.board = self.board.clone()
+        new.players = [player.clone() for player in self.players]
+        if hasattr(self, "recent_events"):
+            new.recent_events = deque(self.recent_events, maxlen=RECENT_EVENTS_LIMIT)
+        return new
+
+    def clone_with_player_mutations(self, player_idx: int) -> "GameState":
+        """Return a copy in which only players[player_idx] may be mutated.
+
+        The board and every other player are shared with the original state.
+        """
+        new = self._shallow_copy()
+        new.players = list(self.players)
+        new.players[player_idx] = self.players[player_idx].clone()
+        return new
+
     def get_current_player(self) -> Player:
         return self.players[self.current_player_index]
 
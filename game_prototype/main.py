@@ -67,7 +67,7 @@ def setup_game(num_players: int = 2) -> GameState:
     for player in game_state.players:
         for _ in range(4):  # Increased initial hand size for more options
             if deck:
-                player.hand.append(deck.pop())
+                player.hand += (deck.pop(),)
         # Optimized initial resources for better game experience
         player.qi = 8  # Increased qi for more action choices
         player.dao_xing = 1  # Start with some wisdom
@@ -283,7 +283,7 @@ def run_action_phase(game_state: GameState, player: Player, mods: Modifiers, is_
             enhanced_ui.display_action_menu(actions_menu)
         else:
             print(f"\n{player.name}'s turn - AP: {ap}")
-            for key, action_data in actions_menu.items():
+            for key, action_data in enumerate(actions_menu, 1):
                 print(f"{key}: {action_data.get('description', 'Unknown action')} (Cost: {action_data.get('cost', 0)} AP)")
 
         # Get choice from human or bot
@@ -299,7 +299,7 @@ def run_action_phase(game_state: GameState, player: Player, mods: Modifiers, is_
                 print("\nGame interrupted. Exiting...")
                 return game_state
 
-        action_data = actions_menu.get(choice)
+        action_data = actions_menu[choice - 1] if 1 <= choice <= len(actions_menu) else None
         if not action_data: 
             print("Invalid action choice.")
             continue
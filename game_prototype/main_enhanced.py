@@ -87,7 +87,7 @@ def setup_game_enhanced(num_players: int = 2) -> GameState:
         for _ in range(initial_hand_size):
             if GAME_DECK:
                 card = random.choice(GAME_DECK)
-                player.hand.append(card)
+                player.hand += (card,)
         
         players.append(player)
     
@@ -351,8 +351,8 @@ def run_action_phase_enhanced(game_state: GameState, player: Player,
             # AI选择
             choice = get_bot_choice(actions_menu)
 
-        if choice in actions_menu:
-            action_data = actions_menu[choice]
+        if 1 <= choice <= len(actions_menu):
+            action_data = actions_menu[choice - 1]
             action_cost = action_data.get('cost', 0)
             
             if not is_ai_player:
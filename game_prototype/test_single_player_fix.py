@@ -58,13 +58,13 @@ def test_action_phase_mock():
          patch('main.get_bot_choice', return_value=1):
         
         # 模拟动作菜单
-        mock_actions.return_value = {
-            1: {
+        mock_actions.return_value = [
+            {
                 'description': 'Pass turn',
                 'cost': 0,
                 'action': 'pass'
             }
-        }
+        ]
         
         # 测试人类玩家（应该等待输入）
         try:
@@ -0,0 +1,120 @@
+"""
+AI前瞻搜索单元测试
+用朴素的极小极大搜索核对 alpha-beta 剪枝与置换表的结果
+"""
+
+import random
+import unittest
+import sys
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from complete_enhanced_game import CompleteEnhancedGame, _SearchState, _SEARCH_WIN_SCORE
+from enhanced_ai_player import EnhancedAIPlayer, AIPersonality
+
+# 固定的小局面：(局面, 评估方)
+POSITIONS = [
+    (_SearchState(((5, 3, 2), (4, 4, 4)), (2, 1), 3, 0), 0),
+    (_SearchState(((5, 3, 2), (4, 4, 4)), (2, 1), 3, 0), 1),
+    (_SearchState(((17, 13, 13), (0, 1, 2)), (1, 4), 2, 1), 0),
+    (_SearchState(((18, 14, 13), (19, 15, 13)), (0, 0), 0, 0), 0),
+    (_SearchState(((3, 1, 1), (2, 2, 2), (1, 0, 4)), (1, 2, 0), 2, 2), 2),
+]
+
+
+def random_positions(count: int, seed: int):
+    """按固定种子生成的随机局面（2~3名玩家），用于覆盖更多剪枝路径"""
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(count):
+        players = rng.choice((2, 3))
+        resources = tuple((rng.randint(0, 20), rng.randint(0, 15), rng.randint(0, 15))
+                          for _ in range(players))
+        zone_counts = tuple(rng.randint(0, 3) for _ in range(players))
+        state = _SearchState(resources, zone_counts, rng.randint(0, 3), rng.randrange(players))
+        positions.append((state, rng.randrange(players)))
+    return positions
+
+
+def minimax(game: CompleteEnhancedGame, state: _SearchState, depth: int, me: int) -> float:
+    """不剪枝、不查表的极小极大搜索，计分规则与 _alphabeta 相同"""
+    winner = game._search_winner(state)
+    if winner is not None:
+        return _SEARCH_WIN_SCORE + depth if winner == me else -_SEARCH_WIN_SCORE - depth
+    if depth == 0:
+        return game._search_evaluate(state, me)
+    values = [minimax(game, child, depth - 1, me) for _, child in game._search_children(state)]
+    return max(values) if state.to_move == me else min(values)
+
+
+class TestAlphaBetaSearch(unittest.TestCase):
+    """测试 alpha-beta 搜索"""
+
+    def setUp(self):
+        self.game = CompleteEnhancedGame(interactive=False, seed=7)
+        self.game._setup_ai_battle(EnhancedAIPlayer("甲", AIPersonality.BALANCED),
+                                   EnhancedAIPlayer("乙", AIPersonality.AGGRESSIVE))
+
+    def test_full_window_matches_minimax(self):
+        """测试全窗口搜索的值与朴素极小极大一致"""
+        for state, me in POSITIONS:
+            for depth in range(1, 5):
+                with self.subTest(state=state, me=me, depth=depth):
+                    self.game._transposition_table = {}
+                    value = self.game._alphabeta(state, depth, float("-inf"), float("inf"), me)
+                    self.assertEqual(value, minimax(self.game, state, depth, me))
+
+    def test_shared_table_with_narrow_windows(self):
+        """测试置换表在窄窗口搜索之间共享时，各次结果仍满足窗口语义"""
+        rng = random.Random(11)
+        for state, me in POSITIONS + random_positions(60, seed=5):
+            depth = 3
+            expected = minimax(self.game, state, depth, me)
+            self.game._transposition_table = {}
+            for _ in range(30):
+                alpha = expected + rng.randint(-12, 12)
+                beta = alpha + rng.randint(1, 12)
+                value = self.game._alphabeta(state, depth, alpha, beta, me)
+                with self.subTest(state=state, me=me, alpha=alpha, beta=beta):
+                    if expected <= alpha:
+                        self.assertLessEqual(value, alpha)
+                    elif expected >= beta:
+                        self.assertGreaterEqual(value, beta)
+                    else:
+                        self.assertEqual(value, expected)
+            value = self.game._alphabeta(state, depth, float("-inf"), float("inf"), me)
+            self.assertEqual(value, expected)
+
+    def test_search_picks_minimax_best_action(self):
+        """测试根节点选出的行动在朴素极小极大下价值最高"""
+        game = self.game
+        player = game.game_state.players[0]
+        player.qi, player.dao_xing, player.cheng_yi = 6, 3, 1
+        game.difficulty_level = "hard"
+
+        action = game._search_ai_action(player, "meditate")
+
+        state = _SearchState(((6, 3, 1), (0, 0, 0)), (0, 0), len(game._neutral_zones), 0)
+        values = {name: minimax(game, child, 2, 0) for name, child in game._search_children(state)}
+        chosen = "claim" if action.startswith("claim:") else action
+        self.assertEqual(values[chosen], max(values.values()))
+
+    def test_headless_battle_runs_search(self):
+        """测试无界面AI对战会走到前瞻搜索并正常结束"""
+        game = self.game
+        calls = []
+        search = game._search_ai_action
+        game._search_ai_action = lambda player, preferred: calls.append(preferred) or search(player, preferred)
+
+        winner, turns = game._simulate_ai_vs_ai(EnhancedAIPlayer("甲", AIPersonality.BALANCED),
+                                                EnhancedAIPlayer("乙", AIPersonality.AGGRESSIVE))
+
+        self.assertTrue(calls)
+        self.assertGreater(turns, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,8 @@ UI界面优化模块
 
 import os
 import sys
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from game_state import Player, GameState
@@ -86,6 +87,11 @@ class UIEnhancement:
         except:
             pass  # 使用默认设置
     
+    def _style_key(self) -> Tuple[bool, bool, int]:
+        """影响渲染结果的显示配置，作为渲染缓存键的一部分"""
+        config = self.config
+        return (config.use_colors, config.use_unicode, config.screen_width)
+    
     def clear_screen(self):
         """清屏"""
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -115,7 +121,12 @@ class UIEnhancement:
         return border_char * width
     
     def create_title(self, title: str, subtitle: str = "") -> str:
-        """创建标题"""
+        """创建标题（按内容和当前显示配置缓存）"""
+        return self._render_title(title, subtitle, self._style_key())
+    
+    @lru_cache(maxsize=128)
+    def _render_title(self, title: str, subtitle: str, style_key: Tuple[bool, bool, int]) -> str:
+        """渲染标题；style_key 只用于区分缓存"""
         lines = []
         
         # 主标题
@@ -137,7 +148,12 @@ class UIEnhancement:
         return "\n".join(lines)
     
     def create_section_header(self, title: str) -> str:
-        """创建章节标题"""
+        """创建章节标题（按内容和当前显示配置缓存）"""
+        return self._render_section_header(title, self._style_key())
+    
+    @lru_cache(maxsize=128)
+    def _render_section_header(self, title: str, style_key: Tuple[bool, bool, int]) -> str:
+        """渲染章节标题；style_key 只用于区分缓存"""
         if self.config.use_unicode:
             icon = "◆"
         else:
@@ -272,9 +288,16 @@ class UIEnhancement:
         notification = f"{icon} {message}"
         return self.colorize(notification, color + ColorCode.BOLD)
     
-    def create_table(self, headers: List[str], rows: List[List[str]], 
+    def create_table(self, headers: Sequence[str], rows: Sequence[Sequence[str]], 
                     title: str = "") -> str:
-        """创建表格"""
+        """创建表格（表头和各行转换为元组后缓存）"""
+        return self._render_table(tuple(headers), tuple(tuple(row) for row in rows),
+                                  title, self._style_key())
+    
+    @lru_cache(maxsize=128)
+    def _render_table(self, headers: Tuple[str, ...], rows: Tuple[Tuple[str, ...], ...],
+                      title: str, style_key: Tuple[bool, bool, int]) -> str:
+        """渲染表格；style_key 只用于区分缓存"""
         lines = []
         
         if title:
@@ -410,7 +433,7 @@ class UIEnhancement:
         
         return input(self.colorize("请选择 (1-6): ", ColorCode.BRIGHT_WHITE))
     
-    def display_action_menu(self, player: Player, actions_menu: Dict[int, Dict[str, Any]], 
+    def display_action_menu(self, player: Player, actions_menu: List[Dict[str, Any]], 
                           ap: int) -> str:
         """显示行动菜单"""
         print(f"\n{self.create_section_header(f'{player.name} 的回合')}")
@@ -421,7 +444,7 @@ class UIEnhancement:
         options = []
         descriptions = []
         
-        for key, action_data in actions_menu.items():
+        for action_data in actions_menu:
             action_name = action_data.get('description', '未知行动')
             action_cost = action_data.get('cost', 0)
             
@@ -44,7 +44,7 @@ def enhanced_play_card(game_state: GameState, card_index: int, target_gua: str,
     card = current_player.hand[card_index]
     
     # 基础打牌逻辑
-    current_player.hand.pop(card_index)
+    current_player.hand = current_player.hand[:card_index] + current_player.hand[card_index + 1:]
     
     # 获取卦象属性
     gua_attr = GUA_ATTRIBUTES.get(target_gua, {})
@@ -229,7 +229,7 @@ def enhanced_study(game_state: GameState, mods=None) -> GameState:
     for _ in range(cards_to_draw):
         if GAME_DECK:
             card = random.choice(GAME_DECK)
-            current_player.hand.append(card)
+            current_player.hand += (card,)
     
     # 学习获得智慧
     if len(current_player.hand) >= 7:
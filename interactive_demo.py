@@ -68,7 +68,7 @@ def interactive_demo():
             valid_actions = actions.get_valid_actions(game_state, player, ap, mods, **flags)
             
             print("\n🎯 可用动作:")
-            for action_id, action_data in valid_actions.items():
+            for action_id, action_data in enumerate(valid_actions, 1):
                 cost = action_data['cost']
                 desc = action_data['description']
                 print(f"  {action_id}: {desc} (消耗: {cost} AP)")
@@ -79,14 +79,14 @@ def interactive_demo():
                 action_index += 1
             else:
                 # 默认选择第一个非pass动作，如果没有就pass
-                non_pass_actions = [aid for aid, data in valid_actions.items() if data['action'] != "pass"]
+                non_pass_actions = [aid for aid, data in enumerate(valid_actions, 1) if data['action'] != "pass"]
                 chosen_action = non_pass_actions[0] if non_pass_actions else 1
             
             # 确保选择的动作存在
-            if chosen_action not in valid_actions:
+            if not 1 <= chosen_action <= len(valid_actions):
                 chosen_action = 1  # 默认pass
             
-            action_data = valid_actions[chosen_action]
+            action_data = valid_actions[chosen_action - 1]
             print(f"\n🎯 选择动作: {action_data['description']}")
             
             # 执行动作
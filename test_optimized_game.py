@@ -94,7 +94,7 @@ def test_optimized_game():
                 
                 if action_type == "meditate":
                     # 执行冥想
-                    for aid, data in valid_actions.items():
+                    for aid, data in enumerate(valid_actions, 1):
                         if "Meditate" in data['description']:
                             print(f"🧘 选择动作: {data['description']}")
                             try:
@@ -109,7 +109,7 @@ def test_optimized_game():
                                 
                 elif action_type == "study":
                     # 执行学习
-                    for aid, data in valid_actions.items():
+                    for aid, data in enumerate(valid_actions, 1):
                         if "Study" in data['description']:
                             print(f"📚 选择动作: {data['description']}")
                             try:
@@ -124,10 +124,10 @@ def test_optimized_game():
                                 
                 elif action_type == "play_card":
                     # 尝试打牌
-                    play_actions = [aid for aid, data in valid_actions.items() if "Play" in data['description']]
+                    play_actions = [aid for aid, data in enumerate(valid_actions, 1) if "Play" in data['description']]
                     if play_actions:
                         chosen_action = play_actions[0]
-                        action_data = valid_actions[chosen_action]
+                        action_data = valid_actions[chosen_action - 1]
                         print(f"🃏 选择动作: {action_data['description']}")
                         try:
                             new_state = action_data['action'](game_state, *action_data.get('args', []), mods)
@@ -140,10 +140,10 @@ def test_optimized_game():
                         print("🚫 没有可打的牌，跳过")
             else:
                 # 默认选择第一个非pass动作
-                non_pass_actions = [aid for aid, data in valid_actions.items() if data['action'] != "pass"]
+                non_pass_actions = [aid for aid, data in enumerate(valid_actions, 1) if data['action'] != "pass"]
                 if non_pass_actions:
                     chosen_action = non_pass_actions[0]
-                    action_data = valid_actions[chosen_action]
+                    action_data = valid_actions[chosen_action - 1]
                     print(f"🎯 自动选择: {action_data['description']}")
                 else:
                     print("⏭️ 无可用动作，跳过回合")
@@ -5,74 +5,124 @@ import os
 # Add the project root to the python path to allow imports from game_prototype
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from game_prototype.game_state import GameState, Player
+from game_prototype.game_state import GameState, Player, Zone
 from game_prototype.game_data import EMPEROR_AVATAR, HERMIT_AVATAR
 from game_prototype.actions import check_zone_control
 
 class TestZoneControl(unittest.TestCase):
+    """check_zone_control installs a new zone record, so every assertion re-reads
+    the zone from the board instead of holding on to the record passed in."""
 
     def setUp(self):
         """Set up a fresh game state for each test."""
         player1 = Player(name="Alice", avatar=EMPEROR_AVATAR)
         player2 = Player(name="Bob", avatar=HERMIT_AVATAR)
         self.game_state = GameState(players=[player1, player2])
-        # For a 2-player game, the limit is 5
+        # For a 2-player game the base limit is 5, so control needs 5 // 2 + 1 = 3 markers
+
+    def zone(self, game_state=None, name="乾"):
+        return (game_state or self.game_state).board.gua_zones[name]
 
     def test_control_not_reached(self):
-        """Test that control is not assigned if the limit is not reached."""
-        zone = self.game_state.board.gua_zones["乾"]
-        zone["markers"] = {"Alice": 4}
+        """Test that control is not assigned below the control threshold."""
+        self.game_state.board.update_zone_markers("乾", "Alice", 2)
         check_zone_control(self.game_state, "乾")
-        self.assertIsNone(zone["controller"], "Controller should not be set before limit is reached.")
+        self.assertIsNone(self.zone()["controller"], "Controller should not be set before the threshold is reached.")
+        self.assertEqual(self.game_state.board.zones_owned_by("Alice"), frozenset())
 
     def test_control_gained(self):
-        """Test that a player gains control when the limit is reached."""
-        zone = self.game_state.board.gua_zones["乾"]
-        zone["markers"] = {"Alice": 4, "Bob": 1} # Total is 5
+        """Test that the unique leader gains control once the threshold is reached."""
+        self.game_state.board.update_zone_markers("乾", "Alice", 3)
+        self.game_state.board.update_zone_markers("乾", "Bob", 1)
         check_zone_control(self.game_state, "乾")
-        self.assertIsNotNone(zone["controller"], "Controller should be set.")
-        self.assertEqual(zone["controller"].name, "Alice", "Alice should be the controller.")
-        self.assertEqual(zone["markers"], {}, "Markers should be cleared after control is gained.")
+        zone = self.zone()
+        self.assertEqual(zone["controller"], "Alice", "Alice should be the controller.")
+        self.assertEqual(zone["markers"], {"Alice": 3, "Bob": 1}, "Markers stay on the zone.")
+        self.assertEqual(self.game_state.board.zones_owned_by("Alice"), frozenset({"乾"}))
 
     def test_control_tie_no_winner(self):
-        """Test that no one wins control in case of a tie."""
-        zone = self.game_state.board.gua_zones["乾"]
-        zone["markers"] = {"Alice": 2, "Bob": 2} # Total is 4
-
-        # Now, a third player (or event) adds a marker, pushing the total to 5
-        # For the test, we'll just set it directly
-        zone["markers"]["Charlie"] = 1
+        """Test that no one wins control when the top marker count is tied."""
+        zone = self.zone()
+        # Markers edited directly on the record: check_zone_control rescans them
+        zone["markers"] = {"Alice": 3, "Bob": 3, "Charlie": 1}
 
         check_zone_control(self.game_state, "乾")
+        zone = self.zone()
+        self.assertIsNone(zone["leader"])
         self.assertIsNone(zone["controller"], "Controller should be None after a tie.")
-        self.assertEqual(zone["markers"], {}, "Markers should be cleared even after a tie.")
 
-    @unittest.expectedFailure
     def test_control_tie_loses_control(self):
-        """Test that a previous controller loses control on a tie.
-
-        NOTE: This test is currently failing for an unknown reason. The logic
-        in actions.check_zone_control appears correct, but the assertion that
-        the controller becomes None is not passing. Marking as an expected failure
-        for future debugging.
-        """
-        # SETUP: Create a new game state just for this test to ensure no leakage.
+        """Test that a previous controller loses control on a tie."""
         p1 = Player(name="Alice", avatar=EMPEROR_AVATAR)
         p2 = Player(name="Bob", avatar=HERMIT_AVATAR)
         p3 = Player(name="Charlie", avatar=HERMIT_AVATAR)
-        game_state = GameState(players=[p1, p2, p3]) # 3 players, limit is 6
-
-        zone = game_state.board.gua_zones["乾"]
-        zone["controller"] = p1 # Alice is the current controller.
+        game_state = GameState(players=[p1, p2, p3])  # 3 players: limit 6, threshold 4
 
-        # ACTION: A new contention results in a tie between Bob and Charlie.
-        zone["markers"] = {"Bob": 3, "Charlie": 3} # Total is 6, limit is 6.
+        game_state.board.set_zone_controller("乾", "Alice")
+        game_state.board.update_zone_markers("乾", "Bob", 4)
+        game_state.board.update_zone_markers("乾", "Charlie", 4)
 
         check_zone_control(game_state, "乾")
 
-        # ASSERT
-        self.assertIsNone(zone["controller"], "Alice should lose control, and the zone should become neutral.")
-        self.assertEqual(zone["markers"], {}, "Markers should be cleared after a tie.")
+        self.assertIsNone(self.zone(game_state)["controller"],
+                          "Alice should lose control, and the zone should become neutral.")
+        self.assertEqual(game_state.board.zones_owned_by("Alice"), frozenset())
+
+class TestCloneIsolation(unittest.TestCase):
+
+    def setUp(self):
+        player1 = Player(name="Alice", avatar=EMPEROR_AVATAR)
+        player2 = Player(name="Bob", avatar=HERMIT_AVATAR)
+        self.game_state = GameState(players=[player1, player2])
+
+    def test_zone_changes_on_clone_leave_parent_unchanged(self):
+        """Test that resolving control on a clone does not leak into the original."""
+        self.game_state.board.update_zone_markers("乾", "Alice", 4)
+        parent_zone = self.game_state.board.gua_zones["乾"]
+        clone = self.game_state.clone()
+
+        check_zone_control(clone, "乾")
+
+        self.assertEqual(clone.board.gua_zones["乾"]["controller"], "Alice")
+        self.assertIn("乾", clone.board.zones_owned_by("Alice"))
+        self.assertIs(self.game_state.board.gua_zones["乾"], parent_zone)
+        self.assertIsNone(parent_zone["controller"])
+        self.assertEqual(self.game_state.board.zones_owned_by("Alice"), frozenset())
+
+    def test_leader_rescan_on_clone_leaves_parent_unchanged(self):
+        """Test that rescanning the leader on a clone does not rewrite the shared record."""
+        self.game_state.board.update_zone_markers("震", "Alice", 2)
+        parent_zone = self.game_state.board.gua_zones["震"]
+        parent_zone["markers"] = {"Alice": 2, "Bob": 2}  # edited directly, leader is stale
+        clone = self.game_state.clone()
+
+        check_zone_control(clone, "震")
+
+        self.assertIsNone(clone.board.gua_zones["震"]["leader"])
+        self.assertEqual(parent_zone["leader"], "Alice")
+        self.assertEqual(parent_zone["leader_count"], 2)
+
+    def test_losing_control_on_clone_leaves_parent_controller(self):
+        """Test that clearing control on a clone keeps the original's controller and index."""
+        self.game_state.board.set_zone_controller("坤", "Bob")
+        clone = self.game_state.clone()
+
+        check_zone_control(clone, "坤")  # no markers left, so the zone becomes neutral
+
+        self.assertIsNone(clone.board.gua_zones["坤"]["controller"])
+        self.assertEqual(clone.board.zones_owned_by("Bob"), frozenset())
+        self.assertEqual(self.game_state.board.gua_zones["坤"]["controller"], "Bob")
+        self.assertEqual(self.game_state.board.zones_owned_by("Bob"), frozenset({"坤"}))
+
+    def test_player_changes_on_clone_leave_parent_unchanged(self):
+        """Test that player and position updates on a clone do not leak into the original."""
+        clone = self.game_state.clone()
+        clone_player = clone.players[0]
+        clone_player.qi += 3
+        clone.board.set_player_position(clone_player.name, Zone.TIAN)
+
+        self.assertEqual(self.game_state.players[0].qi, clone_player.qi - 3)
+        self.assertNotEqual(self.game_state.board.player_positions["Alice"], Zone.TIAN)
 
 if __name__ == '__main__':
     unittest.main()